@@ -18,20 +18,38 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import copy
+import hashlib
+import importlib.util
+import json
 import os
 import sys
 import time
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict
+from types import MappingProxyType, SimpleNamespace
+from typing import Any, Dict, Final, List, Iterator, Mapping, NamedTuple, Optional, Tuple
 
+import numpy as np
+import orjson
 import yaml
-from rich.console import Console
-from rich.panel import Panel
-from rich.rule import Rule
-from rich.table import Table
 
-console = Console()
+from models.job_schema import (
+    EmploymentType,
+    ExperienceLevel,
+    JobPosting,
+    ParsedJobBatch,
+    Region,
+    RoleCategory,
+    WorkType,
+)
+from tools.console import console, redirect_to_stderr
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
 
 # ─────────────────────────────────────────────
 # BANNER
@@ -49,7 +67,7 @@ BANNER = """
 # CONFIG LOADER
 # ─────────────────────────────────────────────
 
-def load_config(config_path: str = "config.yaml") -> Dict[str, Any]:
+def load_config(config_path: str = "config.yaml", use_cache: bool = True) -> Dict[str, Any]:
     config_file = Path(config_path)
     if not config_file.exists():
         # Try relative to script location
@@ -59,40 +77,96 @@ def load_config(config_path: str = "config.yaml") -> Dict[str, Any]:
         console.print(f"[yellow]Config file '{config_path}' not found, using defaults[/yellow]")
         return _default_config()
 
-    with open(config_file, "r") as f:
-        cfg = yaml.safe_load(f)
+    with open(config_file, "rb") as f:
+        raw = f.read()
+
+    # Parsed config is cached as JSON next to the YAML, tagged with a digest of
+    # the YAML bytes; reuse it only while the digest still matches (mtimes can
+    # tie within one tick or be restored to an older value, content can't).
+    cache_file = config_file.with_name(f".{config_file.stem}.cache.json")
+    source = hashlib.blake2b(raw, digest_size=16).hexdigest()
+    if use_cache:
+        try:
+            with open(cache_file, "r") as f:
+                cached = json.load(f)
+            if cached["source"] == source:
+                console.print(f"[dim]Config loaded from: {config_file} (cached)[/dim]")
+                return cached["config"]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+    cfg = yaml.load(raw, Loader=_YamlLoader)
+
+    if use_cache:
+        _write_config_cache(cache_file, source, cfg)
 
     console.print(f"[dim]Config loaded from: {config_file}[/dim]")
     return cfg
 
 
+def _has_only_str_keys(value: Any) -> bool:
+    """True if every mapping inside value is keyed by str (so JSON round-trips it unchanged)."""
+    if isinstance(value, dict):
+        return all(isinstance(k, str) and _has_only_str_keys(v) for k, v in value.items())
+    if isinstance(value, list):
+        return all(_has_only_str_keys(v) for v in value)
+    return True
+
+
+def _write_config_cache(cache_file: Path, source: str, cfg: Dict[str, Any]) -> None:
+    """Atomically write the parsed config to its JSON sidecar (best effort)."""
+    if not _has_only_str_keys(cfg):
+        # JSON would turn e.g. {1: ...} into {"1": ...} — the cache must not change the config
+        return
+    tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_file, "w") as f:
+            json.dump({"source": source, "config": cfg}, f)
+        os.replace(tmp_file, cache_file)
+    except (OSError, TypeError, ValueError):
+        # Unwritable directory or non-JSON values (e.g. YAML dates) — skip caching
+        try:
+            os.remove(tmp_file)
+        except OSError:
+            pass
+
+
+# Built once at import; read-only at the top level so accidental mutation fails
+# loudly. Use _default_config() to get a mutable copy.
+_DEFAULT_CONFIG: Final[Mapping[str, Any]] = MappingProxyType({
+    "data_source": {"mode": "playwright"},
+    "scraper": {
+        "min_delay": 2.0, "max_delay": 5.0,
+        "max_pages": 3, "max_jobs_per_query": 50,
+        "max_retries": 3, "backoff_factor": 2.0,
+        "headless": True, "browser": "chromium",
+        "time_range_seconds": 63072000,
+    },
+    "search": {
+        "roles": ["Software Engineer", "Backend Engineer", "ML Engineer"],
+        "locations": [
+            {"name": "United States", "code": "us"},
+            {"name": "India", "code": "in"},
+        ],
+    },
+    "openai": {"model": "gpt-4o-mini", "analyst_model": "gpt-4o", "temperature": 0.2},
+    "output": {
+        "directory": "output",
+        "report_filename": "linkedin_jobs_report.md",
+        "json_filename": "jobs_data.json",
+        "csv_filename": "jobs_data.csv",
+        "parquet_filename": "jobs_data.parquet",
+        "formats": ["json", "csv"],
+        "pretty_json": False,
+        "charts_directory": "output/charts",
+        "chart_format": "png",
+    },
+    "logging": {"level": "INFO", "show_progress": True},
+})
+
+
 def _default_config() -> Dict[str, Any]:
-    return {
-        "data_source": {"mode": "playwright"},
-        "scraper": {
-            "min_delay": 2.0, "max_delay": 5.0,
-            "max_pages": 3, "max_jobs_per_query": 50,
-            "max_retries": 3, "backoff_factor": 2.0,
-            "headless": True, "browser": "chromium",
-            "time_range_seconds": 63072000,
-        },
-        "search": {
-            "roles": ["Software Engineer", "Backend Engineer", "ML Engineer"],
-            "locations": [
-                {"name": "United States", "code": "us"},
-                {"name": "India", "code": "in"},
-            ],
-        },
-        "openai": {"model": "gpt-4o-mini", "analyst_model": "gpt-4o", "temperature": 0.2},
-        "output": {
-            "directory": "output",
-            "report_filename": "linkedin_jobs_report.md",
-            "json_filename": "jobs_data.json",
-            "csv_filename": "jobs_data.csv",
-            "charts_directory": "output/charts",
-        },
-        "logging": {"level": "INFO", "show_progress": True},
-    }
+    return {key: copy.deepcopy(value) for key, value in _DEFAULT_CONFIG.items()}
 
 
 # ─────────────────────────────────────────────
@@ -107,18 +181,18 @@ def check_environment() -> bool:
     if not os.getenv("OPENAI_API_KEY"):
         issues.append("[yellow]⚠ OPENAI_API_KEY not set — LLM features will be limited[/yellow]")
 
-    try:
-        import playwright
-    except ImportError:
+    # find_spec only locates the packages; the real imports happen lazily in the pipeline
+    if importlib.util.find_spec("playwright") is None:
         issues.append("[red]✗ playwright not installed — run: uv run playwright install chromium[/red]")
         ok = False
 
-    try:
-        from agents import Agent
-    except ImportError:
+    if importlib.util.find_spec("agents") is None:
         issues.append("[red]✗ openai-agents not installed — run: uv sync[/red]")
         ok = False
 
+    if _YamlLoader is not getattr(yaml, "CSafeLoader", None):
+        issues.append("[dim]ℹ PyYAML built without libyaml — config parsing uses the pure-Python loader[/dim]")
+
     for msg in issues:
         console.print(msg)
 
@@ -129,21 +203,26 @@ def check_environment() -> bool:
 # DEMO DATA GENERATOR
 # ─────────────────────────────────────────────
 
-def generate_demo_data() -> "ParsedJobBatch":
-    """Generate synthetic job data for testing the pipeline without scraping."""
-    import random
-    from datetime import timedelta
-
-    from models.job_schema import (
-        EmploymentType,
-        ExperienceLevel,
-        JobPosting,
-        ParsedJobBatch,
-        Region,
-        RoleCategory,
-        WorkType,
-    )
+# Title prefix per experience level for synthetic postings (table lookup, no branching)
+TITLE_PREFIXES: Dict[ExperienceLevel, str] = {ExperienceLevel.SENIOR: "Senior "}
 
+
+class _DemoRegion(NamedTuple):
+    """Per-region inputs for generate_demo_data."""
+
+    prefix: str  # job_id prefix
+    size: int  # number of jobs
+    companies: List[str]
+    extra_skills: List[str]  # each job gets two of these on top of its skills_pool entry
+    locations_raw: List[str]
+    cities: List[str]
+    country: str
+    region: Region
+    work_weights: List[float]  # Remote / Hybrid / Onsite / Not specified
+
+
+def generate_demo_data() -> ParsedJobBatch:
+    """Generate synthetic job data for testing the pipeline without scraping."""
     console.print("[cyan]Generating demo data...[/cyan]")
 
     roles = [
@@ -188,72 +267,86 @@ def generate_demo_data() -> "ParsedJobBatch":
         ExperienceLevel.SENIOR, ExperienceLevel.STAFF,
     ]
     exp_weights = [0.15, 0.35, 0.40, 0.10]
+    # Cumulative weights, built once; sampling is a vectorised bisect_right
+    # (np.searchsorted) rather than rng.choice re-deriving the CDF per call
+    exp_cdf = np.cumsum(exp_weights)
+
+    us = _DemoRegion(
+        prefix="us",
+        size=600,  # 60% of total
+        companies=companies_us,
+        extra_skills=["Git", "Agile", "REST API", "CI/CD", "Redis", "MongoDB"],
+        locations_raw=["San Francisco, CA", "New York, NY", "Seattle, WA",
+                       "Austin, TX", "Remote, United States"],
+        cities=["San Francisco", "New York", "Seattle", "Austin"],
+        country="United States",
+        region=Region.US,
+        work_weights=work_weights,
+    )
+    india = _DemoRegion(
+        prefix="in",
+        size=400,  # 40% of total
+        companies=companies_india,
+        extra_skills=["Java", "Spring", "MySQL", "AWS", "Docker"],
+        locations_raw=["Bengaluru, Karnataka, India",
+                       "Hyderabad, Telangana, India",
+                       "Mumbai, Maharashtra, India",
+                       "Pune, Maharashtra, India",
+                       "Delhi NCR, India"],
+        cities=["Bengaluru", "Hyderabad", "Mumbai", "Pune", "Delhi"],
+        country="India",
+        region=Region.INDIA,
+        work_weights=[0.25, 0.45, 0.25, 0.05],
+    )
 
-    jobs = []
-    now = datetime.utcnow()
+    rng = np.random.default_rng()
+    now = np.datetime64(datetime.now(timezone.utc).replace(tzinfo=None), "us")
+
+    def _region_jobs(spec: _DemoRegion) -> Iterator[JobPosting]:
+        n = spec.size
+        # Draw every random field for the region up front, one vector per field
+        role_idx = rng.integers(0, len(roles), size=n)
+        company_idx = rng.integers(0, len(spec.companies), size=n)
+        pool_idx = rng.integers(0, len(skills_pool), size=n)
+        # Two distinct extra skills per job: first two columns of a random permutation
+        extra_idx = rng.random((n, len(spec.extra_skills))).argsort(axis=1)[:, :2]
+        extras = np.array(spec.extra_skills, dtype=object)[extra_idx].tolist()
+        days_ago = rng.integers(0, 731, size=n, dtype=np.int32)
+        # Vectorised date arithmetic; datetime64[us].tolist() yields naive datetimes
+        dates_posted = (now - days_ago.astype("timedelta64[D]")).tolist()
+        work_cdf = np.cumsum(spec.work_weights)
+        work_idx = np.searchsorted(work_cdf, rng.random(n) * work_cdf[-1], side="right")
+        exp_idx = np.searchsorted(exp_cdf, rng.random(n) * exp_cdf[-1], side="right")
+        loc_idx = rng.integers(0, len(spec.locations_raw), size=n)
+        city_idx = rng.integers(0, len(spec.cities), size=n)
+
+        for i in range(n):
+            title, category = roles[role_idx[i]]
+            exp = exp_levels[exp_idx[i]]
+            skills = skills_pool[pool_idx[i]] + extras[i]
+
+            # Demo rows are valid by construction, so skip pydantic validation
+            yield JobPosting.model_construct(
+                job_id=f"{spec.prefix}_{i:04d}",
+                title=TITLE_PREFIXES.get(exp, "") + title,
+                normalized_category=category,
+                company_name=spec.companies[company_idx[i]],
+                location_raw=spec.locations_raw[loc_idx[i]],
+                location_city=spec.cities[city_idx[i]],
+                location_country=spec.country,
+                region=spec.region,
+                work_type=work_types[work_idx[i]],
+                date_posted=dates_posted[i],
+                required_skills=list(dict.fromkeys(skills)),
+                experience_level=exp,
+                employment_type=EmploymentType.FULL_TIME,
+                search_query=title,
+                search_location=spec.country,
+            )
 
-    # US jobs (60% of total)
-    for i in range(600):
-        title, category = random.choice(roles)
-        company = random.choice(companies_us)
-        skills = random.choice(skills_pool) + random.sample(
-            ["Git", "Agile", "REST API", "CI/CD", "Redis", "MongoDB"], 2
-        )
-        days_ago = random.randint(0, 730)
-        work_type = random.choices(work_types, work_weights)[0]
-        exp = random.choices(exp_levels, exp_weights)[0]
-
-        jobs.append(JobPosting(
-            job_id=f"us_{i:04d}",
-            title=f"{'Senior ' if exp == ExperienceLevel.SENIOR else ''}{title}",
-            normalized_category=category,
-            company_name=company,
-            location_raw=random.choice(["San Francisco, CA", "New York, NY", "Seattle, WA",
-                                        "Austin, TX", "Remote, United States"]),
-            location_city=random.choice(["San Francisco", "New York", "Seattle", "Austin"]),
-            location_country="United States",
-            region=Region.US,
-            work_type=work_type,
-            date_posted=now - timedelta(days=days_ago),
-            required_skills=list(set(skills)),
-            experience_level=exp,
-            employment_type=EmploymentType.FULL_TIME,
-            search_query=title,
-            search_location="United States",
-        ))
-
-    # India jobs (40% of total)
-    for i in range(400):
-        title, category = random.choice(roles)
-        company = random.choice(companies_india)
-        skills = random.choice(skills_pool) + random.sample(
-            ["Java", "Spring", "MySQL", "AWS", "Docker"], 2
-        )
-        days_ago = random.randint(0, 730)
-        work_type = random.choices(work_types, [0.25, 0.45, 0.25, 0.05])[0]
-        exp = random.choices(exp_levels, exp_weights)[0]
-
-        jobs.append(JobPosting(
-            job_id=f"in_{i:04d}",
-            title=f"{'Senior ' if exp == ExperienceLevel.SENIOR else ''}{title}",
-            normalized_category=category,
-            company_name=company,
-            location_raw=random.choice(["Bengaluru, Karnataka, India",
-                                         "Hyderabad, Telangana, India",
-                                         "Mumbai, Maharashtra, India",
-                                         "Pune, Maharashtra, India",
-                                         "Delhi NCR, India"]),
-            location_city=random.choice(["Bengaluru", "Hyderabad", "Mumbai", "Pune", "Delhi"]),
-            location_country="India",
-            region=Region.INDIA,
-            work_type=work_type,
-            date_posted=now - timedelta(days=days_ago),
-            required_skills=list(set(skills)),
-            experience_level=exp,
-            employment_type=EmploymentType.FULL_TIME,
-            search_query=title,
-            search_location="India",
-        ))
+    # One comprehension over both regions builds the final list in a single
+    # pass (no per-region lists to concatenate); regions are drawn in order
+    jobs = [job for spec in (us, india) for job in _region_jobs(spec)]
 
     console.print(f"[green]✓[/green] Generated {len(jobs)} demo jobs")
     return ParsedJobBatch(
@@ -269,21 +362,86 @@ def generate_demo_data() -> "ParsedJobBatch":
 # PIPELINE
 # ─────────────────────────────────────────────
 
-async def run_pipeline(config: Dict[str, Any], demo_mode: bool = False) -> None:
-    """Execute the full multi-agent pipeline."""
-    from pipeline.analyst_agent import run_analyst
-    from pipeline.parser_agent import run_parser
-    from pipeline.report_agent import run_report
-    from pipeline.scraper_agent import run_scraper
+_PIPELINE: Optional[SimpleNamespace] = None
+
+
+def _load_pipeline() -> SimpleNamespace:
+    """Import the agent stages once per process (they pull in the Agents SDK)."""
+    global _PIPELINE
+    if _PIPELINE is None:
+        from pipeline.analyst_agent import run_analyst
+        from pipeline.parser_agent import run_parser, run_parser_stream
+        from pipeline.report_agent import run_report
+        from pipeline.scraper_agent import run_scraper
+
+        _PIPELINE = SimpleNamespace(
+            run_scraper=run_scraper,
+            run_parser=run_parser,
+            run_parser_stream=run_parser_stream,
+            run_analyst=run_analyst,
+            run_report=run_report,
+        )
+    return _PIPELINE
+
+
+def _leaf_exceptions(exc: BaseException) -> List[BaseException]:
+    """The individual exceptions inside (possibly nested) exception groups."""
+    if isinstance(exc, BaseExceptionGroup):
+        return [leaf for sub in exc.exceptions for leaf in _leaf_exceptions(sub)]
+    return [exc]
+
+
+def _print_table(
+    title: str,
+    columns: Tuple[str, str],
+    rows: List[Tuple[str, str]],
+    value_style: str,
+) -> None:
+    """Two-column summary: a rich Table on a terminal, aligned plain text otherwise."""
+    if not console.is_terminal:
+        width = max(len(label) for label, _ in rows)
+        console.print(f"\n{title}")
+        for label, value in rows:
+            console.print(f"  {label:<{width}}  {value}")
+        return
+
+    from rich.table import Table
+
+    table = Table(title=title, show_header=True, header_style="bold cyan")
+    table.add_column(columns[0], style="dim")
+    table.add_column(columns[1], style=value_style)
+    for label, value in rows:
+        table.add_row(label, value)
+    console.print(table)
+
+
+async def run_pipeline(
+    config: Dict[str, Any],
+    demo_mode: bool = False,
+    quiet: bool = False,
+) -> None:
+    """
+    Execute the full multi-agent pipeline.
+    With quiet=True the banner, step rules and summary tables are skipped and
+    the run statistics are printed to stdout as a single JSON line instead
+    (main() sends all other console output to stderr).
+    """
+    pipeline = _load_pipeline()
 
     start_time = time.time()
-    pipeline_start = datetime.utcnow()
+    pipeline_start = datetime.now(timezone.utc)
 
-    console.print(Panel(BANNER.strip(), style="bold blue"))
-    console.print(f"[dim]Started at {pipeline_start.strftime('%Y-%m-%d %H:%M:%S UTC')}[/dim]\n")
+    if not quiet:
+        if console.is_terminal:
+            from rich.panel import Panel
+            console.print(Panel(BANNER.strip(), style="bold blue"))
+        else:
+            console.print(BANNER.strip())
+        console.print(f"[dim]Started at {pipeline_start.strftime('%Y-%m-%d %H:%M:%S UTC')}[/dim]\n")
 
     # ── Step 1: Scrape or Demo
-    console.print(Rule("[bold cyan]Step 1: Data Collection[/bold cyan]"))
+    if not quiet:
+        console.rule("[bold cyan]Step 1: Data Collection[/bold cyan]")
 
     if demo_mode:
         console.print("[yellow]Demo mode — skipping scraper, using synthetic data[/yellow]\n")
@@ -291,7 +449,14 @@ async def run_pipeline(config: Dict[str, Any], demo_mode: bool = False) -> None:
         scraper_result = None
     else:
         try:
-            scraper_result = await run_scraper(config)
+            # ── Step 2: Parse — runs concurrently, consuming pages as they are scraped
+            page_queue: asyncio.Queue = asyncio.Queue()
+            async with asyncio.TaskGroup() as tg:
+                scrape_task = tg.create_task(pipeline.run_scraper(config, page_queue=page_queue))
+                parse_task = tg.create_task(pipeline.run_parser_stream(page_queue))
+            scraper_result = scrape_task.result()
+            parsed_batch = parse_task.result()
+
             console.print(
                 f"\n[green]✓ Scraper complete[/green] — "
                 f"{scraper_result.total_pages_scraped} pages scraped"
@@ -301,12 +466,10 @@ async def run_pipeline(config: Dict[str, Any], demo_mode: bool = False) -> None:
             if scraper_result.failed_queries:
                 console.print(f"[yellow]⚠ {len(scraper_result.failed_queries)} queries failed[/yellow]")
 
-            # ── Step 2: Parse
-            console.print(Rule("[bold cyan]Step 2: Parsing[/bold cyan]"))
-            parsed_batch = run_parser(scraper_result)
-
         except Exception as e:
-            console.print(f"[red]Scraper/Parser failed: {e}[/red]")
+            # TaskGroup wraps task errors in an ExceptionGroup — report the real causes
+            for cause in _leaf_exceptions(e):
+                console.print(f"[red]Scraper/Parser failed: {cause}[/red]")
             console.print("[yellow]Falling back to demo data...[/yellow]")
             parsed_batch = generate_demo_data()
 
@@ -320,42 +483,62 @@ async def run_pipeline(config: Dict[str, Any], demo_mode: bool = False) -> None:
     )
 
     # ── Step 3: Analyze
-    console.print(Rule("[bold cyan]Step 3: Analysis[/bold cyan]"))
-    analysis = run_analyst(parsed_batch, config)
+    if not quiet:
+        console.rule("[bold cyan]Step 3: Analysis[/bold cyan]")
+    analysis = pipeline.run_analyst(parsed_batch, config)
 
     # ── Step 4: Report
-    console.print(Rule("[bold cyan]Step 4: Report Generation[/bold cyan]"))
-    report = run_report(parsed_batch, analysis, config)
+    if not quiet:
+        console.rule("[bold cyan]Step 4: Report Generation[/bold cyan]")
+    report = pipeline.run_report(parsed_batch, analysis, config)
 
     # ── Summary
     elapsed = time.time() - start_time
-    console.print(f"\n{Rule('[bold green]Pipeline Complete[/bold green]')}")
 
-    summary_table = Table(title="Output Files", show_header=True, header_style="bold cyan")
-    summary_table.add_column("File", style="dim")
-    summary_table.add_column("Path", style="green")
-
-    summary_table.add_row("Markdown Report", report.report_path)
-    summary_table.add_row("JSON Data", report.json_path)
-    summary_table.add_row("CSV Data", report.csv_path)
-    for chart in report.charts_generated:
-        summary_table.add_row("Chart", chart)
-
-    console.print(summary_table)
-
-    stats_table = Table(title="Run Statistics", show_header=True, header_style="bold cyan")
-    stats_table.add_column("Metric", style="dim")
-    stats_table.add_column("Value", style="bold")
-
-    stats_table.add_row("Total Jobs Analyzed", f"{parsed_batch.total_parsed:,}")
-    stats_table.add_row("US Jobs", f"{analysis.us_jobs:,}")
-    stats_table.add_row("India Jobs", f"{analysis.india_jobs:,}")
-    stats_table.add_row("Role Categories", str(len(analysis.role_stats)))
-    stats_table.add_row("Top Skills Identified", str(len(analysis.top_skills)))
-    stats_table.add_row("Charts Generated", str(len(report.charts_generated)))
-    stats_table.add_row("Elapsed", f"{elapsed:.1f}s")
-
-    console.print(stats_table)
+    if quiet:
+        print(orjson.dumps({
+            "report_path": report.report_path,
+            "json_path": report.json_path,
+            "csv_path": report.csv_path,
+            "parquet_path": report.parquet_path,
+            "charts": report.charts_generated,
+            "dashboard_path": report.dashboard_path,
+            "total_jobs": parsed_batch.total_parsed,
+            "us_jobs": analysis.us_jobs,
+            "india_jobs": analysis.india_jobs,
+            "role_categories": len(analysis.role_stats),
+            "top_skills": len(analysis.top_skills),
+            "charts_generated": len(report.charts_generated),
+            "elapsed_s": round(elapsed, 1),
+            "success": report.success,
+            "error_message": report.error_message,
+        }).decode())
+        return
+
+    console.print()
+    console.rule("[bold green]Pipeline Complete[/bold green]")
+
+    output_rows = [
+        ("Markdown Report", report.report_path),
+        ("JSON Data", report.json_path),
+        ("CSV Data", report.csv_path),
+    ]
+    if report.parquet_path:
+        output_rows.append(("Parquet Data", report.parquet_path))
+    output_rows.extend(("Chart", chart) for chart in report.charts_generated)
+    if report.dashboard_path:
+        output_rows.append(("Dashboard", report.dashboard_path))
+    _print_table("Output Files", ("File", "Path"), output_rows, value_style="green")
+
+    _print_table("Run Statistics", ("Metric", "Value"), [
+        ("Total Jobs Analyzed", f"{parsed_batch.total_parsed:,}"),
+        ("US Jobs", f"{analysis.us_jobs:,}"),
+        ("India Jobs", f"{analysis.india_jobs:,}"),
+        ("Role Categories", str(len(analysis.role_stats))),
+        ("Top Skills Identified", str(len(analysis.top_skills))),
+        ("Charts Generated", str(len(report.charts_generated))),
+        ("Elapsed", f"{elapsed:.1f}s"),
+    ], value_style="bold")
 
     if report.success:
         console.print(f"\n[bold green]✓ Report saved to:[/bold green] {report.report_path}")
@@ -403,14 +586,26 @@ Examples:
         "--max-pages", type=int, default=None,
         help="Override max pages per query"
     )
+    parser.add_argument(
+        "--no-config-cache", action="store_true",
+        help="Always re-parse the config YAML instead of using its cached JSON copy"
+    )
+    parser.add_argument(
+        "--quiet", "--json-stats", dest="quiet", action="store_true",
+        help="Skip banner and summary tables; print run stats as one JSON line on stdout (progress goes to stderr)"
+    )
     return parser.parse_args()
 
 
 def main() -> None:
     args = parse_args()
 
+    # --quiet keeps stdout for the JSON stats line; stage output goes to stderr
+    if args.quiet:
+        redirect_to_stderr()
+
     # Load config
-    config = load_config(args.config)
+    config = load_config(args.config, use_cache=not args.no_config_cache)
 
     # Apply CLI overrides
     if args.mode:
@@ -441,7 +636,7 @@ def main() -> None:
 
     # Run pipeline
     try:
-        asyncio.run(run_pipeline(config, demo_mode=args.demo))
+        asyncio.run(run_pipeline(config, demo_mode=args.demo, quiet=args.quiet))
     except KeyboardInterrupt:
         console.print("\n[yellow]Pipeline interrupted by user[/yellow]")
         sys.exit(0)
@@ -7,9 +7,9 @@ from __future__ import annotations
 
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator
 
 
 # ─────────────────────────────────────────────
@@ -69,6 +69,9 @@ class Region(str, Enum):
 class JobPosting(BaseModel):
     """Represents a single LinkedIn job posting."""
 
+    # Immutable once built — use model_copy(update=...) to derive a changed job
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     job_id: Optional[str] = None
     title: str
     normalized_category: RoleCategory = RoleCategory.OTHER
@@ -97,29 +100,69 @@ class JobPosting(BaseModel):
     @classmethod
     def deduplicate_skills(cls, v: Any) -> List[str]:
         if isinstance(v, list):
-            seen = set()
-            result = []
+            # Keyed on lowercase; dict insertion order keeps the first spelling seen
+            seen: Dict[str, str] = {}
             for item in v:
-                lower = item.strip().lower()
-                if lower and lower not in seen:
-                    seen.add(lower)
-                    result.append(item.strip())
-            return result
+                skill = item.strip()
+                if not skill:
+                    continue
+                key = skill.lower()
+                if key not in seen:
+                    seen[key] = skill
+            return list(seen.values())
         return v
 
+    @classmethod
+    def from_fast(cls, fast: Any) -> "JobPosting":
+        """
+        Build from a JobPostingFast (models/job_schema_fast.py) without re-validating.
+        Fields are already typed by the parser; only skill de-duplication is applied.
+        """
+        values = {name: getattr(fast, name) for name in cls.model_fields}
+        values["required_skills"] = cls.deduplicate_skills(values["required_skills"])
+        return cls.model_construct(**values)
+
     def to_dict(self) -> Dict[str, Any]:
-        d = self.model_dump()
-        d["date_posted"] = self.date_posted.isoformat() if self.date_posted else None
-        d["scraped_at"] = self.scraped_at.isoformat()
+        # JSON mode already renders datetimes as ISO strings and enums as values
+        d = self.model_dump(mode="json")
         d["required_skills"] = ", ".join(self.required_skills)
-        d["normalized_category"] = self.normalized_category.value
-        d["experience_level"] = self.experience_level.value
-        d["work_type"] = self.work_type.value
-        d["employment_type"] = self.employment_type.value
-        d["region"] = self.region.value
         d["ai_keywords_found"] = ", ".join(self.ai_keywords_found)
         return d
 
+    def csv_row(self) -> Tuple[Any, ...]:
+        """Flat row in JOB_CSV_COLUMNS order, without building an intermediate dict."""
+        return (
+            self.job_id,
+            self.title,
+            self.normalized_category.value,
+            self.company_name,
+            self.company_size,
+            self.location_city,
+            self.location_country,
+            self.location_raw,
+            self.region.value,
+            self.work_type.value,
+            self.date_posted.isoformat() if self.date_posted else None,
+            self.date_posted_raw,
+            ", ".join(self.required_skills),
+            self.experience_level.value,
+            self.employment_type.value,
+            self.job_description,
+            self.source_url,
+            self.scraped_at.isoformat(),
+            self.search_query,
+            self.search_location,
+            self.has_ai_mention,
+            ", ".join(self.ai_keywords_found),
+        )
+
+
+# Column order of JobPosting.csv_row() — matches the model's field order
+JOB_CSV_COLUMNS: Tuple[str, ...] = tuple(JobPosting.model_fields)
+
+# Compiled once; validates a whole list of jobs (dicts or attribute objects) in one call
+JOBS_ADAPTER: TypeAdapter[List[JobPosting]] = TypeAdapter(List[JobPosting])
+
 
 # ─────────────────────────────────────────────
 # SCRAPER OUTPUT
@@ -128,8 +171,11 @@ class JobPosting(BaseModel):
 class RawJobPage(BaseModel):
     """Raw HTML page returned by the scraper."""
 
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     url: str
-    html: str
+    html: bytes  # raw UTF-8 document — HTML parsers consume bytes directly
+    html_path: Optional[str] = None  # gzip file holding the document when html was spilled to disk
     query: str
     location: str
     page_number: int = 1
@@ -156,6 +202,8 @@ class ScraperResult(BaseModel):
 class ParsedJobBatch(BaseModel):
     """Batch of parsed job postings from Parser Agent."""
 
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     jobs: List[JobPosting] = Field(default_factory=list)
     total_parsed: int = 0
     total_failed: int = 0
@@ -239,7 +287,9 @@ class ReportResult(BaseModel):
     report_path: str
     json_path: str
     csv_path: str
+    parquet_path: Optional[str] = None
     charts_generated: List[str] = Field(default_factory=list)
+    dashboard_path: Optional[str] = None
     total_jobs_in_report: int = 0
     generated_at: datetime = Field(default_factory=datetime.utcnow)
     success: bool = True
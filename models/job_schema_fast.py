@@ -0,0 +1,51 @@
+"""
+Slotted dataclass twin of JobPosting for bulk ingest.
+The parser builds these (no per-field validation, no __dict__) and converts
+to the Pydantic model only at the ParsedJobBatch boundary.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List, Optional
+
+from models.job_schema import (
+    EmploymentType,
+    ExperienceLevel,
+    JobPosting,
+    Region,
+    RoleCategory,
+    WorkType,
+)
+
+
+@dataclass(slots=True, kw_only=True)
+class JobPostingFast:
+    """Same fields and defaults as JobPosting; callers must pass already-typed values."""
+
+    job_id: Optional[str] = None
+    title: str
+    normalized_category: RoleCategory = RoleCategory.OTHER
+    company_name: str
+    company_size: Optional[str] = None
+    location_city: Optional[str] = None
+    location_country: Optional[str] = None
+    location_raw: str = ""
+    region: Region = Region.OTHER
+    work_type: WorkType = WorkType.NOT_SPECIFIED
+    date_posted: Optional[datetime] = None
+    date_posted_raw: Optional[str] = None
+    required_skills: List[str] = field(default_factory=list)
+    experience_level: ExperienceLevel = ExperienceLevel.NOT_SPECIFIED
+    employment_type: EmploymentType = EmploymentType.NOT_SPECIFIED
+    job_description: Optional[str] = None
+    source_url: str = ""
+    scraped_at: datetime = field(default_factory=datetime.utcnow)
+    search_query: Optional[str] = None
+    search_location: Optional[str] = None
+    has_ai_mention: bool = False
+    ai_keywords_found: List[str] = field(default_factory=list)
+
+    def to_pydantic(self) -> JobPosting:
+        return JobPosting.from_fast(self)
@@ -0,0 +1,84 @@
+"""
+Counting kernels for the Analyst Agent's columnar aggregation (also used to
+build chart matrices).
+Uses Numba when it is installed (JIT-compiled once, cached to disk);
+otherwise falls back to the equivalent NumPy bincount formulation.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # optional accelerator
+    njit = None
+
+
+def _count_pairs_numpy(a: np.ndarray, b: np.ndarray, n_a: int, n_b: int) -> np.ndarray:
+    flat = a.astype(np.int64) * n_b + b
+    return np.bincount(flat, minlength=n_a * n_b).reshape(n_a, n_b)
+
+
+def _place_pairs_numpy(a: np.ndarray, b: np.ndarray, values: np.ndarray, n_a: int, n_b: int) -> np.ndarray:
+    flat = a.astype(np.int64) * n_b + b
+    out = np.zeros(n_a * n_b, dtype=np.float64)
+    # First hit in the reversed codes = last occurrence of each cell
+    cells, last = np.unique(flat[::-1], return_index=True)
+    out[cells] = values[::-1][last]
+    return out.reshape(n_a, n_b)
+
+
+if njit is not None:
+    # Serial on purpose: scattered `out[i, j] += 1` under prange would race.
+    @njit(cache=True)
+    def _count_pairs_jit(a, b, n_a, n_b):
+        out = np.zeros((n_a, n_b), dtype=np.int64)
+        for i in range(a.shape[0]):
+            out[a[i], b[i]] += 1
+        return out
+
+    @njit(cache=True)
+    def _place_pairs_jit(a, b, values, n_a, n_b):
+        out = np.zeros((n_a, n_b), dtype=np.float64)
+        for i in range(a.shape[0]):
+            out[a[i], b[i]] = values[i]
+        return out
+
+
+def count_pairs(a: np.ndarray, b: np.ndarray, n_a: int, n_b: int) -> np.ndarray:
+    """
+    Co-occurrence counts of two aligned code arrays.
+
+    Args:
+        a: Codes in [0, n_a), one per row
+        b: Codes in [0, n_b), same length as a
+        n_a: Number of distinct a codes
+        n_b: Number of distinct b codes
+
+    Returns:
+        (n_a, n_b) int64 matrix where out[i, j] = #rows with a == i and b == j
+    """
+    if njit is not None:
+        return _count_pairs_jit(a, b, n_a, n_b)
+    return _count_pairs_numpy(a, b, n_a, n_b)
+
+
+def place_pairs(a: np.ndarray, b: np.ndarray, values: np.ndarray, n_a: int, n_b: int) -> np.ndarray:
+    """
+    Dense matrix of values keyed by two aligned code arrays.
+
+    Args:
+        a: Codes in [0, n_a), one per row
+        b: Codes in [0, n_b), same length as a
+        values: Value per row, same length as a
+        n_a: Number of distinct a codes
+        n_b: Number of distinct b codes
+
+    Returns:
+        (n_a, n_b) float64 matrix where out[i, j] = value of the last row with
+        a == i and b == j, or 0 if there is none
+    """
+    if njit is not None:
+        return _place_pairs_jit(a, b, values, n_a, n_b)
+    return _place_pairs_numpy(a, b, values, n_a, n_b)
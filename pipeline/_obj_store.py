@@ -0,0 +1,70 @@
+"""
+Process-local object store for agent tool hand-offs.
+Tools can pass a short token such as "batch:3f9a1c0b2e4d" between each other
+instead of serializing a full ParsedJobBatch to JSON at every tool boundary:
+parse_job_pages registers its batch here and returns the token, and every
+batch tool downstream resolves it with load_batch (or still accepts JSON).
+"""
+
+from __future__ import annotations
+
+import secrets
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from models.job_schema import ParsedJobBatch
+
+# Oldest entries are evicted past this size so long sessions don't grow without bound
+_MAX_OBJECTS = 32
+
+_STORE: "OrderedDict[str, Any]" = OrderedDict()
+_LOCK = threading.Lock()
+
+
+def put(obj: Any, kind: str = "obj") -> str:
+    """Store obj and return its token ("<kind>:<hex>")."""
+    token = f"{kind}:{secrets.token_hex(6)}"
+    with _LOCK:
+        _STORE[token] = obj
+        while len(_STORE) > _MAX_OBJECTS:
+            _STORE.popitem(last=False)
+    return token
+
+
+def get(token: str) -> Any:
+    """Return the object stored under token. Raises ValueError if it is unknown or evicted."""
+    with _LOCK:
+        try:
+            obj = _STORE[token]
+        except KeyError:
+            raise ValueError(f"Unknown or expired object token: {token!r}") from None
+        _STORE.move_to_end(token)
+        return obj
+
+
+def is_token(value: str, kind: str) -> bool:
+    """True if value looks like a token of the given kind (as opposed to a JSON payload)."""
+    return value.startswith(kind + ":") and len(value) <= len(kind) + 13
+
+
+# ─────────────────────────────────────────────
+# PARSED JOB BATCHES
+# ─────────────────────────────────────────────
+
+BATCH = "batch"
+
+
+def put_batch(batch: ParsedJobBatch) -> str:
+    """Register a ParsedJobBatch and return the token tools accept in place of its JSON."""
+    return put(batch, BATCH)
+
+
+def load_batch(value: str) -> ParsedJobBatch:
+    """Resolve a tool's batch argument: either a "batch:..." token or ParsedJobBatch JSON."""
+    from models.job_schema import ParsedJobBatch
+
+    if is_token(value, BATCH):
+        return get(value)
+    return ParsedJobBatch.model_validate_json(value)
@@ -0,0 +1,34 @@
+"""
+Start method for the chart and parser process pools.
+
+Pools are never forked: they start while other threads may hold locks (the
+report writers, asyncio.to_thread helpers, the Playwright driver), and a forked
+child inherits those locks held. Workers come from a forkserver instead, or are
+spawned where forkserver is unavailable.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+from multiprocessing.context import BaseContext
+from typing import List
+
+_START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+# Modules the forkserver imports once, so each worker starts with them loaded.
+# Only third-party packages belong here: on Python < 3.12 the server does not
+# inherit sys.path, so first-party modules would only import from the repo root.
+_PRELOAD: List[str] = []
+
+
+def pool_context(*preload: str) -> BaseContext:
+    """
+    The mp_context for ProcessPoolExecutor. Modules in preload are added to the
+    forkserver's preload list (it only takes effect before the server starts,
+    so call this at import time).
+    """
+    context = multiprocessing.get_context(_START_METHOD)
+    if _START_METHOD == "forkserver":
+        _PRELOAD.extend(name for name in preload if name not in _PRELOAD)
+        context.set_forkserver_preload(_PRELOAD)
+    return context
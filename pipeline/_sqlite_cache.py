@@ -0,0 +1,73 @@
+"""
+On-disk sqlite stores shared by the pipeline stages: the SerpAPI response and
+LLM insight caches (SqliteCache) and the scraper's resume checkpoints
+(connect). Every file lives under ~/.cache/linkedin_jobs_agent/.
+
+The calls are blocking; async callers run them via asyncio.to_thread.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Optional
+
+from tools.console import console
+
+CACHE_DIR = Path.home() / ".cache" / "linkedin_jobs_agent"
+
+
+def connect(path: Path, schema: str) -> sqlite3.Connection:
+    """Open (creating it if needed) the sqlite file at path, with schema's table in place."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    db = sqlite3.connect(path)
+    try:
+        db.execute(schema)
+    except sqlite3.Error:
+        db.close()
+        raise
+    return db
+
+
+class SqliteCache:
+    """
+    Key -> bytes cache with a time-to-live, one sqlite file per cache.
+    Reads of a missing or unreadable cache are misses; failed writes print a
+    dim note (naming the cache by label) and are otherwise ignored.
+    """
+
+    _SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS entries "
+        "(key TEXT PRIMARY KEY, value BLOB NOT NULL, created_at REAL NOT NULL)"
+    )
+
+    def __init__(self, filename: str, label: str) -> None:
+        self.path = CACHE_DIR / filename
+        self.label = label
+
+    def get(self, key: str, ttl_seconds: float) -> Optional[bytes]:
+        """Return the value stored under key if it is younger than ttl_seconds."""
+        if not self.path.exists():
+            return None
+        try:
+            with closing(sqlite3.connect(self.path)) as db:
+                row = db.execute(
+                    "SELECT value, created_at FROM entries WHERE key = ?", (key,)
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+        if row is None or time.time() - row[1] > ttl_seconds:
+            return None
+        return row[0]
+
+    def put(self, key: str, value: bytes) -> None:
+        """Store value under key, replacing any older entry."""
+        try:
+            with closing(connect(self.path, self._SCHEMA)) as db, db:
+                db.execute(
+                    "INSERT OR REPLACE INTO entries VALUES (?, ?, ?)", (key, value, time.time())
+                )
+        except (sqlite3.Error, OSError) as e:
+            console.print(f"[dim]{self.label} not written: {e}[/dim]")
@@ -6,25 +6,197 @@ and generates LLM-powered insights using the OpenAI Agents SDK.
 from __future__ import annotations
 
 import asyncio
-from collections import Counter, defaultdict
+import hashlib
+import json
+import os
+from array import array
+from collections import OrderedDict, defaultdict
 from datetime import datetime
+from itertools import chain
 from typing import Any, Dict, List, Optional
 
+import numpy as np
+import orjson
+import pandas as pd
 from agents import Agent, Runner, function_tool
-from rich.console import Console
+from openai import OpenAI
 
 from models.job_schema import (
     AnalysisResult,
     CompanyStats,
+    EmploymentType,
+    ExperienceLevel,
     ParsedJobBatch,
     QuarterlyTrend,
     Region,
+    RoleCategory,
     RoleStats,
     SkillFrequency,
     WorkType,
 )
+from pipeline import _obj_store
+from pipeline._agg_kernels import count_pairs
+from pipeline._sqlite_cache import SqliteCache
+from tools.console import console
 
-console = Console()
+
+# ─────────────────────────────────────────────
+# BATCH FRAME
+# ─────────────────────────────────────────────
+
+_FRAME_COLUMNS = (
+    "category",
+    "region",
+    "work_type",
+    "experience_level",
+    "employment_type",
+    "company_name",
+    "location_raw",
+    "quarter_id",
+    "required_skills",
+)
+
+
+_FRAME_CACHE_SIZE = 4
+_frame_cache: "OrderedDict[bytes, pd.DataFrame]" = OrderedDict()
+
+
+def _batch_frame(parsed_batch_json: str) -> pd.DataFrame:
+    """
+    Load a ParsedJobBatch once and flatten it into a DataFrame
+    (one row per job, enum values as strings). Accepts the batch JSON or an
+    object-store token. Frames are memoized by the token or a blake2b digest
+    of the JSON payload, so every aggregation tool called
+    with the same batch shares one validation without the cache pinning
+    the (potentially large) JSON strings. Callers must treat the result
+    as read-only.
+    """
+    if _obj_store.is_token(parsed_batch_json, _obj_store.BATCH):
+        key = parsed_batch_json.encode("utf-8")
+    else:
+        key = hashlib.blake2b(parsed_batch_json.encode("utf-8"), digest_size=16).digest()
+    frame = _frame_cache.get(key)
+    if frame is not None:
+        _frame_cache.move_to_end(key)
+        return frame
+
+    if _obj_store.is_token(parsed_batch_json, _obj_store.BATCH):
+        frame = _jobs_to_frame(_obj_store.get(parsed_batch_json))
+    else:
+        frame = _jobs_json_to_frame(parsed_batch_json)
+        if frame is None:
+            frame = _jobs_to_frame(ParsedJobBatch.model_validate_json(parsed_batch_json))
+    _frame_cache[key] = frame
+    if len(_frame_cache) > _FRAME_CACHE_SIZE:
+        _frame_cache.popitem(last=False)
+    return frame
+
+
+# member -> value tables: str-mixin enum members hash as their (cached) str value,
+# so a dict lookup is several times cheaper than the Enum.value property
+_CATEGORY_VALUE = {m: m.value for m in RoleCategory}
+_REGION_VALUE = {m: m.value for m in Region}
+_WORK_VALUE = {m: m.value for m in WorkType}
+_EXPERIENCE_VALUE = {m: m.value for m in ExperienceLevel}
+_EMPLOYMENT_VALUE = {m: m.value for m in EmploymentType}
+
+_ENUM_COLUMNS = {
+    "category": set(_CATEGORY_VALUE.values()),
+    "region": set(_REGION_VALUE.values()),
+    "work_type": set(_WORK_VALUE.values()),
+    "experience_level": set(_EXPERIENCE_VALUE.values()),
+    "employment_type": set(_EMPLOYMENT_VALUE.values()),
+}
+
+
+def _jobs_json_to_frame(parsed_batch_json: str) -> Optional[pd.DataFrame]:
+    """
+    Fast path for _batch_frame: read the fields the aggregators need straight
+    from orjson-decoded dicts instead of building the full JobPosting graph.
+    Returns None when the payload is not a complete, well-typed batch dump
+    (missing keys, unknown enum values, non-ISO dates) so the caller can
+    fall back to Pydantic validation and its error reporting.
+    """
+    try:
+        rows = []
+        for job in orjson.loads(parsed_batch_json)["jobs"]:
+            dt = job["date_posted"]
+            rows.append((
+                job["normalized_category"],
+                job["region"],
+                job["work_type"],
+                job["experience_level"],
+                job["employment_type"],
+                job["company_name"],
+                job["location_raw"],
+                int(dt[:4]) * 4 + (int(dt[5:7]) - 1) // 3 if dt else None,
+                job["required_skills"],
+            ))
+    except (orjson.JSONDecodeError, KeyError, TypeError, ValueError):
+        return None
+
+    frame = pd.DataFrame.from_records(rows, columns=_FRAME_COLUMNS)
+    for column, allowed in _ENUM_COLUMNS.items():
+        if not frame[column].isin(allowed).all():
+            return None
+    return frame
+
+
+def _jobs_to_frame(batch: ParsedJobBatch) -> pd.DataFrame:
+    rows = []
+    for job in batch.jobs:
+        dt = job.date_posted
+        rows.append((
+            _CATEGORY_VALUE[job.normalized_category],
+            _REGION_VALUE[job.region],
+            _WORK_VALUE[job.work_type],
+            _EXPERIENCE_VALUE[job.experience_level],
+            _EMPLOYMENT_VALUE[job.employment_type],
+            job.company_name,
+            job.location_raw,
+            _quarter_id(dt) if dt else None,
+            job.required_skills,
+        ))
+    return pd.DataFrame.from_records(rows, columns=_FRAME_COLUMNS)
+
+
+def _skill_rows(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    One (category, required_skills) row per skill mention, in job order.
+    Flattened with a single C-level chain iterator and np.repeat, rather than
+    DataFrame.explode, which copies the frame's index and emits NaN rows for
+    jobs with no skills that then have to be dropped again.
+    """
+    skill_lists = df["required_skills"].tolist()
+    return pd.DataFrame({
+        "category": np.repeat(df["category"].to_numpy(), [len(s) for s in skill_lists]),
+        "required_skills": list(chain.from_iterable(skill_lists)),
+    })
+
+
+def _quarter_id(dt: datetime) -> int:
+    """Integer quarter key (year * 4 + quarter index) — cheaper to hash than its label."""
+    return dt.year * 4 + (dt.month - 1) // 3
+
+
+def _quarter_label(quarter_id: int) -> str:
+    """Render a _quarter_id key as 'YYYY-Qn'."""
+    quarter_id = int(quarter_id)
+    return f"{quarter_id // 4}-Q{quarter_id % 4 + 1}"
+
+
+def _most_common(counts: pd.Series, n: int) -> pd.Series:
+    """Counter.most_common for a first-appearance-ordered Series: ties keep their order."""
+    return counts.nlargest(max(n, 0), keep="first")
+
+
+def _top_per_group(counts: pd.Series, n: int) -> Dict[str, List[str]]:
+    """Top-n second-level labels per first-level label of a (group, item) count Series."""
+    top: Dict[str, List[str]] = defaultdict(list)
+    ranked = counts.sort_values(ascending=False, kind="stable").groupby(level=0, sort=False).head(n)
+    for group, item in ranked.index:
+        top[group].append(item)
+    return top
 
 
 # ─────────────────────────────────────────────
@@ -38,53 +210,53 @@ def compute_role_statistics(parsed_batch_json: str) -> str:
     work type percentages, and top skills per role.
 
     Args:
-        parsed_batch_json: JSON string of ParsedJobBatch
+        parsed_batch_json: JSON string of ParsedJobBatch, or a batch:... store token
 
     Returns:
         JSON list of RoleStats objects
     """
-    import json
-
-    batch = ParsedJobBatch.model_validate_json(parsed_batch_json)
-    jobs = batch.jobs
+    df = _batch_frame(parsed_batch_json)
+    if df.empty:
+        return orjson.dumps([]).decode()
+
+    totals = df["category"].value_counts(sort=False)
+    regions = pd.crosstab(df["category"], df["region"]).reindex(
+        index=totals.index,
+        columns=[r.value for r in Region],
+        fill_value=0,
+    )
+    works = pd.crosstab(df["category"], df["work_type"]).reindex(
+        index=totals.index,
+        columns=[w.value for w in WorkType],
+        fill_value=0,
+    )
 
-    # Group jobs by category
-    by_category: Dict[str, List] = defaultdict(list)
-    for job in jobs:
-        by_category[job.normalized_category.value].append(job)
+    skills = _skill_rows(df)
+    top_skills = _top_per_group(
+        skills.groupby(["category", "required_skills"], sort=False).size(), 10
+    )
 
     role_stats = []
-    for category, cat_jobs in by_category.items():
-        us = sum(1 for j in cat_jobs if j.region == Region.US)
-        india = sum(1 for j in cat_jobs if j.region == Region.INDIA)
-        other = sum(1 for j in cat_jobs if j.region == Region.OTHER)
-        total = len(cat_jobs)
-
-        # Work type
-        remote = sum(1 for j in cat_jobs if j.work_type == WorkType.REMOTE)
-        hybrid = sum(1 for j in cat_jobs if j.work_type == WorkType.HYBRID)
-        onsite = sum(1 for j in cat_jobs if j.work_type.value in ("Onsite", "Not Specified"))
-
-        # Top skills
-        skill_counter: Counter = Counter()
-        for job in cat_jobs:
-            for skill in job.required_skills:
-                skill_counter[skill] += 1
-        top_skills = [s for s, _ in skill_counter.most_common(10)]
+    for category, total in totals.items():
+        total = int(total)
+        remote = int(works.at[category, WorkType.REMOTE.value])
+        hybrid = int(works.at[category, WorkType.HYBRID.value])
+        # Work type — onsite covers both Onsite and Not Specified
+        onsite = total - remote - hybrid
 
         role_stats.append(RoleStats(
             category=category,
             total_count=total,
-            us_count=us,
-            india_count=india,
-            other_count=other,
-            top_skills=top_skills,
+            us_count=int(regions.at[category, Region.US.value]),
+            india_count=int(regions.at[category, Region.INDIA.value]),
+            other_count=int(regions.at[category, Region.OTHER.value]),
+            top_skills=top_skills[category],
             remote_percentage=round(remote / total * 100, 1) if total else 0,
             hybrid_percentage=round(hybrid / total * 100, 1) if total else 0,
             onsite_percentage=round(onsite / total * 100, 1) if total else 0,
         ).model_dump())
 
-    return json.dumps(role_stats)
+    return orjson.dumps(role_stats).decode()
 
 
 @function_tool
@@ -93,39 +265,27 @@ def compute_quarterly_trends(parsed_batch_json: str) -> str:
     Compute quarterly posting trends (last 24 months) by category and region.
 
     Args:
-        parsed_batch_json: JSON string of ParsedJobBatch
+        parsed_batch_json: JSON string of ParsedJobBatch, or a batch:... store token
 
     Returns:
         JSON list of QuarterlyTrend objects
     """
-    import json
-
-    batch = ParsedJobBatch.model_validate_json(parsed_batch_json)
-    jobs = [j for j in batch.jobs if j.date_posted]
+    df = _batch_frame(parsed_batch_json)
+    dated = df[["quarter_id", "category"]].dropna(subset=["quarter_id"])
 
-    # Count by quarter and category
-    quarter_cat: Dict[tuple, int] = defaultdict(int)
-    quarter_all: Dict[str, int] = defaultdict(int)
-
-    for job in jobs:
-        try:
-            dt = job.date_posted
-            if not dt:
-                continue
-            q = f"{dt.year}-Q{(dt.month - 1) // 3 + 1}"
-            quarter_all[q] += 1
-            quarter_cat[(q, job.normalized_category.value)] += 1
-        except Exception:
-            continue
+    # Count by quarter and category; labels are rendered once per distinct quarter
+    quarter_all = dated["quarter_id"].value_counts(sort=False)
+    quarter_cat = dated.groupby(["quarter_id", "category"], sort=False).size()
+    labels = {q: _quarter_label(q) for q in quarter_all.index}
 
     trends = []
     for quarter, count in quarter_all.items():
-        trends.append(QuarterlyTrend(quarter=quarter, count=count, category="All").model_dump())
+        trends.append(QuarterlyTrend(quarter=labels[quarter], count=int(count), category="All").model_dump())
 
     for (quarter, category), count in quarter_cat.items():
-        trends.append(QuarterlyTrend(quarter=quarter, count=count, category=category).model_dump())
+        trends.append(QuarterlyTrend(quarter=labels[quarter], count=int(count), category=category).model_dump())
 
-    return json.dumps(trends)
+    return orjson.dumps(trends).decode()
 
 
 @function_tool
@@ -134,37 +294,36 @@ def compute_skill_frequencies(parsed_batch_json: str, top_n: int = 20) -> str:
     Compute skill frequency across all job postings.
 
     Args:
-        parsed_batch_json: JSON string of ParsedJobBatch
+        parsed_batch_json: JSON string of ParsedJobBatch, or a batch:... store token
         top_n: Number of top skills to return
 
     Returns:
         JSON list of SkillFrequency objects
     """
-    import json
+    df = _batch_frame(parsed_batch_json)
+    total_jobs = len(df)
 
-    batch = ParsedJobBatch.model_validate_json(parsed_batch_json)
-    total_jobs = len(batch.jobs)
+    skills = _skill_rows(df)
+    top_skills = _most_common(skills["required_skills"].value_counts(sort=False), top_n)
 
-    skill_counter: Counter = Counter()
-    skill_categories: Dict[str, Counter] = defaultdict(Counter)
-
-    for job in batch.jobs:
-        for skill in job.required_skills:
-            skill_counter[skill] += 1
-            skill_categories[skill][job.normalized_category.value] += 1
+    # Category breakdown only for the skills that are actually reported
+    in_top = skills[skills["required_skills"].isin(top_skills.index)]
+    skill_categories = _top_per_group(
+        in_top.groupby(["required_skills", "category"], sort=False).size(), 3
+    )
 
     result = []
-    for skill, count in skill_counter.most_common(top_n):
+    for skill, count in top_skills.items():
+        count = int(count)
         pct = round(count / total_jobs * 100, 1) if total_jobs else 0
-        top_cats = [cat for cat, _ in skill_categories[skill].most_common(3)]
         result.append(SkillFrequency(
             skill=skill,
             count=count,
             percentage=pct,
-            top_categories=top_cats,
+            top_categories=skill_categories[skill],
         ).model_dump())
 
-    return json.dumps(result)
+    return orjson.dumps(result).decode()
 
 
 @function_tool
@@ -173,30 +332,21 @@ def compute_distributions(parsed_batch_json: str) -> str:
     Compute experience level, work type, and employment type distributions.
 
     Args:
-        parsed_batch_json: JSON string of ParsedJobBatch
+        parsed_batch_json: JSON string of ParsedJobBatch, or a batch:... store token
 
     Returns:
         JSON with experience_distribution, work_type_distribution, employment_type_distribution
     """
-    import json
+    df = _batch_frame(parsed_batch_json)
 
-    batch = ParsedJobBatch.model_validate_json(parsed_batch_json)
-    jobs = batch.jobs
-
-    exp_dist: Counter = Counter()
-    work_dist: Counter = Counter()
-    emp_dist: Counter = Counter()
+    def dist(column: str) -> Dict[str, int]:
+        return {k: int(v) for k, v in df[column].value_counts(sort=False).items()}
 
-    for job in jobs:
-        exp_dist[job.experience_level.value] += 1
-        work_dist[job.work_type.value] += 1
-        emp_dist[job.employment_type.value] += 1
-
-    return json.dumps({
-        "experience_distribution": dict(exp_dist),
-        "work_type_distribution": dict(work_dist),
-        "employment_type_distribution": dict(emp_dist),
-    })
+    return orjson.dumps({
+        "experience_distribution": dist("experience_level"),
+        "work_type_distribution": dist("work_type"),
+        "employment_type_distribution": dist("employment_type"),
+    }).decode()
 
 
 @function_tool
@@ -205,35 +355,35 @@ def compute_top_companies(parsed_batch_json: str, top_n: int = 20) -> str:
     Identify top hiring companies by number of open roles.
 
     Args:
-        parsed_batch_json: JSON string of ParsedJobBatch
+        parsed_batch_json: JSON string of ParsedJobBatch, or a batch:... store token
         top_n: Number of top companies to return
 
     Returns:
         JSON list of CompanyStats objects
     """
-    import json
-
-    batch = ParsedJobBatch.model_validate_json(parsed_batch_json)
+    df = _batch_frame(parsed_batch_json)
 
-    company_jobs: Dict[str, list] = defaultdict(list)
-    for job in batch.jobs:
-        company_jobs[job.company_name].append(job)
+    sizes = df["company_name"].value_counts(sort=False)
+    rows_by_company = df.groupby("company_name", sort=False).indices
+    categories_col = df["category"].to_numpy()
+    locations_col = df["location_raw"].to_numpy()
+    remote_col = (df["work_type"] == WorkType.REMOTE.value).to_numpy()
 
     stats = []
-    for company, jobs in sorted(company_jobs.items(), key=lambda x: -len(x[1]))[:top_n]:
-        categories = list({j.normalized_category.value for j in jobs})
-        locations = list({j.location_raw for j in jobs if j.location_raw})[:5]
-        remote_count = sum(1 for j in jobs if j.work_type == WorkType.REMOTE)
+    for company, openings in _most_common(sizes, top_n).items():
+        rows = rows_by_company[company]
+        categories = list(set(categories_col[rows]))
+        locations = list({loc for loc in locations_col[rows] if loc})[:5]
 
         stats.append(CompanyStats(
             company_name=company,
-            total_openings=len(jobs),
+            total_openings=int(openings),
             categories=categories,
             locations=locations,
-            remote_count=remote_count,
+            remote_count=int(remote_col[rows].sum()),
         ).model_dump())
 
-    return json.dumps(stats)
+    return orjson.dumps(stats).decode()
 
 
 @function_tool
@@ -248,7 +398,6 @@ def generate_insights(analysis_summary_json: str) -> str:
     Returns:
         JSON list of insight strings
     """
-    import json
 
     summary = json.loads(analysis_summary_json)
 
@@ -324,6 +473,9 @@ def create_analyst_agent(config: Dict[str, Any]) -> Agent:
 You are the LinkedIn Jobs Analyst Agent. Your job is to produce a comprehensive
 analysis of job market trends from parsed job data.
 
+The job batch may be given as ParsedJobBatch JSON or as a short token such as
+"batch:1a2b3c4d5e6f". Pass it unchanged as parsed_batch_json to every tool.
+
 Steps to follow:
 1. Call compute_role_statistics to get per-role stats
 2. Call compute_quarterly_trends to get quarterly trend data
@@ -359,6 +511,76 @@ Ensure all statistics are accurate. The analysis should cover:
 # STANDALONE RUNNER
 # ─────────────────────────────────────────────
 
+# Small-int codes for the fixed enums, so per-job counting is an indexed increment
+_REGIONS = tuple(Region)
+_WORK_TYPES = tuple(WorkType)
+_EXPERIENCE_LEVELS = tuple(ExperienceLevel)
+_EMPLOYMENT_TYPES = tuple(EmploymentType)
+_REGION_ID = {m: i for i, m in enumerate(_REGIONS)}
+_WORK_ID = {m: i for i, m in enumerate(_WORK_TYPES)}
+_EXPERIENCE_ID = {m: i for i, m in enumerate(_EXPERIENCE_LEVELS)}
+_EMPLOYMENT_ID = {m: i for i, m in enumerate(_EMPLOYMENT_TYPES)}
+
+
+def _distribution(ids: array, members: tuple) -> Dict[str, int]:
+    """
+    Count enum codes with np.bincount and return {member.value: count}
+    in first-appearance order (the order a Counter built job by job would have).
+    """
+    codes = np.frombuffer(ids, dtype=np.int8)
+    counts = np.bincount(codes, minlength=len(members))
+    present, first_seen = np.unique(codes, return_index=True)
+    return {members[c].value: int(counts[c]) for c in present[np.argsort(first_seen)]}
+
+
+def _top_k(counts: np.ndarray, k: int) -> List[int]:
+    """
+    Indices of the k largest counts, descending, ties in index order — the same
+    as a stable full argsort cut to k, but only the candidates are sorted.
+    """
+    n = len(counts)
+    if k <= 0 or n == 0:
+        return []
+    if k >= n:
+        return np.argsort(-counts, kind="stable").tolist()
+    kth = np.partition(counts, n - k)[n - k]
+    candidates = np.flatnonzero(counts >= kth)
+    return candidates[np.argsort(-counts[candidates], kind="stable")][:k].tolist()
+
+
+def _rank_pairs(
+    a: np.ndarray,
+    b: np.ndarray,
+    n_a: int,
+    n_b: int,
+    top_n: int,
+    only: Optional[List[int]] = None,
+) -> List[List[int]]:
+    """
+    For every a code (or just those in `only`), the top_n b codes it co-occurs
+    with, by count descending. Ties keep first co-occurrence order — what a
+    per-a Counter.most_common gives. Ranking is fully vectorized; Python only
+    touches the <= top_n survivors per a.
+    """
+    ranked: List[List[int]] = [[] for _ in range(n_a)]
+    if only is not None:
+        keep = np.isin(a, only)
+        a, b = a[keep], b[keep]
+    if not len(a):
+        return ranked
+
+    codes = a.astype(np.int64) * n_b + b
+    pairs, first_seen, counts = np.unique(codes, return_index=True, return_counts=True)
+    group = pairs // n_b
+    order = np.lexsort((first_seen, -counts, group))
+    group = group[order]
+    rank = np.arange(len(order)) - np.searchsorted(group, group)
+    for code in pairs[order][rank < top_n].tolist():
+        a_id, b_id = divmod(code, n_b)
+        ranked[a_id].append(b_id)
+    return ranked
+
+
 def run_analyst(batch: ParsedJobBatch, config: Dict[str, Any]) -> AnalysisResult:
     """
     Run the analyst pipeline synchronously.
@@ -370,40 +592,94 @@ def run_analyst(batch: ParsedJobBatch, config: Dict[str, Any]) -> AnalysisResult
     Returns:
         AnalysisResult with complete analysis
     """
-    import json
 
     console.print(f"\n[bold cyan]Analyst Agent[/bold cyan] — analyzing {batch.total_parsed} jobs")
 
     jobs = batch.jobs
     total = len(jobs)
 
+    # ── Single fused pass over jobs: collect per-job codes (columnar) plus the
+    #    interned skills as a ragged array; everything is counted from the codes
+    us, india = _REGION_ID[Region.US], _REGION_ID[Region.INDIA]
+    remote, hybrid = _WORK_ID[WorkType.REMOTE], _WORK_ID[WorkType.HYBRID]
+    n_regions, n_work_types = len(_REGIONS), len(_WORK_TYPES)
+
+    cat_vocab: Dict[RoleCategory, int] = {}  # category -> code, in first-appearance order
+    cat_ids, quarter_ids = array("h"), array("q")
+    region_ids, work_ids = array("b"), array("b")
+    exp_ids, emp_ids, ai_flags = array("b"), array("b"), array("b")
+    flat_skills: List[str] = []
+    skill_lengths = array("i")
+    company_vocab: Dict[str, int] = {}  # company -> code, in first-appearance order
+    company_ids = array("i")
+
+    for job in jobs:
+        category = job.normalized_category
+        cat_id = cat_vocab.get(category)
+        if cat_id is None:
+            cat_id = cat_vocab[category] = len(cat_vocab)
+        skills = job.required_skills
+
+        cat_ids.append(cat_id)
+        region_ids.append(_REGION_ID[job.region])
+        work_ids.append(_WORK_ID[job.work_type])
+        exp_ids.append(_EXPERIENCE_ID[job.experience_level])
+        emp_ids.append(_EMPLOYMENT_ID[job.employment_type])
+        ai_flags.append(job.has_ai_mention)
+
+        dt = job.date_posted
+        quarter_ids.append(dt.year * 4 + (dt.month - 1) // 3 if dt else -1)
+
+        flat_skills.extend(skills)
+        skill_lengths.append(len(skills))
+
+        company_id = company_vocab.get(job.company_name)
+        if company_id is None:
+            company_id = company_vocab[job.company_name] = len(company_vocab)
+        company_ids.append(company_id)
+
+    categories = [c.value for c in cat_vocab]
+    n_cats = len(categories)
+    cat_arr = np.frombuffer(cat_ids, dtype=np.int16)
+    cat_totals = np.bincount(cat_arr, minlength=n_cats)
+    cat_region = count_pairs(cat_arr, np.frombuffer(region_ids, dtype=np.int8), n_cats, n_regions)
+    cat_work = count_pairs(cat_arr, np.frombuffer(work_ids, dtype=np.int8), n_cats, n_work_types)
+    cat_ai = np.bincount(cat_arr[np.frombuffer(ai_flags, dtype=np.int8) != 0], minlength=n_cats)
+
+    # Intern all skills in one hashed pass; factorize ids follow first appearance
+    skill_arr, skills_vocab = pd.factorize(np.asarray(flat_skills, dtype=object))
+    skills_vocab = skills_vocab.tolist()
+    n_skills = len(skills_vocab)
+    skill_cat_arr = np.repeat(cat_arr, np.frombuffer(skill_lengths, dtype=np.int32))
+    skill_totals = np.bincount(skill_arr, minlength=n_skills)
+
+    # ── Distributions
+    exp_dist = _distribution(exp_ids, _EXPERIENCE_LEVELS)
+    work_dist = _distribution(work_ids, _WORK_TYPES)
+    emp_dist = _distribution(emp_ids, _EMPLOYMENT_TYPES)
+
     # ── Regional split
-    us_jobs = sum(1 for j in jobs if j.region == Region.US)
-    india_jobs = sum(1 for j in jobs if j.region == Region.INDIA)
+    region_ctr = cat_region.sum(axis=0)
+    us_jobs = int(region_ctr[us])
+    india_jobs = int(region_ctr[india])
     other_jobs = total - us_jobs - india_jobs
 
     console.print(f"  Regions → US: {us_jobs} | India: {india_jobs} | Other: {other_jobs}")
 
     # ── Role statistics
-    by_category: Dict[str, List] = defaultdict(list)
-    for job in jobs:
-        by_category[job.normalized_category.value].append(job)
-
+    top_skills_by_cat = _rank_pairs(skill_cat_arr, skill_arr, n_cats, n_skills, 10)
     role_stats_list = []
-    for category, cat_jobs in by_category.items():
-        us_c = sum(1 for j in cat_jobs if j.region == Region.US)
-        india_c = sum(1 for j in cat_jobs if j.region == Region.INDIA)
-        other_c = len(cat_jobs) - us_c - india_c
-        total_c = len(cat_jobs)
-
-        remote_c = sum(1 for j in cat_jobs if j.work_type == WorkType.REMOTE)
-        hybrid_c = sum(1 for j in cat_jobs if j.work_type.value == "Hybrid")
+    for cat_id, category in enumerate(categories):
+        total_c = int(cat_totals[cat_id])
+        us_c = int(cat_region[cat_id, us])
+        india_c = int(cat_region[cat_id, india])
+        other_c = total_c - us_c - india_c
+
+        remote_c = int(cat_work[cat_id, remote])
+        hybrid_c = int(cat_work[cat_id, hybrid])
         onsite_c = total_c - remote_c - hybrid_c
 
-        skill_ctr: Counter = Counter()
-        for j in cat_jobs:
-            skill_ctr.update(j.required_skills)
-        top_skills = [s for s, _ in skill_ctr.most_common(10)]
+        top_skills = [skills_vocab[i] for i in top_skills_by_cat[cat_id]]
 
         role_stats_list.append(RoleStats(
             category=category,
@@ -417,66 +693,61 @@ def run_analyst(batch: ParsedJobBatch, config: Dict[str, Any]) -> AnalysisResult
             onsite_percentage=round(onsite_c / total_c * 100, 1) if total_c else 0,
         ))
 
-    # ── Quarterly trends
-    quarter_cat: Dict[tuple, int] = defaultdict(int)
-    for job in jobs:
-        if job.date_posted:
-            dt = job.date_posted
-            q = f"{dt.year}-Q{(dt.month - 1) // 3 + 1}"
-            quarter_cat[(q, job.normalized_category.value)] += 1
-
+    # ── Quarterly trends: (quarter, category) pairs in first-appearance order
+    quarter_arr = np.frombuffer(quarter_ids, dtype=np.int64)
+    dated = quarter_arr >= 0
+    pair_codes = quarter_arr[dated] * n_cats + cat_arr[dated]
+    pairs, first_seen, pair_counts = np.unique(pair_codes, return_index=True, return_counts=True)
+    order = np.argsort(first_seen)
+    labels = {q: _quarter_label(q) for q in np.unique(pairs // n_cats)} if n_cats else {}
     quarterly_trends = [
-        QuarterlyTrend(quarter=q, count=cnt, category=cat)
-        for (q, cat), cnt in quarter_cat.items()
+        QuarterlyTrend(
+            quarter=labels[code // n_cats],
+            count=int(cnt),
+            category=categories[code % n_cats],
+        )
+        for code, cnt in zip(pairs[order].tolist(), pair_counts[order].tolist())
     ]
 
-    # ── Skill frequencies
-    skill_ctr_global: Counter = Counter()
-    skill_cats: Dict[str, Counter] = defaultdict(Counter)
-    for job in jobs:
-        for skill in job.required_skills:
-            skill_ctr_global[skill] += 1
-            skill_cats[skill][job.normalized_category.value] += 1
-
+    # ── Skill frequencies (ids are first-seen order, so a stable sort matches Counter.most_common)
+    top_skill_ids = _top_k(skill_totals, 20)
+    top_cats_by_skill = _rank_pairs(skill_arr, skill_cat_arr, n_skills, n_cats, 3, only=top_skill_ids)
     top_skills_list = [
         SkillFrequency(
-            skill=skill,
-            count=count,
-            percentage=round(count / total * 100, 1) if total else 0,
-            top_categories=[c for c, _ in skill_cats[skill].most_common(3)],
+            skill=skills_vocab[skill_id],
+            count=int(skill_totals[skill_id]),
+            percentage=round(int(skill_totals[skill_id]) / total * 100, 1) if total else 0,
+            top_categories=[categories[c] for c in top_cats_by_skill[skill_id]],
         )
-        for skill, count in skill_ctr_global.most_common(20)
+        for skill_id in top_skill_ids
     ]
 
-    # ── Distributions
-    exp_dist: Counter = Counter(j.experience_level.value for j in jobs)
-    work_dist: Counter = Counter(j.work_type.value for j in jobs)
-    emp_dist: Counter = Counter(j.employment_type.value for j in jobs)
-
     # ── AI/ML mention rate by role
-    ai_mention_by_role: Dict[str, float] = {}
-    for category, cat_jobs in by_category.items():
-        total_c = len(cat_jobs)
-        ai_count = sum(1 for j in cat_jobs if j.has_ai_mention)
-        ai_mention_by_role[category] = round(ai_count / total_c * 100, 1) if total_c else 0.0
+    ai_mention_by_role: Dict[str, float] = {
+        category: round(int(cat_ai[cat_id]) / int(cat_totals[cat_id]) * 100, 1)
+        for cat_id, category in enumerate(categories)
+    }
 
     console.print(f"  AI/ML mention rates computed across {len(ai_mention_by_role)} role categories")
 
-    # ── Top companies
-    company_jobs: Dict[str, list] = defaultdict(list)
-    for job in jobs:
-        company_jobs[job.company_name].append(job)
-
-    top_companies = [
-        CompanyStats(
-            company_name=company,
-            total_openings=len(cjobs),
-            categories=list({j.normalized_category.value for j in cjobs}),
-            locations=list({j.location_raw for j in cjobs if j.location_raw})[:5],
-            remote_count=sum(1 for j in cjobs if j.work_type == WorkType.REMOTE),
-        )
-        for company, cjobs in sorted(company_jobs.items(), key=lambda x: -len(x[1]))[:20]
-    ]
+    # ── Top companies: sort job indices by company once, then walk contiguous runs
+    companies = list(company_vocab)
+    company_arr = np.frombuffer(company_ids, dtype=np.int32)
+    by_company = np.argsort(company_arr, kind="stable")
+    starts = np.searchsorted(company_arr[by_company], np.arange(len(companies) + 1))
+    openings = np.diff(starts)
+    is_remote = np.frombuffer(work_ids, dtype=np.int8) == remote
+
+    top_companies = []
+    for company_id in _top_k(openings, 20):
+        rows = by_company[starts[company_id]:starts[company_id + 1]]
+        top_companies.append(CompanyStats(
+            company_name=companies[company_id],
+            total_openings=len(rows),
+            categories=list({categories[c] for c in cat_arr[rows].tolist()}),
+            locations=list({jobs[i].location_raw for i in rows.tolist() if jobs[i].location_raw})[:5],
+            remote_count=int(is_remote[rows].sum()),
+        ))
 
     # ── Generate insights
     summary = {
@@ -524,7 +795,6 @@ def run_analyst(batch: ParsedJobBatch, config: Dict[str, Any]) -> AnalysisResult
 
 def _compute_rule_based_insights(summary: dict) -> str:
     """Generate deterministic insights from analysis data (no LLM required)."""
-    import json as _json
 
     insights = []
     total = summary.get("total_jobs", 0)
@@ -580,20 +850,38 @@ def _compute_rule_based_insights(summary: dict) -> str:
             f"suggesting companies prioritize experienced talent over entry-level hiring."
         )
 
-    return _json.dumps(insights)
+    return json.dumps(insights)
+
+
+_INSIGHTS_CACHE = SqliteCache("insights.sqlite", "Insight cache")
+
+
+def _insights_cache_get(key: str, ttl_seconds: float) -> Optional[List[str]]:
+    """Return cached insights for key if they are younger than ttl_seconds."""
+    value = _INSIGHTS_CACHE.get(key, ttl_seconds)
+    return None if value is None else json.loads(value)
+
+
+def _insights_cache_put(key: str, insights: List[str]) -> None:
+    """Persist insights under key."""
+    _INSIGHTS_CACHE.put(key, json.dumps(insights).encode("utf-8"))
 
 
 def _generate_llm_insights(summary: dict, config: Dict[str, Any]) -> Optional[List[str]]:
-    """Use OpenAI to generate qualitative market insights."""
-    import json
-    from openai import OpenAI
+    """
+    Use OpenAI to generate qualitative market insights.
+    Responses are cached on disk by a digest of (model, prompt) for
+    openai.insights_cache_ttl_hours (default 24; 0 disables), so re-running
+    on unchanged data does not repeat the API call.
+    """
 
-    api_key = __import__("os").getenv("OPENAI_API_KEY")
+    api_key = os.getenv("OPENAI_API_KEY")
     if not api_key:
         return None
 
-    client = OpenAI()
-    model = config.get("openai", {}).get("analyst_model", "gpt-4o-mini")
+    openai_cfg = config.get("openai", {})
+    model = openai_cfg.get("analyst_model", "gpt-4o-mini")
+    ttl_seconds = float(openai_cfg.get("insights_cache_ttl_hours", 24)) * 3600
 
     prompt = f"""
 You are a tech labor market analyst. Based on the following LinkedIn job data summary,
@@ -606,6 +894,15 @@ Data Summary:
 Return ONLY a JSON array of insight strings. Each insight should be 1-2 sentences,
 factual, and reference specific numbers from the data.
 """
+    cache_key = hashlib.blake2b(f"{model}\0{prompt}".encode("utf-8"), digest_size=16).hexdigest()
+    if ttl_seconds > 0:
+        cached = _insights_cache_get(cache_key, ttl_seconds)
+        if cached is not None:
+            console.print("[dim]LLM insights loaded from cache[/dim]")
+            return cached
+
+    client = OpenAI()
+    insights = None
     try:
         response = client.chat.completions.create(
             model=model,
@@ -616,11 +913,15 @@ factual, and reference specific numbers from the data.
         content = response.choices[0].message.content
         parsed = json.loads(content)
         if isinstance(parsed, list):
-            return parsed
-        for key in ("insights", "data", "results"):
-            if key in parsed and isinstance(parsed[key], list):
-                return parsed[key]
+            insights = parsed
+        else:
+            for key in ("insights", "data", "results"):
+                if key in parsed and isinstance(parsed[key], list):
+                    insights = parsed[key]
+                    break
     except Exception as e:
         console.print(f"[dim]LLM insight generation error: {e}[/dim]")
 
-    return None
+    if insights is not None and ttl_seconds > 0:
+        _insights_cache_put(cache_key, insights)
+    return insights
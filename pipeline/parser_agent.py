@@ -5,14 +5,36 @@ Converts RawJobPage objects into JobPosting Pydantic models.
 
 from __future__ import annotations
 
-from typing import Any, Dict, List
-
+import asyncio
+import gzip
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+import orjson
 from agents import Agent, function_tool
-from rich.console import Console
+from pydantic import ValidationError
+
+from models.job_schema import (
+    JOBS_ADAPTER,
+    JobPosting,
+    ParsedJobBatch,
+    RawJobPage,
+    ScraperResult,
+)
+from models.job_schema_fast import JobPostingFast
+from pipeline import _obj_store
+from pipeline._proc_pool import pool_context
+from tools.console import console
 
-from models.job_schema import ParsedJobBatch, RawJobPage, ScraperResult
+if TYPE_CHECKING:
+    from tools.parser_tool import JobDeduplicator
 
-console = Console()
+# Parser workers come from a forkserver, never fork: in streaming mode they start
+# while asyncio.to_thread helpers and the Playwright driver are running
+_POOL_CONTEXT = pool_context("agents", "lxml.html", "pydantic")
 
 
 # ─────────────────────────────────────────────
@@ -28,12 +50,13 @@ def parse_job_pages(scraper_result_json: str) -> str:
         scraper_result_json: JSON string of a ScraperResult object
 
     Returns:
-        JSON string of a ParsedJobBatch object
+        A batch:... store token for the ParsedJobBatch, accepted by the parser,
+        analyst and report tools in place of its JSON
     """
-    from tools.parser_tool import deduplicate_jobs, extract_skills, parse_linkedin_job_cards
+    from tools.parser_tool import JobDeduplicator, extract_skills, parse_linkedin_job_cards
 
     scraper_result = ScraperResult.model_validate_json(scraper_result_json)
-    all_jobs = []
+    dedup = JobDeduplicator()
     total_failed = 0
 
     console.print(
@@ -41,12 +64,12 @@ def parse_job_pages(scraper_result_json: str) -> str:
     )
 
     for page in scraper_result.pages:
-        if not page.success or not page.html:
+        if not page.success or not (page.html or page.html_path):
             total_failed += 1
             continue
 
         try:
-            jobs = parse_linkedin_job_cards(page.html, page.query, page.location)
+            jobs = parse_linkedin_job_cards(_page_html(page.html, page.html_path), page.query, page.location)
 
             # Enrich with skills from description if available
             for job in jobs:
@@ -56,7 +79,7 @@ def parse_job_pages(scraper_result_json: str) -> str:
                     # Extract skills from title as fallback
                     job.required_skills = extract_skills(job.title)
 
-            all_jobs.extend(jobs)
+            dedup.extend(jobs)
             console.print(
                 f"  [green]✓[/green] {page.query} / {page.location} "
                 f"page {page.page_number} → {len(jobs)} jobs"
@@ -65,22 +88,25 @@ def parse_job_pages(scraper_result_json: str) -> str:
             console.print(f"  [red]✗[/red] Parse error: {e}")
             total_failed += 1
 
-    # Deduplicate
-    unique_jobs, dupe_count = deduplicate_jobs(all_jobs)
+    unique_jobs, dupe_count = dedup.unique, dedup.dupe_count
+    # Count only postings that survive validation; dropped ones count as failures
+    valid_jobs = _validate_jobs(unique_jobs)
+    dropped = len(unique_jobs) - len(valid_jobs)
 
     console.print(
-        f"\n  Total parsed: [bold]{len(unique_jobs)}[/bold] unique jobs "
-        f"([dim]{dupe_count} duplicates removed[/dim])"
+        f"\n  Total parsed: [bold]{len(valid_jobs)}[/bold] unique jobs "
+        f"([dim]{dupe_count} duplicates removed, {dropped} invalid dropped[/dim])"
     )
 
     batch = ParsedJobBatch(
-        jobs=unique_jobs,
-        total_parsed=len(unique_jobs),
-        total_failed=total_failed,
+        jobs=valid_jobs,
+        total_parsed=len(valid_jobs),
+        total_failed=total_failed + dropped,
         duplicate_count=dupe_count,
         source_pages=len(scraper_result.pages),
     )
-    return batch.model_dump_json()
+    # Hand later tools a short token instead of re-serializing every job
+    return _obj_store.put_batch(batch)
 
 
 @function_tool
@@ -89,26 +115,52 @@ def enrich_jobs_with_skills(parsed_batch_json: str) -> str:
     Re-scan all job descriptions to extract missing skills.
 
     Args:
-        parsed_batch_json: JSON string of ParsedJobBatch
+        parsed_batch_json: JSON string of ParsedJobBatch, or a batch:... store token
 
     Returns:
-        Updated JSON string of ParsedJobBatch with enriched skills
+        Updated ParsedJobBatch with enriched skills, in the same form it was given
     """
     from tools.parser_tool import extract_skills
 
-    batch = ParsedJobBatch.model_validate_json(parsed_batch_json)
+    # Store tokens come back as tokens; JSON payloads come back as JSON
+    as_token = _obj_store.is_token(parsed_batch_json, _obj_store.BATCH)
+
+    # run_parser already fills skills during the first pass — when nothing is
+    # missing, hand the batch back untouched instead of re-validating it
+    if not _needs_enrichment(parsed_batch_json):
+        console.print("  Enriched [bold]0[/bold] jobs with extracted skills")
+        return parsed_batch_json
+
+    batch = _obj_store.load_batch(parsed_batch_json)
     enriched = 0
+    jobs = []
 
     for job in batch.jobs:
         if not job.required_skills:
-            text = " ".join(filter(None, [job.title, job.job_description or ""]))
-            skills = extract_skills(text)
+            skills = extract_skills(_skill_text(job))
             if skills:
-                job.required_skills = skills
+                # JobPosting is frozen — derive an updated copy
+                job = job.model_copy(update={"required_skills": skills})
                 enriched += 1
+        jobs.append(job)
 
     console.print(f"  Enriched [bold]{enriched}[/bold] jobs with extracted skills")
-    return batch.model_dump_json()
+    enriched_batch = batch.model_copy(update={"jobs": jobs})
+    if as_token:
+        return _obj_store.put_batch(enriched_batch)
+    return enriched_batch.model_dump_json()
+
+
+def _needs_enrichment(parsed_batch_json: str) -> bool:
+    """True unless the payload is a batch whose jobs all already have skills."""
+    if _obj_store.is_token(parsed_batch_json, _obj_store.BATCH):
+        return not all(job.required_skills for job in _obj_store.get(parsed_batch_json).jobs)
+    try:
+        jobs = orjson.loads(parsed_batch_json)["jobs"]
+        return not all(job["required_skills"] for job in jobs)
+    except (orjson.JSONDecodeError, KeyError, TypeError):
+        # Let full validation produce the error
+        return True
 
 
 # ─────────────────────────────────────────────
@@ -127,8 +179,10 @@ Your job is to extract structured job data from raw HTML pages collected by the
 
 Process:
 1. Call parse_job_pages with the ScraperResult JSON to extract all jobs
-2. Call enrich_jobs_with_skills to fill in any missing skills
-3. Return the ParsedJobBatch JSON
+   (it returns a short "batch:..." token for the parsed jobs)
+2. Call enrich_jobs_with_skills with that token to fill in any missing skills
+3. Return the token enrich_jobs_with_skills gives back, unchanged — the
+   Analyst and Report agents take it in place of the ParsedJobBatch JSON
 
 Each job should have:
 - title (raw job title)
@@ -144,7 +198,6 @@ Each job should have:
 Be thorough and extract as many valid jobs as possible.
 """,
         tools=[parse_job_pages, enrich_jobs_with_skills],
-        output_type=ParsedJobBatch,
     )
 
 
@@ -152,68 +205,271 @@ Be thorough and extract as many valid jobs as possible.
 # STANDALONE RUNNER
 # ─────────────────────────────────────────────
 
-def run_parser(scraper_result: ScraperResult) -> ParsedJobBatch:
+# Below this many pages, worker start-up costs more than parsing in-process
+_PARALLEL_MIN_PAGES = 8
+
+
+def run_parser(scraper_result: ScraperResult, max_workers: Optional[int] = None) -> ParsedJobBatch:
     """
     Run the parser pipeline synchronously.
     Automatically routes each page to the correct parser:
       - Pages starting with SERPAPI_JSON:: → parse_serpapi_json()
       - All other pages                    → parse_linkedin_job_cards()
+
+    Parsing is CPU-bound and pages are independent, so larger batches are
+    spread over a process pool (max_workers defaults to the CPU count;
+    pass 1 to parse in-process).
     """
-    from pipeline.scraper_agent import SERPAPI_MARKER
-    from tools.parser_tool import (
-        deduplicate_jobs,
-        extract_skills,
-        parse_linkedin_job_cards,
-        parse_serpapi_json,
-    )
+    from tools.parser_tool import JobDeduplicator
 
-    all_jobs = []
+    dedup = JobDeduplicator()
     total_failed = 0
+    pages = scraper_result.pages
+    workers = max_workers or os.cpu_count() or 1
 
     console.print(
-        f"\n[bold cyan]Parser Agent[/bold cyan] — processing {len(scraper_result.pages)} pages "
+        f"\n[bold cyan]Parser Agent[/bold cyan] — processing {len(pages)} pages "
         f"(source: {scraper_result.source})"
     )
 
-    for page in scraper_result.pages:
-        if not page.success or not page.html:
+    if workers > 1 and len(pages) >= _PARALLEL_MIN_PAGES:
+        results = _parse_pages_in_processes(pages, workers)
+    else:
+        results = [_parse_raw_page(page) for page in pages]
+
+    for jobs in results:
+        if jobs is None:
             total_failed += 1
+        else:
+            dedup.extend(jobs)
+
+    return _build_batch(dedup, total_failed, len(pages))
+
+
+def _parse_pages_in_processes(pages: List[RawJobPage], workers: int) -> List[Optional[List[JobPostingFast]]]:
+    """
+    Parse pages on a ProcessPoolExecutor, returning results in page order.
+    Workers get plain (html, html_path, query, location) tuples and send back
+    slotted JobPostingFast lists, which pickle far cheaper than Pydantic models.
+    Pages spilled to disk are decompressed in the worker, not here.
+    Falls back to in-process parsing if the pool cannot be used.
+    """
+    payloads = [
+        (page.html, page.html_path, page.query, page.location)
+        for page in pages
+        if page.success and (page.html or page.html_path)
+    ]
+    chunksize = max(1, len(payloads) // (workers * 4))
+    try:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=_POOL_CONTEXT) as pool:
+            parsed = iter(list(pool.map(_parse_page_payload, payloads, chunksize=chunksize)))
+    except (BrokenProcessPool, OSError) as e:
+        console.print(f"  [dim]Process pool unavailable ({e}) — parsing in-process[/dim]")
+        return [_parse_raw_page(page) for page in pages]
+
+    results: List[Optional[List[JobPostingFast]]] = []
+    for page in pages:
+        if not page.success or not (page.html or page.html_path):
+            results.append(None)
             continue
+        jobs, error = next(parsed)
+        _report_page(page, jobs, error)
+        results.append(jobs)
+    return results
+
+
+def _parse_page_payload(
+    payload: Tuple[bytes, Optional[str], str, str],
+) -> Tuple[Optional[List[JobPostingFast]], Optional[str]]:
+    """Process-pool entry point: parse one page, returning (jobs, error message)."""
+    html, html_path, query, location = payload
+    try:
+        return _parse_page_content(_page_html(html, html_path), query, location), None
+    except Exception as e:
+        return None, str(e)
+
+
+async def run_parser_stream(
+    page_queue: "asyncio.Queue[Optional[RawJobPage]]",
+    max_workers: Optional[int] = None,
+) -> ParsedJobBatch:
+    """
+    Parse pages as the scraper produces them.
+    Consumes RawJobPage items from page_queue until a None sentinel arrives,
+    so parsing overlaps with the remaining network I/O of the scraper.
+
+    Pages are parsed on a process pool (max_workers defaults to the CPU count;
+    pass 1 to parse in the event loop), so parsing neither blocks the
+    scraper's event loop nor contends for its GIL. Results are merged in
+    arrival order, so de-duplication matches an in-process run.
+    """
+    from tools.parser_tool import JobDeduplicator
 
-        try:
-            # ── Route to the correct parser ──────────────────────────
-            if page.html.startswith(SERPAPI_MARKER):
-                raw_json = page.html[len(SERPAPI_MARKER):]
-                jobs = parse_serpapi_json(raw_json, page.query, page.location)
-            else:
-                jobs = parse_linkedin_job_cards(page.html, page.query, page.location)
-
-            # Enrich skills
-            for job in jobs:
-                text = " ".join(filter(None, [job.title, job.job_description or ""]))
-                if not job.required_skills:
-                    job.required_skills = extract_skills(text)
+    dedup = JobDeduplicator()
+    total_failed = 0
+    source_pages = 0
+    workers = max_workers or os.cpu_count() or 1
+    pool = ProcessPoolExecutor(max_workers=workers, mp_context=_POOL_CONTEXT) if workers > 1 else None
+    loop = asyncio.get_running_loop()
+    # (page, pool future or None to parse in-process), in arrival order
+    pending: List[Tuple[RawJobPage, Optional["asyncio.Future"]]] = []
 
-            all_jobs.extend(jobs)
-            console.print(
-                f"  [green]✓[/green] {page.query} / {page.location} "
-                f"pg {page.page_number} → {len(jobs)} jobs parsed"
+    console.print(
+        f"\n[bold cyan]Parser Agent[/bold cyan] — parsing pages as they arrive"
+    )
+
+    def submit(page: RawJobPage) -> Optional["asyncio.Future"]:
+        nonlocal pool
+        if pool is None or not page.success or not (page.html or page.html_path):
+            return None
+        try:
+            return loop.run_in_executor(
+                pool, _parse_page_payload, (page.html, page.html_path, page.query, page.location)
             )
-        except Exception as e:
-            console.print(f"  [red]✗[/red] Parse error on page: {e}")
+        except (BrokenProcessPool, OSError, RuntimeError) as e:
+            console.print(f"  [dim]Process pool unavailable ({e}) — parsing in-process[/dim]")
+            pool = None
+            return None
+
+    async def merge(page: RawJobPage, future: Optional["asyncio.Future"]) -> None:
+        nonlocal pool, total_failed
+        jobs = None
+        if future is not None:
+            try:
+                jobs, error = await future
+                _report_page(page, jobs, error)
+            except (BrokenProcessPool, OSError) as e:
+                if pool is not None:
+                    console.print(f"  [dim]Process pool unavailable ({e}) — parsing in-process[/dim]")
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    pool = None
+                future = None
+        if future is None:
+            jobs = _parse_raw_page(page)
+        if jobs is None:
             total_failed += 1
+        else:
+            dedup.extend(jobs)
+
+    try:
+        while True:
+            page = await page_queue.get()
+            if page is None:
+                break
+            source_pages += 1
+            pending.append((page, submit(page)))
+            # Merge whatever has finished at the head of the line
+            while pending and (pending[0][1] is None or pending[0][1].done()):
+                await merge(*pending.pop(0))
+        for page, future in pending:
+            await merge(page, future)
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    return _build_batch(dedup, total_failed, source_pages)
+
+
+def _parse_raw_page(page: RawJobPage) -> Optional[List[JobPostingFast]]:
+    """Parse and skill-enrich a single page. Returns None if the page failed."""
+    if not page.success or not (page.html or page.html_path):
+        return None
+
+    try:
+        jobs = _parse_page_content(_page_html(page.html, page.html_path), page.query, page.location)
+    except Exception as e:
+        _report_page(page, None, str(e))
+        return None
+    _report_page(page, jobs, None)
+    return jobs
+
+
+def _page_html(html: bytes, html_path: Optional[str]) -> bytes:
+    """Page body, decompressed from its spill file when the scraper wrote one."""
+    if html_path and not html:
+        return gzip.decompress(Path(html_path).read_bytes())
+    return html
+
+
+def _parse_page_content(html: bytes, query: str, location: str) -> List[JobPostingFast]:
+    """Route a page body to the correct parser and fill in missing skills."""
+    from pipeline.scraper_agent import SERPAPI_MARKER
+    from tools.parser_tool import (
+        extract_skills,
+        parse_linkedin_job_cards,
+        parse_serpapi_json,
+    )
+
+    # ── Route to the correct parser ──────────────────────────
+    if html.startswith(SERPAPI_MARKER):
+        jobs = parse_serpapi_json(html[len(SERPAPI_MARKER):], query, location)
+    else:
+        jobs = parse_linkedin_job_cards(html, query, location)
+
+    # Enrich skills
+    for job in jobs:
+        if not job.required_skills:
+            job.required_skills = extract_skills(_skill_text(job))
+    return jobs
 
-    unique_jobs, dupe_count = deduplicate_jobs(all_jobs)
+
+def _skill_text(job: JobPosting | JobPostingFast) -> str:
+    """Title and description joined for skill extraction (either may be empty)."""
+    title, description = job.title, job.job_description
+    if title and description:
+        return f"{title} {description}"
+    return title or description or ""
+
+
+def _report_page(page: RawJobPage, jobs: Optional[List[JobPostingFast]], error: Optional[str]) -> None:
+    if jobs is None:
+        console.print(f"  [red]✗[/red] Parse error on page: {error}")
+    else:
+        console.print(
+            f"  [green]✓[/green] {page.query} / {page.location} "
+            f"pg {page.page_number} → {len(jobs)} jobs parsed"
+        )
+
+
+def _validate_jobs(jobs: List[JobPostingFast]) -> List[JobPosting]:
+    """
+    Validate parsed jobs into JobPosting models with one JOBS_ADAPTER call.
+    If the batch contains an invalid job, fall back to per-job validation so
+    only the offending postings are dropped.
+    """
+    try:
+        return JOBS_ADAPTER.validate_python(jobs, from_attributes=True)
+    except ValidationError:
+        pass
+
+    valid = []
+    for job in jobs:
+        try:
+            valid.append(JobPosting.model_validate(job, from_attributes=True))
+        except ValidationError as e:
+            console.print(f"  [dim]Dropped invalid job '{job.title}': {e.error_count()} errors[/dim]")
+    return valid
+
+
+def _build_batch(dedup: JobDeduplicator, total_failed: int, source_pages: int) -> ParsedJobBatch:
+    """
+    Convert the deduplicated parsed jobs to JobPosting models in a ParsedJobBatch.
+    total_failed is the failed-page count; postings dropped by validation are added to it.
+    """
+    unique_jobs, dupe_count = dedup.unique, dedup.dupe_count
+    # Count only postings that survive validation; dropped ones count as failures
+    valid_jobs = _validate_jobs(unique_jobs)
+    dropped = len(unique_jobs) - len(valid_jobs)
 
     console.print(
-        f"\n  Total: [bold]{len(unique_jobs)}[/bold] unique | "
-        f"{dupe_count} dupes removed | {total_failed} pages failed"
+        f"\n  Total: [bold]{len(valid_jobs)}[/bold] unique | "
+        f"{dupe_count} dupes removed | {dropped} invalid dropped | {total_failed} pages failed"
     )
 
     return ParsedJobBatch(
-        jobs=unique_jobs,
-        total_parsed=len(unique_jobs),
-        total_failed=total_failed,
+        jobs=valid_jobs,
+        total_parsed=len(valid_jobs),
+        total_failed=total_failed + dropped,
         duplicate_count=dupe_count,
-        source_pages=len(scraper_result.pages),
+        source_pages=source_pages,
     )
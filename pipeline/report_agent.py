@@ -4,18 +4,30 @@ Report Agent — generates the final Markdown report, charts, JSON, and CSV expo
 
 from __future__ import annotations
 
-import json
+import csv
+import io
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from operator import attrgetter, itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+import numpy as np
+import orjson
 from agents import Agent, function_tool
-from rich.console import Console
 
-from models.job_schema import AnalysisResult, ParsedJobBatch, ReportResult
-
-console = Console()
+from models.job_schema import (
+    JOB_CSV_COLUMNS,
+    AnalysisResult,
+    JobPosting,
+    ParsedJobBatch,
+    ReportResult,
+)
+from pipeline._obj_store import load_batch
+from tools.chart_tool import generate_all_charts, generate_dashboard
+from tools.console import console
 
 
 # ─────────────────────────────────────────────
@@ -28,20 +40,18 @@ def save_jobs_json(parsed_batch_json: str, output_path: str) -> str:
     Save job data to a JSON file.
 
     Args:
-        parsed_batch_json: JSON string of ParsedJobBatch
+        parsed_batch_json: JSON string of ParsedJobBatch, or a batch:... store token
         output_path: Full file path for JSON output
 
     Returns:
         Saved file path or error message
     """
-    batch = ParsedJobBatch.model_validate_json(parsed_batch_json)
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    batch = load_batch(parsed_batch_json)
+    _ensure_dir(os.path.dirname(output_path) or ".")
 
-    jobs_data = [job.to_dict() for job in batch.jobs]
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(jobs_data, f, indent=2, default=str)
+    count = _write_jobs_json(batch.jobs, output_path)
 
-    console.print(f"  [green]✓[/green] JSON saved: {output_path} ({len(jobs_data)} jobs)")
+    console.print(f"  [green]✓[/green] JSON saved: {output_path} ({count} jobs)")
     return output_path
 
 
@@ -51,26 +61,46 @@ def save_jobs_csv(parsed_batch_json: str, output_path: str) -> str:
     Save job data to a CSV file.
 
     Args:
-        parsed_batch_json: JSON string of ParsedJobBatch
+        parsed_batch_json: JSON string of ParsedJobBatch, or a batch:... store token
         output_path: Full file path for CSV output
 
     Returns:
         Saved file path or error message
     """
-    import pandas as pd
+    batch = load_batch(parsed_batch_json)
+    _ensure_dir(os.path.dirname(output_path) or ".")
 
-    batch = ParsedJobBatch.model_validate_json(parsed_batch_json)
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
-
-    rows = [job.to_dict() for job in batch.jobs]
-    if not rows:
+    if not batch.jobs:
         console.print(f"  [yellow]No jobs to save to CSV[/yellow]")
         return output_path
 
-    df = pd.DataFrame(rows)
-    df.to_csv(output_path, index=False, encoding="utf-8")
+    count = _write_jobs_csv(batch.jobs, output_path)
 
-    console.print(f"  [green]✓[/green] CSV saved: {output_path} ({len(rows)} rows)")
+    console.print(f"  [green]✓[/green] CSV saved: {output_path} ({count} rows)")
+    return output_path
+
+
+@function_tool
+def save_jobs_parquet(parsed_batch_json: str, output_path: str) -> str:
+    """
+    Save job data to a zstd-compressed Parquet file (requires pyarrow).
+
+    Args:
+        parsed_batch_json: JSON string of ParsedJobBatch, or a batch:... store token
+        output_path: Full file path for Parquet output
+
+    Returns:
+        Saved file path or error message
+    """
+    batch = load_batch(parsed_batch_json)
+    _ensure_dir(os.path.dirname(output_path) or ".")
+
+    try:
+        count = _write_jobs_parquet(batch.jobs, output_path)
+    except ImportError:
+        return "Parquet export requires pyarrow: pip install 'linkedin-jobs-agent[parquet]'"
+
+    console.print(f"  [green]✓[/green] Parquet saved: {output_path} ({count} rows)")
     return output_path
 
 
@@ -86,11 +116,9 @@ def generate_charts(analysis_json: str, charts_dir: str) -> str:
     Returns:
         JSON list of generated chart paths
     """
-    from tools.chart_tool import generate_all_charts
-
-    analysis = json.loads(analysis_json)
+    analysis = orjson.loads(analysis_json)
     chart_paths = generate_all_charts(analysis, charts_dir)
-    return json.dumps(chart_paths)
+    return orjson.dumps(chart_paths).decode()
 
 
 @function_tool
@@ -112,292 +140,406 @@ def generate_markdown_report(
     Returns:
         Path to generated report
     """
-    analysis = AnalysisResult.model_validate_json(analysis_json)
-    chart_paths = json.loads(chart_paths_json)
+    analysis = _analysis_from_json(analysis_json)
+    chart_paths = orjson.loads(chart_paths_json)
 
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    _ensure_dir(os.path.dirname(output_path) or ".")
 
     report_content = _build_markdown_report(analysis, chart_paths, charts_dir)
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(report_content)
+    _write_markdown(report_content, output_path)
 
     console.print(f"  [green]✓[/green] Report saved: {output_path}")
     return output_path
 
 
+@lru_cache(maxsize=32)
+def _ensure_dir(directory: str) -> None:
+    """Create directory once per process; several tools write into the same folder."""
+    os.makedirs(directory, exist_ok=True)
+
+
+@lru_cache(maxsize=4)
+def _analysis_from_json(analysis_json: str) -> AnalysisResult:
+    """Validate AnalysisResult JSON once; the agent passes the same string to several tools."""
+    return AnalysisResult.model_validate_json(analysis_json)
+
+
+# ─────────────────────────────────────────────
+# EXPORT WRITERS
+# ─────────────────────────────────────────────
+
+# Write buffer for exports: large enough to amortize syscalls over many rows
+_EXPORT_BUFFER_SIZE = 1 << 20
+
+# Data exports written when output.formats is not set; "parquet" is opt-in (needs pyarrow)
+_DEFAULT_FORMATS = ("json", "csv")
+
+
+def _write_jobs_json(jobs: List[JobPosting], output_path: str, pretty: bool = True) -> int:
+    """
+    Stream jobs to a JSON array one object at a time, so peak memory stays at one
+    job rather than the whole serialized batch. pretty=True (the default) writes
+    the same bytes as orjson.dumps(list, option=OPT_INDENT_2); pretty=False
+    writes compact single-line JSON.
+    """
+    with open(output_path, "wb", buffering=_EXPORT_BUFFER_SIZE) as f:
+        if not jobs:
+            f.write(b"[]")
+            return 0
+        if pretty:
+            # Re-indent each object one level to sit inside the array; JSON strings
+            # never contain a raw newline, so this only touches structural breaks.
+            start, sep, end = b"[\n  ", b",\n  ", b"\n]"
+        else:
+            start, sep, end = b"[", b",", b"]"
+        f.write(start)
+        for i, job in enumerate(jobs):
+            if i:
+                f.write(sep)
+            if pretty:
+                f.write(orjson.dumps(job.to_dict(), option=orjson.OPT_INDENT_2).replace(b"\n", b"\n  "))
+            else:
+                f.write(orjson.dumps(job.to_dict()))
+        f.write(end)
+    return len(jobs)
+
+
+def _write_jobs_csv(jobs: List[JobPosting], output_path: str) -> int:
+    """Stream jobs to CSV row by row via JobPosting.csv_row()."""
+    with open(output_path, "w", encoding="utf-8", newline="", buffering=_EXPORT_BUFFER_SIZE) as f:
+        writer = csv.writer(f, lineterminator="\n")
+        writer.writerow(JOB_CSV_COLUMNS)
+        writer.writerows(job.csv_row() for job in jobs)
+    return len(jobs)
+
+
+def _write_markdown(content: str, output_path: str) -> None:
+    """Encode the report once and write it in a single binary call (always LF line endings)."""
+    with open(output_path, "wb") as f:
+        f.write(content.encode("utf-8"))
+
+
+def _write_jobs_parquet(jobs: List[JobPosting], output_path: str) -> int:
+    """
+    Write jobs to Parquet with zstd compression. Same columns as the CSV, but
+    timestamps and flags keep their types. Raises ImportError without pyarrow.
+    """
+    import pandas as pd
+
+    df = pd.DataFrame.from_records([job.csv_row() for job in jobs], columns=list(JOB_CSV_COLUMNS))
+    for column in ("date_posted", "scraped_at"):
+        df[column] = pd.to_datetime(df[column])
+    df.to_parquet(output_path, engine="pyarrow", compression="zstd", index=False)
+    return len(jobs)
+
+
 # ─────────────────────────────────────────────
 # MARKDOWN BUILDER
 # ─────────────────────────────────────────────
 
+# Static report blocks, built once at import time
+_HEADER_TEMPLATE = (
+    "# LinkedIn Tech Jobs Demand Report\n"
+    "> **Generated:** {now}  \n"
+    "> **Total Jobs Analyzed:** {total_jobs:,}  \n"
+    "> **Data Period:** Last 24 months  \n"
+    "> **Regions:** United States · India · Global\n"
+    "\n---\n"
+)
+
+_TOC = (
+    "## Table of Contents\n"
+    "1. [Executive Summary](#1-executive-summary)\n"
+    "2. [Total Jobs Found by Region](#2-total-jobs-found-by-region)\n"
+    "3. [Role Demand Breakdown](#3-role-demand-breakdown)\n"
+    "4. [Top Skills in Demand](#4-top-skills-in-demand)\n"
+    "5. [Experience Level Distribution](#5-experience-level-distribution)\n"
+    "6. [Work Mode Distribution](#6-work-mode-distribution)\n"
+    "7. [Top Hiring Companies](#7-top-hiring-companies)\n"
+    "8. [Quarterly Trends](#8-quarterly-trends)\n"
+    "9. [AI/ML Knowledge Expected by Role](#9-aiml-knowledge-expected-by-role)\n"
+    "10. [Observations & Insights](#10-observations--insights)\n"
+    "\n---\n"
+)
+
+_KEYWORDS_LINE = (
+    "\n**Keywords detected:** `AI` · `ML` · `LLM` · `GenAI` · `Generative AI` · "
+    "`Machine Learning` · `Deep Learning` · `Neural Network` · `RAG` · "
+    "`Agents` · `AI Agents` · `Foundation Model` · `Prompt` · "
+    "`Vector Database` · `Embeddings`\n"
+)
+
+_FOOTER_TEMPLATE = (
+    "\n---\n"
+    "\n*Report generated by LinkedIn Jobs Research AI Agent on {now}*\n"
+    "*Data sourced from LinkedIn public job listings.*\n"
+)
+
+
+def _distribution_rows(
+    counts: Dict[str, int],
+    total: int,
+    sort: bool = True,
+) -> List[Tuple[str, int, float]]:
+    """(label, count, percent of total) rows, by descending count unless sort is False."""
+    items = sorted(counts.items(), key=itemgetter(1), reverse=True) if sort else list(counts.items())
+    pcts = np.fromiter((c for _, c in items), dtype=np.float64, count=len(items)) / total * 100
+    return [(label, count, pct) for (label, count), pct in zip(items, pcts.tolist())]
+
+
 def _build_markdown_report(
     analysis: AnalysisResult,
     chart_paths: List[str],
     charts_dir: str,
+    chart_format: str = "png",
 ) -> str:
     now = datetime.utcnow().strftime("%Y-%m-%d %H:%M UTC")
-    lines = []
-
-    def chart_embed(filename: str) -> str:
-        for path in chart_paths:
-            if filename in path:
-                rel = os.path.relpath(path, os.path.dirname(charts_dir) or ".")
-                return f"![{filename}]({rel})\n"
-        return f"*Chart not generated: {filename}*\n"
-
-    # ── Header
-    lines += [
-        "# LinkedIn Tech Jobs Demand Report\n",
-        f"> **Generated:** {now}  \n",
-        f"> **Total Jobs Analyzed:** {analysis.total_jobs:,}  \n",
-        f"> **Data Period:** Last 24 months  \n",
-        f"> **Regions:** United States · India · Global\n",
-        "\n---\n",
-    ]
-
-    # ── Table of Contents
-    lines += [
-        "## Table of Contents\n",
-        "1. [Executive Summary](#1-executive-summary)\n",
-        "2. [Total Jobs Found by Region](#2-total-jobs-found-by-region)\n",
-        "3. [Role Demand Breakdown](#3-role-demand-breakdown)\n",
-        "4. [Top Skills in Demand](#4-top-skills-in-demand)\n",
-        "5. [Experience Level Distribution](#5-experience-level-distribution)\n",
-        "6. [Work Mode Distribution](#6-work-mode-distribution)\n",
-        "7. [Top Hiring Companies](#7-top-hiring-companies)\n",
-        "8. [Quarterly Trends](#8-quarterly-trends)\n",
-        "9. [AI/ML Knowledge Expected by Role](#9-aiml-knowledge-expected-by-role)\n",
-        "10. [Observations & Insights](#10-observations--insights)\n",
-        "\n---\n",
-    ]
+    buf = io.StringIO()
+
+    # Roles by demand (stable, so ties keep analysis order); shared by sections 1, 3 and 9
+    sorted_roles = sorted(analysis.role_stats, key=attrgetter("total_count"), reverse=True)
+    role_totals = {rs.category: rs.total_count for rs in sorted_roles}
+
+    # Embed targets by chart file name, relative to the report; first path wins on repeats.
+    # Charts written straight into charts_dir resolve to "<charts folder>/<name>" without
+    # the normpath walk in os.path.relpath; anything else still goes through it.
+    charts_root = os.path.dirname(charts_dir) or "."
+    charts_folder = os.path.basename(charts_dir)
+    simple_dir = charts_folder not in ("", ".", "..")
+    embeds: Dict[str, str] = {}
+    for path in chart_paths:
+        head, name = os.path.split(path)
+        if name not in embeds:
+            if simple_dir and head == charts_dir:
+                embeds[name] = os.path.join(charts_folder, name)
+            else:
+                embeds[name] = os.path.relpath(path, charts_root)
+
+    def chart_embed(stem: str) -> str:
+        filename = f"{stem}.{chart_format}"
+        rel = embeds.get(filename)
+        if rel is None:
+            # Fall back to a substring match for callers passing unusual paths
+            path = next((p for p in chart_paths if filename in p), None)
+            if path is None:
+                return f"*Chart not generated: {filename}*\n"
+            rel = os.path.relpath(path, charts_root)
+        return f"![{filename}]({rel})\n"
+
+    # ── Header + Table of Contents
+    buf.write(_HEADER_TEMPLATE.format(now=now, total_jobs=analysis.total_jobs))
+    buf.write(_TOC)
 
     # ── 1. Executive Summary
-    lines += [
+    buf.writelines([
         "## 1. Executive Summary\n\n",
         f"This report analyzes **{analysis.total_jobs:,} tech job postings** scraped from LinkedIn "
         f"across the United States and India over the past 24 months.\n\n",
         "**Key Highlights:**\n\n",
-    ]
+    ])
 
     if analysis.insights:
         for insight in analysis.insights[:3]:
-            lines.append(f"- {insight}\n")
+            buf.write(f"- {insight}\n")
     else:
-        us_pct = round(analysis.us_jobs / analysis.total_jobs * 100) if analysis.total_jobs else 0
-        lines += [
-            f"- US market: **{analysis.us_jobs:,} jobs** ({us_pct}% of total)\n",
-            f"- India market: **{analysis.india_jobs:,} jobs** ({round(analysis.india_jobs / analysis.total_jobs * 100) if analysis.total_jobs else 0}% of total)\n",
-        ]
+        us_pct = analysis.us_jobs / analysis.total_jobs * 100 if analysis.total_jobs else 0
+        india_pct = analysis.india_jobs / analysis.total_jobs * 100 if analysis.total_jobs else 0
+        buf.writelines([
+            f"- US market: **{analysis.us_jobs:,} jobs** ({us_pct:.0f}% of total)\n",
+            f"- India market: **{analysis.india_jobs:,} jobs** ({india_pct:.0f}% of total)\n",
+        ])
 
-    if analysis.role_stats:
-        top_role = max(analysis.role_stats, key=lambda r: r.total_count)
-        lines.append(f"- Most in-demand role: **{top_role.category}** ({top_role.total_count:,} openings)\n")
+    if sorted_roles:
+        top_role = sorted_roles[0]
+        buf.write(f"- Most in-demand role: **{top_role.category}** ({top_role.total_count:,} openings)\n")
 
     if analysis.top_skills:
         top3 = ", ".join(f"**{s.skill}**" for s in analysis.top_skills[:3])
-        lines.append(f"- Top skills: {top3}\n")
+        buf.write(f"- Top skills: {top3}\n")
 
-    lines.append("\n---\n")
+    buf.write("\n---\n")
 
     # ── 2. Region Split
-    lines += [
+    buf.writelines([
         "## 2. Total Jobs Found by Region\n\n",
-        chart_embed("region_split.png"),
+        chart_embed("region_split"),
         "\n",
         "| Region | Job Count | % of Total |\n",
         "|--------|----------:|-----------:|\n",
-    ]
+    ])
 
     total = analysis.total_jobs or 1
-    for label, count in [
-        ("🇺🇸 United States", analysis.us_jobs),
-        ("🇮🇳 India", analysis.india_jobs),
-        ("🌍 Other", analysis.other_jobs),
-    ]:
-        lines.append(f"| {label} | {count:,} | {round(count/total*100, 1)}% |\n")
+    region_counts = {
+        "🇺🇸 United States": analysis.us_jobs,
+        "🇮🇳 India": analysis.india_jobs,
+        "🌍 Other": analysis.other_jobs,
+    }
+    for label, count, pct in _distribution_rows(region_counts, total, sort=False):
+        buf.write(f"| {label} | {count:,} | {pct:.1f}% |\n")
 
-    lines.append(f"| **Total** | **{analysis.total_jobs:,}** | **100%** |\n")
-    lines.append("\n---\n")
+    buf.write(f"| **Total** | **{analysis.total_jobs:,}** | **100%** |\n")
+    buf.write("\n---\n")
 
     # ── 3. Role Demand Breakdown
-    lines += [
+    buf.writelines([
         "## 3. Role Demand Breakdown\n\n",
-        chart_embed("role_demand.png"),
+        chart_embed("role_demand"),
         "\n",
         "| Role Category | Total | 🇺🇸 US | 🇮🇳 India | Other | Remote% | Hybrid% |\n",
         "|---------------|------:|------:|---------:|------:|--------:|--------:|\n",
-    ]
+    ])
 
-    sorted_roles = sorted(analysis.role_stats, key=lambda r: r.total_count, reverse=True)
     for rs in sorted_roles:
-        lines.append(
+        buf.write(
             f"| {rs.category} | {rs.total_count:,} | {rs.us_count:,} | "
             f"{rs.india_count:,} | {rs.other_count:,} | "
             f"{rs.remote_percentage}% | {rs.hybrid_percentage}% |\n"
         )
 
-    lines.append("\n### Top Skills Per Role\n\n")
+    buf.write("\n### Top Skills Per Role\n\n")
     for rs in sorted_roles[:5]:
         if rs.top_skills:
             skills_str = " · ".join(f"`{s}`" for s in rs.top_skills[:8])
-            lines.append(f"**{rs.category}:** {skills_str}\n\n")
+            buf.write(f"**{rs.category}:** {skills_str}\n\n")
 
-    lines.append("\n---\n")
+    buf.write("\n---\n")
 
     # ── 4. Top Skills
-    lines += [
+    buf.writelines([
         "## 4. Top Skills in Demand\n\n",
-        chart_embed("top_skills.png"),
+        chart_embed("top_skills"),
         "\n",
         "| Rank | Skill | Mentions | % of Jobs | Top Role Categories |\n",
         "|-----:|-------|--------:|---------:|---------------------|\n",
-    ]
+    ])
 
     for i, skill in enumerate(analysis.top_skills[:20], 1):
         cats = ", ".join(skill.top_categories[:2]) if skill.top_categories else "—"
-        lines.append(
+        buf.write(
             f"| {i} | **{skill.skill}** | {skill.count:,} | {skill.percentage}% | {cats} |\n"
         )
 
-    lines.append("\n---\n")
+    buf.write("\n---\n")
 
     # ── 5. Experience Level Distribution
-    lines += [
+    buf.writelines([
         "## 5. Experience Level Distribution\n\n",
-        chart_embed("experience_distribution.png"),
+        chart_embed("experience_distribution"),
         "\n",
         "| Experience Level | Count | % |\n",
         "|------------------|------:|--:|\n",
-    ]
+    ])
 
-    for level, count in sorted(
-        analysis.experience_distribution.items(), key=lambda x: -x[1]
-    ):
-        pct = round(count / total * 100, 1)
-        lines.append(f"| {level} | {count:,} | {pct}% |\n")
+    for level, count, pct in _distribution_rows(analysis.experience_distribution, total):
+        buf.write(f"| {level} | {count:,} | {pct:.1f}% |\n")
 
-    lines.append("\n---\n")
+    buf.write("\n---\n")
 
     # ── 6. Work Mode Distribution
-    lines += [
+    buf.writelines([
         "## 6. Work Mode Distribution\n\n",
-        chart_embed("work_type_distribution.png"),
+        chart_embed("work_type_distribution"),
         "\n",
         "| Work Mode | Count | % |\n",
         "|-----------|------:|--:|\n",
-    ]
+    ])
 
-    for wt, count in sorted(
-        analysis.work_type_distribution.items(), key=lambda x: -x[1]
-    ):
-        pct = round(count / total * 100, 1)
-        lines.append(f"| {wt} | {count:,} | {pct}% |\n")
+    for wt, count, pct in _distribution_rows(analysis.work_type_distribution, total):
+        buf.write(f"| {wt} | {count:,} | {pct:.1f}% |\n")
 
-    lines.append("\n**Employment Type Breakdown:**\n\n")
-    lines.append("| Employment Type | Count | % |\n")
-    lines.append("|-----------------|------:|--:|\n")
-    for et, count in sorted(
-        analysis.employment_type_distribution.items(), key=lambda x: -x[1]
-    ):
-        pct = round(count / total * 100, 1)
-        lines.append(f"| {et} | {count:,} | {pct}% |\n")
+    buf.write("\n**Employment Type Breakdown:**\n\n")
+    buf.write("| Employment Type | Count | % |\n")
+    buf.write("|-----------------|------:|--:|\n")
+    for et, count, pct in _distribution_rows(analysis.employment_type_distribution, total):
+        buf.write(f"| {et} | {count:,} | {pct:.1f}% |\n")
 
-    lines.append("\n---\n")
+    buf.write("\n---\n")
 
     # ── 7. Top Hiring Companies
-    lines += [
+    buf.writelines([
         "## 7. Top Hiring Companies\n\n",
         "| Rank | Company | Open Roles | Remote | Key Role Types |\n",
         "|-----:|---------|----------:|-------:|----------------|\n",
-    ]
+    ])
 
     for i, company in enumerate(analysis.top_companies[:20], 1):
         cats = ", ".join(company.categories[:3]) if company.categories else "—"
-        lines.append(
+        buf.write(
             f"| {i} | **{company.company_name}** | {company.total_openings:,} | "
             f"{company.remote_count} | {cats} |\n"
         )
 
-    lines.append("\n---\n")
+    buf.write("\n---\n")
 
     # ── 8. Quarterly Trends
-    lines += [
+    buf.writelines([
         "## 8. Quarterly Trends\n\n",
-        chart_embed("quarterly_trends.png"),
+        chart_embed("quarterly_trends"),
         "\n",
-    ]
+    ])
 
     # Table: quarterly totals for "All"
     all_trends = [t for t in analysis.quarterly_trends if t.category == "All"]
     if all_trends:
-        sorted_trends = sorted(all_trends, key=lambda t: t.quarter)
-        lines += [
+        sorted_trends = sorted(all_trends, key=attrgetter("quarter"))
+        buf.writelines([
             "| Quarter | Total Postings |\n",
             "|---------|---------------:|\n",
-        ]
+        ])
         for t in sorted_trends:
-            lines.append(f"| {t.quarter} | {t.count:,} |\n")
+            buf.write(f"| {t.quarter} | {t.count:,} |\n")
 
-    lines.append("\n---\n")
+    buf.write("\n---\n")
 
     # ── 9. AI/ML Mention by Role
-    lines += [
+    buf.writelines([
         "## 9. AI/ML Knowledge Expected by Role\n\n",
         "> Which roles are expecting AI/ML knowledge — even outside core AI/ML job titles?\n\n",
-        chart_embed("ai_mention_by_role.png"),
+        chart_embed("ai_mention_by_role"),
         "\n",
         "| Role Category | Jobs Analyzed | AI/ML Mentions | % Adoption |\n",
         "|---------------|----------:|----------:|----------:|\n",
-    ]
+    ])
 
     if analysis.ai_mention_by_role:
-        # Get total count per role from role_stats for the table
-        role_totals = {rs.category: rs.total_count for rs in analysis.role_stats}
-
         sorted_ai = sorted(
             analysis.ai_mention_by_role.items(),
-            key=lambda x: x[1], reverse=True,
+            key=itemgetter(1), reverse=True,
         )
         for role, pct in sorted_ai:
             total_c = role_totals.get(role, 0)
             ai_count = round(total_c * pct / 100)
             bar = "🟩" * min(int(pct / 10), 10)
-            lines.append(f"| {role} | {total_c:,} | ~{ai_count:,} | {bar} {pct}% |\n")
+            buf.write(f"| {role} | {total_c:,} | ~{ai_count:,} | {bar} {pct}% |\n")
 
         # Highlight top finding
         top_role, top_pct = sorted_ai[0]
-        lines.append(
+        buf.write(
             f"\n> 💡 **{top_role}** has the highest AI/ML adoption signal at **{top_pct}%** "
             f"of job postings — meaning employers already expect AI familiarity even in this role.\n"
         )
     else:
-        lines.append("*AI/ML mention data not available for this run.*\n")
+        buf.write("*AI/ML mention data not available for this run.*\n")
 
-    lines.append("\n**Keywords detected:** `AI` · `ML` · `LLM` · `GenAI` · `Generative AI` · "
-                 "`Machine Learning` · `Deep Learning` · `Neural Network` · `RAG` · "
-                 "`Agents` · `AI Agents` · `Foundation Model` · `Prompt` · "
-                 "`Vector Database` · `Embeddings`\n")
+    buf.write(_KEYWORDS_LINE)
 
-    lines.append("\n---\n")
+    buf.write("\n---\n")
 
     # ── 10. Insights
-    lines += [
+    buf.writelines([
         "## 10. Observations & Insights\n\n",
-    ]
+    ])
 
     if analysis.insights:
         for i, insight in enumerate(analysis.insights, 1):
-            lines.append(f"**{i}.** {insight}\n\n")
+            buf.write(f"**{i}.** {insight}\n\n")
     else:
-        lines.append("*Insights not generated — run with an OpenAI API key for LLM-powered insights.*\n")
+        buf.write("*Insights not generated — run with an OpenAI API key for LLM-powered insights.*\n")
 
-    lines += [
-        "\n---\n",
-        f"\n*Report generated by LinkedIn Jobs Research AI Agent on {now}*\n",
-        "*Data sourced from LinkedIn public job listings.*\n",
-    ]
+    buf.write(_FOOTER_TEMPLATE.format(now=now))
 
-    return "".join(lines)
+    return buf.getvalue()
 
 
 # ─────────────────────────────────────────────
@@ -408,6 +550,10 @@ def create_report_agent(config: Dict[str, Any]) -> Agent:
     """Create and return the Report Agent."""
     output_cfg = config.get("output", {})
     output_dir = output_cfg.get("directory", "output")
+    parquet_step = (
+        "\nAlso call save_jobs_parquet to export the job data as Parquet."
+        if "parquet" in output_cfg.get("formats", _DEFAULT_FORMATS) else ""
+    )
 
     return Agent(
         name="ReportAgent",
@@ -419,14 +565,17 @@ Your job is to produce the final deliverables from the analysis:
 1. Call save_jobs_json to export raw job data as JSON
 2. Call save_jobs_csv to export raw job data as CSV
 3. Call generate_charts to create all visualizations
-4. Call generate_markdown_report to produce the final report
+4. Call generate_markdown_report to produce the final report{parquet_step}
+
+The job batch may be ParsedJobBatch JSON or a short "batch:..." token; pass it
+unchanged as parsed_batch_json.
 
 All output files go in the '{output_dir}/' directory.
 Charts go in '{output_dir}/charts/'.
 
 Return a ReportResult with the paths and stats for all generated files.
 """,
-        tools=[save_jobs_json, save_jobs_csv, generate_charts, generate_markdown_report],
+        tools=[save_jobs_json, save_jobs_csv, save_jobs_parquet, generate_charts, generate_markdown_report],
         output_type=ReportResult,
     )
 
@@ -451,18 +600,20 @@ def run_report(
     Returns:
         ReportResult with paths to all generated files
     """
-    from tools.chart_tool import generate_all_charts
-
     output_cfg = config.get("output", {})
     output_dir = output_cfg.get("directory", "output")
     charts_dir = output_cfg.get("charts_directory", os.path.join(output_dir, "charts"))
     report_filename = output_cfg.get("report_filename", "linkedin_jobs_report.md")
     json_filename = output_cfg.get("json_filename", "jobs_data.json")
     csv_filename = output_cfg.get("csv_filename", "jobs_data.csv")
+    parquet_filename = output_cfg.get("parquet_filename", "jobs_data.parquet")
+    formats = output_cfg.get("formats", _DEFAULT_FORMATS)
+    chart_format = output_cfg.get("chart_format", "png")
 
     report_path = os.path.join(output_dir, report_filename)
     json_path = os.path.join(output_dir, json_filename)
     csv_path = os.path.join(output_dir, csv_filename)
+    parquet_path = os.path.join(output_dir, parquet_filename) if "parquet" in formats else None
 
     os.makedirs(output_dir, exist_ok=True)
     os.makedirs(charts_dir, exist_ok=True)
@@ -470,61 +621,135 @@ def run_report(
     console.print(f"\n[bold cyan]Report Agent[/bold cyan] — generating outputs")
 
     errors = []
+    # Status lines are rendered together once the report is written
+    status: List[str] = []
+
+    # JSON/CSV/Parquet exports and charts are independent; run them side by side
+    # and report their outcomes in a fixed order once all have finished
+    tasks: Dict[str, Callable[[], Any]] = {}
+    if "json" in formats:
+        pretty_json = output_cfg.get("pretty_json", True)
+        tasks["json"] = lambda: _write_jobs_json(batch.jobs, json_path, pretty=pretty_json)
+    if "csv" in formats and batch.jobs:
+        tasks["csv"] = lambda: _write_jobs_csv(batch.jobs, csv_path)
+    if parquet_path:
+        tasks["parquet"] = lambda: _write_jobs_parquet(batch.jobs, parquet_path)
+    analysis_dict = analysis.model_dump()
+    chart_workers = output_cfg.get("chart_workers")
+    tasks["charts"] = lambda: generate_all_charts(
+        analysis_dict, charts_dir, fmt=chart_format, max_workers=chart_workers
+    )
+    if output_cfg.get("dashboard", False):
+        tasks["dashboard"] = lambda: generate_dashboard(
+            analysis_dict, charts_dir, filename=f"dashboard.{chart_format}"
+        )
+
+    outcomes = _run_report_tasks(tasks, parallel=output_cfg.get("parallel", True))
 
     # ── Save JSON
-    try:
-        import json as _json
-        jobs_data = [job.to_dict() for job in batch.jobs]
-        with open(json_path, "w", encoding="utf-8") as f:
-            _json.dump(jobs_data, f, indent=2, default=str)
-        console.print(f"  [green]✓[/green] JSON: {json_path}")
-    except Exception as e:
-        errors.append(f"JSON export failed: {e}")
-        console.print(f"  [red]✗[/red] JSON: {e}")
+    if "json" in outcomes:
+        _, e = outcomes["json"]
+        if e is None:
+            status.append(f"  [green]✓[/green] JSON: {json_path}")
+        else:
+            errors.append(f"JSON export failed: {e}")
+            status.append(f"  [red]✗[/red] JSON: {e}")
 
     # ── Save CSV
-    try:
-        import pandas as pd
-        rows = [job.to_dict() for job in batch.jobs]
-        if rows:
-            df = pd.DataFrame(rows)
-            df.to_csv(csv_path, index=False, encoding="utf-8")
-            console.print(f"  [green]✓[/green] CSV: {csv_path}")
-    except Exception as e:
-        errors.append(f"CSV export failed: {e}")
-        console.print(f"  [red]✗[/red] CSV: {e}")
+    if "csv" in outcomes:
+        _, e = outcomes["csv"]
+        if e is None:
+            status.append(f"  [green]✓[/green] CSV: {csv_path}")
+        else:
+            errors.append(f"CSV export failed: {e}")
+            status.append(f"  [red]✗[/red] CSV: {e}")
+
+    # ── Save Parquet
+    if "parquet" in outcomes:
+        _, e = outcomes["parquet"]
+        if e is None:
+            status.append(f"  [green]✓[/green] Parquet: {parquet_path}")
+        elif isinstance(e, ImportError):
+            errors.append("Parquet export skipped: pyarrow is not installed")
+            status.append("  [yellow]⚠[/yellow] Parquet: pyarrow is not installed")
+            parquet_path = None
+        else:
+            errors.append(f"Parquet export failed: {e}")
+            status.append(f"  [red]✗[/red] Parquet: {e}")
 
     # ── Generate charts
-    chart_paths = []
-    try:
-        chart_paths = generate_all_charts(analysis.model_dump(), charts_dir)
-        console.print(f"  [green]✓[/green] Charts: {len(chart_paths)} generated in {charts_dir}")
-    except Exception as e:
+    chart_paths, e = outcomes["charts"]
+    if e is None:
+        status.append(f"  [green]✓[/green] Charts: {len(chart_paths)} generated in {charts_dir}")
+    else:
+        chart_paths = []
         errors.append(f"Chart generation failed: {e}")
-        console.print(f"  [red]✗[/red] Charts: {e}")
+        status.append(f"  [red]✗[/red] Charts: {e}")
+
+    # Reported on its own, not in charts_generated (it repeats the charts above)
+    dashboard_path = None
+    if "dashboard" in outcomes:
+        dashboard_path, e = outcomes["dashboard"]
+        if e is None:
+            status.append(f"  [green]✓[/green] Dashboard: {dashboard_path}")
+        else:
+            errors.append(f"Dashboard chart failed: {e}")
+            status.append(f"  [red]✗[/red] Dashboard: {e}")
 
     # ── Generate Markdown report
     try:
-        content = _build_markdown_report(analysis, chart_paths, charts_dir)
-        with open(report_path, "w", encoding="utf-8") as f:
-            f.write(content)
-        console.print(f"  [green]✓[/green] Report: {report_path}")
+        content = _build_markdown_report(analysis, chart_paths, charts_dir, chart_format)
+        _write_markdown(content, report_path)
+        status.append(f"  [green]✓[/green] Report: {report_path}")
     except Exception as e:
         errors.append(f"Markdown report failed: {e}")
-        console.print(f"  [red]✗[/red] Report: {e}")
+        status.append(f"  [red]✗[/red] Report: {e}")
+        console.print("\n".join(status))
         return ReportResult(
             report_path=report_path,
             json_path=json_path,
             csv_path=csv_path,
+            parquet_path=parquet_path,
             success=False,
             error_message=str(e),
         )
 
+    console.print("\n".join(status))
     return ReportResult(
         report_path=report_path,
         json_path=json_path,
         csv_path=csv_path,
+        parquet_path=parquet_path,
         charts_generated=chart_paths,
+        dashboard_path=dashboard_path,
         total_jobs_in_report=batch.total_parsed,
         success=True,
     )
+
+
+def _run_report_tasks(
+    tasks: Dict[str, Callable[[], Any]],
+    parallel: bool = True,
+) -> Dict[str, Tuple[Any, Optional[BaseException]]]:
+    """
+    Run independent report tasks, concurrently on threads unless parallel is False.
+    File writes and matplotlib rendering release the GIL for much of their time.
+
+    Returns:
+        {name: (result, exception)} in the order tasks were given
+    """
+    outcomes: Dict[str, Tuple[Any, Optional[BaseException]]] = {}
+    if not parallel or len(tasks) < 2:
+        for name, task in tasks.items():
+            try:
+                outcomes[name] = (task(), None)
+            except Exception as e:
+                outcomes[name] = (None, e)
+        return outcomes
+
+    with ThreadPoolExecutor(max_workers=len(tasks), thread_name_prefix="report") as pool:
+        futures = {name: pool.submit(task) for name, task in tasks.items()}
+        for name, future in futures.items():
+            e = future.exception()
+            outcomes[name] = (None if e is not None else future.result(), e)
+    return outcomes
@@ -6,19 +6,33 @@ Uses Playwright for browser automation with stealth and anti-bot measures.
 from __future__ import annotations
 
 import asyncio
+import gzip
+import hashlib
 import os
-from typing import Any, Dict, List
-
+import sqlite3
+import tempfile
+import time
+import unicodedata
+import uuid
+import zlib
+from contextlib import closing
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import orjson
 from agents import Agent, function_tool
-from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
 
 from models.job_schema import RawJobPage, ScraperResult
+from pipeline._sqlite_cache import CACHE_DIR, SqliteCache, connect
+from tools.console import console, spinner_progress
+
+if TYPE_CHECKING:
+    import httpx
 
-console = Console()
 
 # Marker prefix so the parser knows this page contains raw SerpAPI JSON
-SERPAPI_MARKER = "SERPAPI_JSON::"
+SERPAPI_MARKER = b"SERPAPI_JSON::"
 
 
 # ─────────────────────────────────────────────
@@ -40,10 +54,8 @@ def scrape_linkedin_pages(
     Returns:
         JSON string with ScraperResult data
     """
-    import json
-
-    queries = json.loads(queries_json)
-    config = json.loads(config_json)
+    queries = orjson.loads(queries_json)
+    config = orjson.loads(config_json)
 
     try:
         loop = asyncio.new_event_loop()
@@ -73,9 +85,7 @@ def scrape_via_serpapi(
     Returns:
         JSON string with ScraperResult data
     """
-    import json
-
-    queries = json.loads(queries_json)
+    queries = orjson.loads(queries_json)
 
     try:
         result = _run_serpapi_scraper(queries, serpapi_key)
@@ -89,9 +99,113 @@ def scrape_via_serpapi(
 # PLAYWRIGHT IMPLEMENTATION
 # ─────────────────────────────────────────────
 
+# Queries scraped at once, each in its own browser context (config: scraper.concurrency)
+_PLAYWRIGHT_CONCURRENCY = 4
+
+# Scraped pages are gzipped into this directory instead of being held in memory
+# until parsing (config: scraper.spill_html)
+_PAGE_SPILL_DIR = Path(tempfile.gettempdir()) / "linkedin_jobs_agent_pages"
+
+
+def _spill_html(html: str) -> str:
+    """Gzip a page body to a temp file and return its path."""
+    _PAGE_SPILL_DIR.mkdir(parents=True, exist_ok=True)
+    path = _PAGE_SPILL_DIR / f"page_{uuid.uuid4().hex}.html.gz"
+    path.write_bytes(gzip.compress(html.encode("utf-8"), compresslevel=3))
+    return str(path)
+
+
+def _prune_spill_dir(max_age_seconds: float) -> None:
+    """Delete spill files older than max_age_seconds, left behind by earlier runs."""
+    cutoff = time.time() - max_age_seconds
+    try:
+        entries = list(os.scandir(_PAGE_SPILL_DIR))
+    except OSError:
+        return
+    for entry in entries:
+        try:
+            if entry.name.startswith("page_") and entry.stat().st_mtime < cutoff:
+                os.unlink(entry.path)
+        except OSError:
+            pass
+
+
+# Finished pages are checkpointed here so an interrupted run resumes where it
+# stopped instead of re-scraping (config: scraper.resume_ttl_hours, 0 disables).
+# A run that completes deletes its queries' checkpoints.
+_SCRAPER_STATE_PATH = CACHE_DIR / "scraper_state.sqlite"
+_SCRAPER_STATE_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS pages "
+    "(keywords TEXT NOT NULL, location TEXT NOT NULL, page_number INTEGER NOT NULL, "
+    "url TEXT NOT NULL, html_path TEXT NOT NULL, scraped_at REAL NOT NULL, "
+    "PRIMARY KEY (keywords, location, page_number))"
+)
+_RESUME_TTL_HOURS = 6
+
+
+def _resumable_pages(keywords: str, location: str, ttl_seconds: float) -> List[RawJobPage]:
+    """Pages 1..n of a query checkpointed within ttl_seconds whose spill files still exist."""
+
+    if ttl_seconds <= 0 or not _SCRAPER_STATE_PATH.exists():
+        return []
+    try:
+        with closing(sqlite3.connect(_SCRAPER_STATE_PATH)) as db:
+            rows = db.execute(
+                "SELECT page_number, url, html_path FROM pages "
+                "WHERE keywords = ? AND location = ? AND scraped_at >= ? ORDER BY page_number",
+                (keywords, location, time.time() - ttl_seconds),
+            ).fetchall()
+    except sqlite3.Error:
+        return []
+
+    pages: List[RawJobPage] = []
+    for page_number, url, html_path in rows:
+        if page_number != len(pages) + 1 or not os.path.exists(html_path):
+            break
+        pages.append(RawJobPage(
+            url=url, html=b"", html_path=html_path,
+            query=keywords, location=location,
+            page_number=page_number, success=True,
+        ))
+    return pages
+
+
+def _checkpoint_page(page: RawJobPage) -> None:
+    """Record a spilled page as done; checkpoint failures never affect the run."""
+
+    try:
+        with closing(connect(_SCRAPER_STATE_PATH, _SCRAPER_STATE_SCHEMA)) as db, db:
+            db.execute(
+                "INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?, ?)",
+                (page.query, page.location, page.page_number, page.url, page.html_path, time.time()),
+            )
+    except (sqlite3.Error, OSError) as e:
+        console.print(f"[dim]Scraper checkpoint not written: {e}[/dim]")
+
+
+def _delete_checkpoints(
+    ttl_seconds: float,
+    queries: Sequence[Dict[str, str]] = (),
+) -> None:
+    """Drop checkpoints older than ttl_seconds, plus every checkpoint of queries."""
+
+    if not _SCRAPER_STATE_PATH.exists():
+        return
+    try:
+        with closing(sqlite3.connect(_SCRAPER_STATE_PATH)) as db, db:
+            db.execute("DELETE FROM pages WHERE scraped_at < ?", (time.time() - ttl_seconds,))
+            db.executemany(
+                "DELETE FROM pages WHERE keywords = ? AND location = ?",
+                [(q["keywords"], q["location"]) for q in queries],
+            )
+    except sqlite3.Error as e:
+        console.print(f"[dim]Scraper checkpoints not cleared: {e}[/dim]")
+
+
 async def _run_playwright_scraper(
     queries: List[Dict[str, str]],
     config: Dict[str, Any],
+    on_page: Optional[Callable[[RawJobPage], None]] = None,
 ) -> ScraperResult:
     from tools.browser_tool import BrowserSession, build_linkedin_url
 
@@ -107,14 +221,26 @@ async def _run_playwright_scraper(
     max_retries = config.get("max_retries", 3)
     backoff     = config.get("backoff_factor", 2.0)
     time_range  = config.get("time_range_seconds", 63072000)
+    concurrency = config.get("concurrency", _PLAYWRIGHT_CONCURRENCY)
+    spill_html  = config.get("spill_html", True)
+    # Checkpoints point at spill files, so resuming needs spill_html
+    resume_ttl_seconds = config.get("resume_ttl_hours", _RESUME_TTL_HOURS) * 3600 if spill_html else 0
     jobs_per_page = 25
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        TimeElapsedColumn(),
-        console=console,
-    ) as progress:
+    if spill_html:
+        # Earlier runs' pages are only kept while a checkpoint could still resume them
+        await asyncio.to_thread(
+            _prune_spill_dir, max(resume_ttl_seconds, _RESUME_TTL_HOURS * 3600)
+        )
+
+    if resume_ttl_seconds:
+        await asyncio.to_thread(_delete_checkpoints, resume_ttl_seconds)
+
+    # Backoff waits per attempt, worked out once rather than inside the retry loop
+    captcha_waits = tuple(backoff ** attempt * 15 for attempt in range(max_retries))
+    retry_waits   = tuple(backoff ** attempt * 3 for attempt in range(max_retries))
+
+    with spinner_progress() as progress:
         task = progress.add_task("[cyan]Scraping LinkedIn...", total=len(queries) * max_pages)
 
         async with BrowserSession(
@@ -122,64 +248,136 @@ async def _run_playwright_scraper(
             browser_type=browser_type,
             min_delay=min_delay,
             max_delay=max_delay,
+            block_resources=config.get("block_resources", True),
         ) as session:
-            for query in queries:
+            semaphore = asyncio.Semaphore(max(1, concurrency))
+
+            async def scrape_query(query: Dict[str, str]) -> Tuple[List[RawJobPage], bool, bool, List[str]]:
+                """
+                All pages of one query in its own browser context → (pages, failed,
+                captcha, messages). Per-page status lines are buffered in messages and
+                printed once per query; CAPTCHA and retry warnings still print live.
+                """
                 keywords    = query["keywords"]
                 location    = query["location"]
+                query_pages = await asyncio.to_thread(_resumable_pages, keywords, location, resume_ttl_seconds)
                 query_failed = False
+                query_captcha = False
+                query_messages: List[str] = []
                 captcha_count = 0
 
-                for page_num in range(max_pages):
-                    start = page_num * jobs_per_page
-                    url   = build_linkedin_url(keywords, location, time_range, start)
-
-                    result = None
-                    for attempt in range(max_retries):
-                        result = await session.fetch_page(url)
-
-                        if result.captcha:
-                            captcha_encountered = True
-                            captcha_count += 1
-                            console.print(
-                                f"[yellow]  CAPTCHA (attempt {attempt+1}) for '{keywords}' / '{location}'[/yellow]"
-                            )
-                            if captcha_count >= 2:
-                                console.print(f"[red]  Skipping due to repeated CAPTCHAs[/red]")
-                                query_failed = True
+                async with semaphore:
+                    context = await session.new_context()
+                    prefetch: Optional[asyncio.Task] = None
+
+                    async def fetch_after_delay(url: str, tab: int):
+                        await session.random_delay()
+                        return await session.fetch_page(url, context=context, tab=tab)
+
+                    if query_pages:
+                        progress.update(task, advance=len(query_pages))
+                        query_messages.append(
+                            f"  [dim]{keywords} / {location} — resuming after page {len(query_pages)}[/dim]"
+                        )
+
+                    try:
+                        for page_num in range(len(query_pages), max_pages):
+                            start = page_num * jobs_per_page
+                            url   = build_linkedin_url(keywords, location, time_range, start)
+                            tab   = page_num % 2
+
+                            result = None
+                            for attempt in range(max_retries):
+                                if prefetch is not None:
+                                    result, prefetch = await prefetch, None
+                                else:
+                                    result = await session.fetch_page(url, context=context, tab=tab)
+
+                                if result.captcha:
+                                    query_captcha = True
+                                    captcha_count += 1
+                                    console.print(
+                                        f"[yellow]  CAPTCHA (attempt {attempt+1}) for '{keywords}' / '{location}'[/yellow]"
+                                    )
+                                    if captcha_count >= 2:
+                                        console.print(f"[red]  Skipping due to repeated CAPTCHAs[/red]")
+                                        query_failed = True
+                                        break
+                                    await asyncio.sleep(captcha_waits[attempt])
+                                    continue
+
+                                if result.success:
+                                    break
+
+                                wait = retry_waits[attempt]
+                                console.print(f"[dim]  Retry {attempt+1}/{max_retries}, waiting {wait:.1f}s...[/dim]")
+                                await asyncio.sleep(wait)
+
+                            if query_failed:
                                 break
-                            await asyncio.sleep(backoff ** attempt * 15)
-                            continue
 
-                        if result.success:
-                            break
+                            if result and result.success and result.html:
+                                # Next page loads in the other tab (after the usual delay)
+                                # while this one is written out
+                                if page_num + 1 < max_pages:
+                                    next_url = build_linkedin_url(
+                                        keywords, location, time_range, start + jobs_per_page
+                                    )
+                                    prefetch = asyncio.create_task(fetch_after_delay(next_url, 1 - tab))
+                                if spill_html:
+                                    html, html_path = b"", await asyncio.to_thread(_spill_html, result.html)
+                                else:
+                                    html, html_path = result.html.encode("utf-8"), None
+                                page = RawJobPage(
+                                    url=url, html=html, html_path=html_path,
+                                    query=keywords, location=location,
+                                    page_number=page_num + 1, success=True,
+                                )
+                                query_pages.append(page)
+                                if resume_ttl_seconds:
+                                    await asyncio.to_thread(_checkpoint_page, page)
+                                progress.update(task, advance=1)
+                                query_messages.append(f"  [green]✓[/green] {keywords} / {location} — page {page_num+1}")
+                            else:
+                                query_pages.append(RawJobPage(
+                                    url=url, html=b"",
+                                    query=keywords, location=location,
+                                    page_number=page_num + 1, success=False,
+                                    error_message=result.error if result else "Unknown error",
+                                ))
+                                progress.update(task, advance=1)
+                                break
+                    finally:
+                        if prefetch is not None:
+                            prefetch.cancel()
+                        await session.close_context(context)
 
-                        wait = backoff ** attempt * 3
-                        console.print(f"[dim]  Retry {attempt+1}/{max_retries}, waiting {wait:.1f}s...[/dim]")
-                        await asyncio.sleep(wait)
+                return query_pages, query_failed, query_captcha, query_messages
 
+            # Queries run side by side; results are collected in query order so the
+            # page list (and downstream dedup order) matches a one-at-a-time run
+            workers = [asyncio.create_task(scrape_query(query)) for query in queries]
+            try:
+                for query, worker in zip(queries, workers):
+                    query_pages, query_failed, query_captcha, query_messages = await worker
+                    if query_messages:
+                        console.print("\n".join(query_messages))
+                    captcha_encountered = captcha_encountered or query_captcha
                     if query_failed:
-                        failed_queries.append(f"{keywords}|{location}")
-                        break
-
-                    if result and result.success and result.html:
-                        pages.append(RawJobPage(
-                            url=url, html=result.html,
-                            query=keywords, location=location,
-                            page_number=page_num + 1, success=True,
-                        ))
-                        progress.update(task, advance=1)
-                        console.print(f"  [green]✓[/green] {keywords} / {location} — page {page_num+1}")
-                    else:
-                        pages.append(RawJobPage(
-                            url=url, html="",
-                            query=keywords, location=location,
-                            page_number=page_num + 1, success=False,
-                            error_message=result.error if result else "Unknown error",
-                        ))
-                        progress.update(task, advance=1)
-                        break
-
-                    await session.random_delay()
+                        failed_queries.append(f"{query['keywords']}|{query['location']}")
+                    pages.extend(query_pages)
+                    if on_page:
+                        for page in query_pages:
+                            if page.success:
+                                on_page(page)
+            finally:
+                for worker in workers:
+                    worker.cancel()
+
+    # The run finished, so there is nothing left to resume — only interrupted
+    # runs keep their checkpoints
+    if resume_ttl_seconds:
+        await asyncio.to_thread(_delete_checkpoints, resume_ttl_seconds, queries)
 
     return ScraperResult(
         pages=pages,
@@ -195,75 +393,102 @@ async def _run_playwright_scraper(
 # SERPAPI IMPLEMENTATION  (fixed)
 # ─────────────────────────────────────────────
 
-# Placeholder values that mean "no real key was set"
-_PLACEHOLDER_KEYS = {
+# Placeholder values that mean "no real key was set" (compared case-insensitively)
+_PLACEHOLDER_KEYS = frozenset(k.lower() for k in (
     "", "PASTE_YOUR_SERPAPI_KEY_HERE", "your_key_here",
     "YOUR_API_KEY", "serpapi_key", "xxxx",
-}
+))
 
 
-def _run_serpapi_scraper(
-    queries: List[Dict[str, str]],
-    api_key: str,
-    max_pages_per_query: int = 1,
-) -> ScraperResult:
-    """
-    Fetch jobs via SerpAPI Google Jobs engine with full pagination.
+def _is_real_key(key: Optional[str]) -> bool:
+    """True unless key is empty, whitespace or one of the placeholder values."""
+    return bool(key) and key.strip().lower() not in _PLACEHOLDER_KEYS
 
-    Each SerpAPI call returns ~10 jobs.
-    max_pages_per_query=5 → up to 50 jobs per query.
-    26 queries × 5 pages = 130 API credits → ~1,000 unique jobs.
 
-    Pagination uses SerpAPI's next_page_token (most reliable method).
-    Falls back to `start` offset if token is absent.
-    """
-    import json
-    import time
+_SERPAPI_URL = "https://serpapi.com/search.json"
 
-    # ── Validate API key ──────────────────────────────────────────────
-    key = (api_key or "").strip()
-    if key in _PLACEHOLDER_KEYS:
-        console.print(
-            "[red bold]✗ SerpAPI key not set![/red bold]\n"
-            "  Open [cyan]config.yaml[/cyan] and replace "
-            "[yellow]PASTE_YOUR_SERPAPI_KEY_HERE[/yellow] with your real key.\n"
-            "  Get one free at [link=https://serpapi.com]serpapi.com[/link]"
-        )
-        return ScraperResult(source="serpapi")
+# Queries fetched at once; each in-flight query holds one pooled keep-alive connection
+_SERPAPI_CONCURRENCY = 8
+
+# How long a cached SerpAPI response is reused (config: data_source.serpapi.cache_ttl_hours)
+_SERPAPI_CACHE_TTL_HOURS = 6
+
+
+@dataclass
+class _SerpQueryResult:
+    """Outcome of paginating one SerpAPI query; messages are printed in query order."""
 
+    jobs: List[dict] = field(default_factory=list)
+    last_page: int = 0
+    credits: int = 0
+    cached: int = 0
+    failed: bool = False
+    messages: List[str] = field(default_factory=list)
+
+
+async def _serpapi_search(client: httpx.AsyncClient, params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    One SerpAPI search over the pooled client. Like GoogleSearch.get_dict(),
+    error responses come back as their JSON body (with an "error" key) rather
+    than raising, so callers keep a single error path.
+    """
+    response = await client.get(_SERPAPI_URL, params=params)
     try:
-        from serpapi import GoogleSearch
-    except ImportError:
-        console.print("[red]google-search-results not installed. Run: uv sync[/red]")
-        return ScraperResult(source="serpapi")
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError:
+        raise RuntimeError(f"SerpAPI returned HTTP {response.status_code} with a non-JSON body") from None
 
-    pages: List[RawJobPage] = []
-    failed: List[str] = []
-    total_credits_used = 0
 
-    console.print(
-        f"  [dim]Plan: {len(queries)} queries × {max_pages_per_query} pages "
-        f"= up to {len(queries) * max_pages_per_query} API credits[/dim]"
-    )
+_SERPAPI_CACHE = SqliteCache("serpapi.sqlite", "SerpAPI cache")
+
+
+def _serpapi_cache_key(params: Dict[str, Any]) -> str:
+    """Digest of the request params minus the API key, so a new key still hits the cache."""
+    public = {k: v for k, v in params.items() if k != "api_key"}
+    return hashlib.blake2b(orjson.dumps(public, option=orjson.OPT_SORT_KEYS), digest_size=16).hexdigest()
+
+
+def _serpapi_cache_get(key: str, ttl_seconds: float) -> Optional[Dict[str, Any]]:
+    """Return the cached response for key if it is younger than ttl_seconds."""
+    body = _SERPAPI_CACHE.get(key, ttl_seconds)
+    return None if body is None else orjson.loads(zlib.decompress(body))
 
-    for query in queries:
-        keywords = query["keywords"]
-        location = query["location"]
-        query_jobs: List[dict] = []
-
-        # ── Base params (same for every page of this query) ──────────
-        base_params = {
-            "engine":        "google_jobs",
-            "q":             keywords,
-            "location":      location,
-            "api_key":       key,
-            "hl":            "en",
-            "chips":         "date_posted:month",
-        }
 
-        next_page_token: str = ""
-        page_num = 0
+def _serpapi_cache_put(key: str, results: Dict[str, Any]) -> None:
+    """Persist a successful response under key."""
+    _SERPAPI_CACHE.put(key, zlib.compress(orjson.dumps(results)))
 
+
+async def _fetch_serpapi_query(
+    client: httpx.AsyncClient,
+    semaphore: asyncio.Semaphore,
+    query: Dict[str, str],
+    key: str,
+    max_pages_per_query: int,
+    cache_ttl_seconds: float = 0,
+) -> _SerpQueryResult:
+    """
+    Fetch every page of one query, following next_page_token (or `start` offsets).
+    Pages answered from the on-disk cache cost no credit and skip the polite delay.
+    """
+    keywords = query["keywords"]
+    location = query["location"]
+    result = _SerpQueryResult()
+
+    # ── Base params (same for every page of this query) ──────────
+    base_params = {
+        "engine":        "google_jobs",
+        "q":             keywords,
+        "location":      location,
+        "api_key":       key,
+        "hl":            "en",
+        "chips":         "date_posted:month",
+    }
+
+    next_page_token: str = ""
+    page_num = 0
+
+    async with semaphore:
         while page_num < max_pages_per_query:
             try:
                 params = dict(base_params)
@@ -276,22 +501,34 @@ def _run_serpapi_scraper(
                 else:
                     params["start"] = page_num * 10               # fallback offset
 
-                results = GoogleSearch(params).get_dict()
-                total_credits_used += 1
+                cache_key = _serpapi_cache_key(params) if cache_ttl_seconds > 0 else ""
+                # sqlite and zlib block; keep them off the event loop the other queries share
+                results = (
+                    await asyncio.to_thread(_serpapi_cache_get, cache_key, cache_ttl_seconds)
+                    if cache_key else None
+                )
+                from_cache = results is not None
+                if from_cache:
+                    result.cached += 1
+                else:
+                    results = await _serpapi_search(client, params)
+                    result.credits += 1
+                    if cache_key and "error" not in results:
+                        await asyncio.to_thread(_serpapi_cache_put, cache_key, results)
 
                 # ── Handle API-level errors ───────────────────────────
                 if "error" in results:
                     err = str(results["error"])
                     if page_num == 0:
                         # Only mark as failed if even page 1 errored
-                        console.print(f"  [red]✗[/red] {keywords}/{location} — {err}")
+                        result.messages.append(f"  [red]✗[/red] {keywords}/{location} — {err}")
                         if "Invalid API key" in err:
-                            console.print("    [yellow]→ Check key: https://serpapi.com/manage-api-key[/yellow]")
-                        failed.append(f"{keywords}|{location}")
+                            result.messages.append("    [yellow]→ Check key: https://serpapi.com/manage-api-key[/yellow]")
+                        result.failed = True
                     break   # stop paginating this query
 
                 batch = results.get("jobs_results", []) or []
-                query_jobs.extend(batch)
+                result.jobs.extend(batch)
 
                 # ── Check for next page ───────────────────────────────
                 pagination     = results.get("serpapi_pagination", {}) or {}
@@ -303,34 +540,127 @@ def _run_serpapi_scraper(
                     break                    # partial page + no token → last page
 
                 page_num += 1
-                time.sleep(0.4)             # be polite between pages
+                if not from_cache:
+                    await asyncio.sleep(0.4)    # be polite between pages
 
             except Exception as e:
-                console.print(f"  [red]✗[/red] Page {page_num+1} exception: {e}")
+                result.messages.append(f"  [red]✗[/red] Page {page_num+1} exception: {e}")
                 break
 
-        if query_jobs:
-            raw_payload = SERPAPI_MARKER + json.dumps(query_jobs)
-            pages.append(RawJobPage(
-                url=f"serpapi://google_jobs/{keywords}@{location}",
-                html=raw_payload,
-                query=keywords,
-                location=location,
-                page_number=page_num + 1,
-                success=True,
-            ))
-            console.print(
-                f"  [green]✓[/green] [bold]{keywords}[/bold] / [bold]{location}[/bold]"
-                f" — {len(query_jobs)} jobs ({page_num+1} page{'s' if page_num else ''})"
-            )
-        elif f"{keywords}|{location}" not in failed:
-            console.print(
-                f"  [yellow]⚠[/yellow]  0 results: [dim]{keywords} / {location}[/dim]"
-            )
+    result.last_page = page_num
+    return result
+
+
+async def _run_serpapi_scraper_async(
+    queries: List[Dict[str, str]],
+    api_key: str,
+    max_pages_per_query: int = 1,
+    on_page: Optional[Callable[[RawJobPage], None]] = None,
+    concurrency: int = _SERPAPI_CONCURRENCY,
+    cache_ttl_hours: float = _SERPAPI_CACHE_TTL_HOURS,
+) -> ScraperResult:
+    """
+    Fetch jobs via SerpAPI Google Jobs engine with full pagination.
+
+    Each SerpAPI call returns ~10 jobs.
+    max_pages_per_query=5 → up to 50 jobs per query.
+    26 queries × 5 pages = 130 API credits → ~1,000 unique jobs.
+
+    Pagination uses SerpAPI's next_page_token (most reliable method).
+    Falls back to `start` offset if token is absent.
+
+    Up to `concurrency` queries are in flight at once over one keep-alive
+    connection pool; pages within a query stay sequential because each needs
+    the previous page's token. Results are reported in query order, so the
+    output matches a serial run.
+
+    Responses are cached on disk by their params (minus the API key) for
+    cache_ttl_hours (0 disables), so a re-run with the same queries spends no
+    credits on pages it already fetched.
+
+    If on_page is given it is called with each RawJobPage as soon as its
+    query (and every query before it) finishes, so a consumer can start
+    parsing before the run ends.
+    """
+    # ── Validate API key ──────────────────────────────────────────────
+    key = (api_key or "").strip()
+    if not _is_real_key(key):
+        console.print(
+            "[red bold]✗ SerpAPI key not set![/red bold]\n"
+            "  Open [cyan]config.yaml[/cyan] and replace "
+            "[yellow]PASTE_YOUR_SERPAPI_KEY_HERE[/yellow] with your real key.\n"
+            "  Get one free at [link=https://serpapi.com]serpapi.com[/link]"
+        )
+        return ScraperResult(source="serpapi")
+
+    queries = _dedupe_queries(queries)
+    pages: List[RawJobPage] = []
+    failed: List[str] = []
+    total_credits_used = 0
+    total_cached = 0
+
+    console.print(
+        f"  [dim]Plan: {len(queries)} queries × {max_pages_per_query} pages "
+        f"= up to {len(queries) * max_pages_per_query} API credits[/dim]"
+    )
 
-        time.sleep(0.3)   # brief pause between queries
+    # httpx (which pulls in rich via its CLI module) is only needed in SerpAPI mode
+    import httpx
 
-    console.print(f"\n  [dim]Total SerpAPI credits used: {total_credits_used}[/dim]")
+    concurrency = max(1, concurrency)
+    semaphore = asyncio.Semaphore(concurrency)
+    cache_ttl_seconds = float(cache_ttl_hours) * 3600
+    limits = httpx.Limits(
+        max_connections=concurrency, max_keepalive_connections=concurrency, keepalive_expiry=60.0,
+    )
+
+    async with httpx.AsyncClient(timeout=httpx.Timeout(30.0), limits=limits) as client:
+        tasks = [
+            asyncio.create_task(_fetch_serpapi_query(
+                client, semaphore, query, key, max_pages_per_query, cache_ttl_seconds,
+            ))
+            for query in queries
+        ]
+        try:
+            for query, task in zip(queries, tasks):
+                keywords = query["keywords"]
+                location = query["location"]
+                outcome = await task
+                total_credits_used += outcome.credits
+                total_cached += outcome.cached
+                for message in outcome.messages:
+                    console.print(message)
+                if outcome.failed:
+                    failed.append(f"{keywords}|{location}")
+
+                page_num = outcome.last_page
+                if outcome.jobs:
+                    raw_payload = SERPAPI_MARKER + orjson.dumps(outcome.jobs)
+                    page = RawJobPage(
+                        url=f"serpapi://google_jobs/{keywords}@{location}",
+                        html=raw_payload,
+                        query=keywords,
+                        location=location,
+                        page_number=page_num + 1,
+                        success=True,
+                    )
+                    pages.append(page)
+                    if on_page:
+                        on_page(page)
+                    console.print(
+                        f"  [green]✓[/green] [bold]{keywords}[/bold] / [bold]{location}[/bold]"
+                        f" — {len(outcome.jobs)} jobs ({page_num+1} page{'s' if page_num else ''})"
+                    )
+                elif not outcome.failed:
+                    console.print(
+                        f"  [yellow]⚠[/yellow]  0 results: [dim]{keywords} / {location}[/dim]"
+                    )
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    cached_note = f" ({total_cached} pages from cache)" if total_cached else ""
+    console.print(f"\n  [dim]Total SerpAPI credits used: {total_credits_used}{cached_note}[/dim]")
 
     return ScraperResult(
         pages=pages,
@@ -341,6 +671,20 @@ def _run_serpapi_scraper(
     )
 
 
+def _run_serpapi_scraper(
+    queries: List[Dict[str, str]],
+    api_key: str,
+    max_pages_per_query: int = 1,
+    concurrency: int = _SERPAPI_CONCURRENCY,
+    cache_ttl_hours: float = _SERPAPI_CACHE_TTL_HOURS,
+) -> ScraperResult:
+    """Blocking wrapper around _run_serpapi_scraper_async for the agent tool."""
+    return asyncio.run(_run_serpapi_scraper_async(
+        queries, api_key, max_pages_per_query,
+        concurrency=concurrency, cache_ttl_hours=cache_ttl_hours,
+    ))
+
+
 # ─────────────────────────────────────────────
 # AGENT DEFINITION
 # ─────────────────────────────────────────────
@@ -382,13 +726,10 @@ def _resolve_serpapi_key(config_key: str, env_key: str) -> str:
       2. api_key field in config.yaml          (if set and not placeholder)
       3. Empty string → _run_serpapi_scraper will show a clear error
     """
-    env  = (env_key    or "").strip()
-    cfg  = (config_key or "").strip()
-
-    if env and env not in _PLACEHOLDER_KEYS:
-        return env      # ← env var wins
-    if cfg and cfg not in _PLACEHOLDER_KEYS:
-        return cfg      # ← config.yaml value
+    if _is_real_key(env_key):
+        return env_key.strip()      # ← env var wins
+    if _is_real_key(config_key):
+        return config_key.strip()   # ← config.yaml value
     return ""           # ← neither is set; let scraper show the error
 
 
@@ -396,8 +737,39 @@ def _resolve_serpapi_key(config_key: str, env_key: str) -> str:
 # STANDALONE RUNNER (called by main.py)
 # ─────────────────────────────────────────────
 
-async def run_scraper(config: Dict[str, Any]) -> ScraperResult:
-    """Build queries from config and run the appropriate scraper."""
+def _query_key(query: Dict[str, str]) -> Tuple[str, str]:
+    """Case- and width-insensitive identity of a query ("NYC " == "nyc")."""
+    return (
+        unicodedata.normalize("NFKC", query["keywords"]).strip().casefold(),
+        unicodedata.normalize("NFKC", query["location"]).strip().casefold(),
+    )
+
+
+def _dedupe_queries(queries: List[Dict[str, str]]) -> List[Dict[str, str]]:
+    """Drop repeated (keywords, location) queries, keeping the first spelling and order."""
+    seen: set = set()
+    unique = []
+    for query in queries:
+        key = _query_key(query)
+        if key not in seen:
+            seen.add(key)
+            unique.append(query)
+    if len(unique) < len(queries):
+        console.print(f"  [dim]{len(queries) - len(unique)} duplicate queries skipped[/dim]")
+    return unique
+
+
+async def run_scraper(
+    config: Dict[str, Any],
+    page_queue: Optional["asyncio.Queue[Optional[RawJobPage]]"] = None,
+) -> ScraperResult:
+    """
+    Build queries from config and run the appropriate scraper.
+
+    If page_queue is given, every successful RawJobPage is also put on it as
+    soon as it is fetched, followed by a None sentinel once scraping ends
+    (see parser_agent.run_parser_stream).
+    """
     search_cfg  = config.get("search", {})
     scraper_cfg = config.get("scraper", {})
     data_source = config.get("data_source", {})
@@ -415,21 +787,35 @@ async def run_scraper(config: Dict[str, Any]) -> ScraperResult:
         for loc in locations
     ]
 
+    queries = _dedupe_queries(queries)
+
     console.print(
         f"\n[bold cyan]Scraper Agent[/bold cyan] — "
         f"{len(queries)} queries, mode: [bold]{mode}[/bold]\n"
     )
 
-    if mode == "serpapi":
-        serpapi_key = _resolve_serpapi_key(
-            config_key=data_source.get("serpapi", {}).get("api_key", ""),
-            env_key=os.getenv("SERPAPI_API_KEY", ""),
-        )
-        max_pages_per_query = data_source.get("serpapi", {}).get(
-            "pages_per_query",
-            scraper_cfg.get("max_pages", 1),   # fallback to scraper.max_pages
-        )
-        return _run_serpapi_scraper(queries, serpapi_key, max_pages_per_query)
+    try:
+        if mode == "serpapi":
+            serpapi_key = _resolve_serpapi_key(
+                config_key=data_source.get("serpapi", {}).get("api_key", ""),
+                env_key=os.getenv("SERPAPI_API_KEY", ""),
+            )
+            max_pages_per_query = data_source.get("serpapi", {}).get(
+                "pages_per_query",
+                scraper_cfg.get("max_pages", 1),   # fallback to scraper.max_pages
+            )
+            return await _run_serpapi_scraper_async(
+                queries, serpapi_key, max_pages_per_query,
+                on_page=page_queue.put_nowait if page_queue is not None else None,
+                concurrency=data_source.get("serpapi", {}).get("concurrency", _SERPAPI_CONCURRENCY),
+                cache_ttl_hours=data_source.get("serpapi", {}).get("cache_ttl_hours", _SERPAPI_CACHE_TTL_HOURS),
+            )
 
-    # Default: Playwright
-    return await _run_playwright_scraper(queries, scraper_cfg)
+        # Default: Playwright
+        return await _run_playwright_scraper(
+            queries, scraper_cfg,
+            on_page=page_queue.put_nowait if page_queue is not None else None,
+        )
+    finally:
+        if page_queue is not None:
+            page_queue.put_nowait(None)
@@ -8,20 +8,15 @@ from __future__ import annotations
 
 import asyncio
 import random
+import re
 import time
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from urllib.parse import quote_plus
 
 from fake_useragent import UserAgent
-from rich.console import Console
-from tenacity import (
-    retry,
-    retry_if_exception_type,
-    stop_after_attempt,
-    wait_exponential,
-)
 
-console = Console()
+from tools.console import console
+
 ua = UserAgent()
 
 
@@ -130,6 +125,35 @@ def build_linkedin_url(
 # BROWSER SESSION
 # ─────────────────────────────────────────────
 
+# Request types and hosts that never contribute to the scraped HTML
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media", "stylesheet"})
+BLOCKED_URL_PARTS = (
+    "doubleclick.net",
+    "google-analytics.com",
+    "googletagmanager.com",
+    "linkedin.com/li/track",
+    "px.ads.linkedin.com",
+)
+
+
+async def _route_filter(route) -> None:
+    """Playwright route handler: abort blocked requests, let everything else through."""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(
+        part in request.url for part in BLOCKED_URL_PARTS
+    ):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+# Upper bound (ms) on waiting for lazy-loaded cards to appear after scrolling a results page
+SCROLL_SETTLE_TIMEOUT_MS = 3500
+
+# True once the results list holds more cards than before the scroll
+_CARDS_GREW_JS = "([sel, before]) => document.querySelectorAll(sel).length > before"
+
+
 class BrowserSession:
     """Manages a single Playwright browser session with stealth."""
 
@@ -139,14 +163,18 @@ class BrowserSession:
         browser_type: str = "chromium",
         min_delay: float = 2.0,
         max_delay: float = 5.0,
+        block_resources: bool = True,
     ):
         self.headless = headless
         self.browser_type = browser_type
         self.min_delay = min_delay
         self.max_delay = max_delay
+        self.block_resources = block_resources
         self._playwright = None
         self._browser = None
         self._context = None
+        # Reusable tabs keyed by (context, tab); opening a page per URL costs browser IPC
+        self._pages: Dict[Any, Any] = {}
 
     async def start(self) -> None:
         from playwright.async_api import async_playwright
@@ -166,8 +194,17 @@ class BrowserSession:
             ],
         )
 
+        self._context = await self.new_context()
+
+        console.print("[dim]Browser session started[/dim]")
+
+    async def new_context(self):
+        """
+        Open a fresh stealth-configured browser context (own cookies, random UA).
+        Contexts share the browser process, so several can scrape concurrently.
+        """
         user_agent = get_random_user_agent()
-        self._context = await self._browser.new_context(
+        context = await self._browser.new_context(
             user_agent=user_agent,
             viewport={"width": 1920, "height": 1080},
             locale="en-US",
@@ -185,20 +222,39 @@ class BrowserSession:
         )
 
         # Apply stealth scripts
-        await self._context.add_init_script(STEALTH_JS)
+        await context.add_init_script(STEALTH_JS)
+
+        # Only the HTML is parsed, so skip the heavy and tracking requests
+        if self.block_resources:
+            await context.route("**/*", _route_filter)
 
         # Try playwright-stealth if available
         try:
             from playwright_stealth import stealth_async
-            page = await self._context.new_page()
+            page = await context.new_page()
             await stealth_async(page)
             await page.close()
         except ImportError:
             pass
 
-        console.print("[dim]Browser session started[/dim]")
+        return context
+
+    async def close_context(self, context) -> None:
+        """Close a context from new_context() together with its reusable pages."""
+        for key in [key for key in self._pages if key[0] is context]:
+            del self._pages[key]
+        await context.close()
+
+    async def _page_for(self, context, tab: int = 0):
+        page = self._pages.get((context, tab))
+        if page is None or page.is_closed():
+            page = await context.new_page()
+            self._pages[(context, tab)] = page
+        return page
 
     async def stop(self) -> None:
+        # Closing the browser also closes every context and its reusable page
+        self._pages.clear()
         if self._browser:
             await self._browser.close()
         if self._playwright:
@@ -209,9 +265,23 @@ class BrowserSession:
         delay = random.uniform(self.min_delay, self.max_delay)
         await asyncio.sleep(delay)
 
-    async def fetch_page(self, url: str, wait_for: str = ".jobs-search__results-list") -> ScrapePageResult:
-        """Fetch a single page with retries and CAPTCHA detection."""
-        page = await self._context.new_page()
+    async def fetch_page(
+        self,
+        url: str,
+        wait_for: str = ".jobs-search__results-list",
+        context=None,
+        tab: int = 0,
+    ) -> ScrapePageResult:
+        """
+        Fetch a single page with retries and CAPTCHA detection (in context, or the
+        session's default). Navigates the context's reusable tab number `tab`
+        (separate tabs let one context load two URLs at once); after an error
+        the tab is discarded so the next fetch starts from a clean page.
+        """
+        from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+        context = context or self._context
+        page = await self._page_for(context, tab)
 
         try:
             # Randomize user agent per page
@@ -222,13 +292,19 @@ class BrowserSession:
             await page.goto(url, wait_until="domcontentloaded", timeout=30000)
             await self.random_delay()
 
-            # Scroll to load dynamic content
-            await page.evaluate("window.scrollTo(0, document.body.scrollHeight / 3)")
-            await asyncio.sleep(1.0)
-            await page.evaluate("window.scrollTo(0, document.body.scrollHeight * 2 / 3)")
-            await asyncio.sleep(1.0)
+            # Scroll to load dynamic content, then wait until the lazy-loaded cards
+            # actually arrive (a timeout still leaves the HTML loaded so far)
+            card_sel = f"{wait_for} li"
+            before = await page.evaluate(
+                "(sel) => document.querySelectorAll(sel).length", card_sel
+            )
             await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            await asyncio.sleep(1.5)
+            try:
+                await page.wait_for_function(
+                    _CARDS_GREW_JS, arg=[card_sel, before], timeout=SCROLL_SETTLE_TIMEOUT_MS
+                )
+            except PlaywrightTimeoutError:
+                pass
 
             # Check for CAPTCHA
             html = await page.content()
@@ -247,9 +323,12 @@ class BrowserSession:
 
         except Exception as e:
             console.print(f"[red]Error fetching {url}: {e}[/red]")
+            self._pages.pop((context, tab), None)
+            try:
+                await page.close()
+            except Exception:
+                pass
             return ScrapePageResult(url=url, html="", success=False, error=str(e))
-        finally:
-            await page.close()
 
     async def __aenter__(self):
         await self.start()
@@ -263,29 +342,37 @@ class BrowserSession:
 # DETECTION HELPERS
 # ─────────────────────────────────────────────
 
+CAPTCHA_SIGNALS = (
+    "captcha",
+    "CAPTCHA",
+    "cf-captcha-container",
+    "recaptcha",
+    "challenge-form",
+    "hCaptcha",
+    "Please verify you are a human",
+    "bot detection",
+)
+
+RATE_LIMIT_SIGNALS = (
+    "429",
+    "Too Many Requests",
+    "rate limit",
+    "slow down",
+    "temporarily blocked",
+)
+
+# One compiled alternation per signal list scans the page once in C instead of
+# once per signal; the rate-limit check ignores case without lowercasing the page
+_CAPTCHA_RE = re.compile("|".join(map(re.escape, CAPTCHA_SIGNALS)))
+_RATE_LIMIT_RE = re.compile("|".join(map(re.escape, RATE_LIMIT_SIGNALS)), re.IGNORECASE)
+
+
 def _is_captcha(html: str) -> bool:
-    captcha_signals = [
-        "captcha",
-        "CAPTCHA",
-        "cf-captcha-container",
-        "recaptcha",
-        "challenge-form",
-        "hCaptcha",
-        "Please verify you are a human",
-        "bot detection",
-    ]
-    return any(signal in html for signal in captcha_signals)
+    return _CAPTCHA_RE.search(html) is not None
 
 
 def _is_rate_limited(html: str) -> bool:
-    rate_signals = [
-        "429",
-        "Too Many Requests",
-        "rate limit",
-        "slow down",
-        "temporarily blocked",
-    ]
-    return any(signal.lower() in html.lower() for signal in rate_signals)
+    return _RATE_LIMIT_RE.search(html) is not None
 
 
 # ─────────────────────────────────────────────
@@ -1,20 +1,37 @@
 """
 Visualization utilities for generating charts from analysis results.
-Uses matplotlib for static charts saved to PNG files.
+Uses matplotlib for static charts saved to PNG files; simple bar charts
+requested as SVG are written directly from a template.
 """
 
 from __future__ import annotations
 
+import io
 import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from heapq import nlargest
+from html import escape
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 
-from rich.console import Console
+import numpy as np
+import pandas as pd
 
-console = Console()
+from pipeline._agg_kernels import place_pairs
+from pipeline._proc_pool import pool_context
+from tools.console import console
 
 
+# Plot-area background; translucent fills are pre-blended against it
+_AXES_BG = "#f8f9fa"
+
+
+@lru_cache(maxsize=1)
 def _setup_matplotlib():
+    """Import matplotlib on the Agg backend and apply the chart style, once per process."""
     import matplotlib
     matplotlib.use("Agg")  # Non-interactive backend
     import matplotlib.pyplot as plt
@@ -22,7 +39,7 @@ def _setup_matplotlib():
 
     plt.rcParams.update({
         "figure.facecolor": "white",
-        "axes.facecolor": "#f8f9fa",
+        "axes.facecolor": _AXES_BG,
         "axes.grid": True,
         "grid.color": "#dee2e6",
         "grid.linewidth": 0.5,
@@ -30,13 +47,65 @@ def _setup_matplotlib():
         "axes.spines.right": False,
         "font.family": "DejaVu Sans",
         "font.size": 11,
-        "axes.titlesize": 13,
+        "axes.titlesize": 14,
         "axes.titleweight": "bold",
+        "axes.labelsize": 12,
         "figure.dpi": 120,
     })
     return plt, mticker
 
 
+def _reusable_figure():
+    """A pyplot-free Figure with its own Agg canvas (safe to draw off the main thread)."""
+    _setup_matplotlib()
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    fig = Figure()
+    FigureCanvasAgg(fig)
+    return fig
+
+
+def _chart_axes(figsize: Tuple[float, float], fig=None):
+    """(fig, ax) for one chart: clears and resizes a reused figure, or opens a new pyplot one."""
+    plt, _ = _setup_matplotlib()
+    if fig is None:
+        return plt.subplots(figsize=figsize)
+    fig.clear()
+    fig.set_size_inches(*figsize)
+    return fig, fig.add_subplot()
+
+
+def _save_chart(fig, output_dir: str, filename: str) -> str:
+    """
+    Save a finished chart; pyplot figures are closed afterwards. The tight
+    bbox crop alone sizes the image to its artists, so no tight_layout pass.
+    """
+    plt, _ = _setup_matplotlib()
+    output_path = os.path.join(output_dir, filename)
+    fmt = os.path.splitext(filename)[1][1:]
+    # Encode in memory, then write the file with a single call instead of the
+    # encoder's many small writes
+    buf = io.BytesIO()
+    if fmt == "png":
+        fig.savefig(buf, format=fmt, bbox_inches="tight", pil_kwargs=PNG_SAVE_OPTIONS)
+    else:
+        fig.savefig(buf, format=fmt, bbox_inches="tight")
+    Path(output_path).write_bytes(buf.getbuffer())
+    if fig.canvas.manager is not None:  # opened through pyplot, not a reused figure
+        plt.close(fig)
+    console.print(f"[green]Chart saved:[/green] {output_path}")
+    return output_path
+
+
+# Pillow PNG encoder settings: light zlib compression saves several times faster
+# than the default level for charts this size, at the cost of somewhat larger files
+PNG_SAVE_OPTIONS = {"compress_level": 1, "optimize": False}
+
+# Formats generate_all_charts can write; savefig picks the encoder from the extension
+CHART_FORMATS = ("png", "svg")
+
+
 # ─────────────────────────────────────────────
 # COLOR PALETTE
 # ─────────────────────────────────────────────
@@ -58,135 +127,268 @@ COLORS = {
     "other": "#6B7280",
 }
 
+# Palette as an array so a whole chart's colour cycle is one indexing call
+_PALETTE = np.array(COLORS["palette"])
+
+
+def _solid(color: str, alpha: float, background: str = _AXES_BG) -> str:
+    """
+    Opaque hex colour matching '#rrggbb' drawn at alpha over background, so
+    Agg can use its solid-fill path instead of blending every pixel.
+    """
+    fg = np.array([int(color[i:i + 2], 16) for i in (1, 3, 5)])
+    bg = np.array([int(background[i:i + 2], 16) for i in (1, 3, 5)])
+    r, g, b = np.rint(fg * alpha + bg * (1 - alpha)).astype(int)
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+
+# ─────────────────────────────────────────────
+# DIRECT SVG BAR CHARTS
+# ─────────────────────────────────────────────
+# Vertical bar charts have a small fixed structure, so when SVG output is asked
+# for they are written straight from a template instead of through matplotlib.
+
+_SVG_FONT = "DejaVu Sans, Helvetica, Arial, sans-serif"
+
+
+def _nice_step(ymax: float) -> float:
+    """Axis tick step of 1, 2 or 5 × 10^k giving about five gridlines up to ymax."""
+    raw = max(ymax, 1) / 5
+    magnitude = 10 ** np.floor(np.log10(raw))
+    for factor in (1, 2, 5, 10):
+        if raw <= factor * magnitude:
+            return float(factor * magnitude)
+    return float(10 * magnitude)
+
+
+def _emit_bar_svg(
+    categories: List[str],
+    series: List[Tuple[str, Sequence[float], List[str]]],
+    output_path: str,
+    title: str,
+    xlabel: str = "",
+    ylabel: str = "",
+    size: Tuple[int, int] = (1100, 560),
+    rotate_labels: bool = False,
+    legend: bool = False,
+    label_size: int = 9,
+) -> str:
+    """
+    Write a grouped vertical bar chart as SVG.
+
+    Args:
+        categories: Group labels along the x axis
+        series: (legend label, value per category, colour per category) per bar in a group
+        output_path: File to write
+        title / xlabel / ylabel: Chart text
+        size: (width, height) in px before room for rotated labels
+        rotate_labels: Slant the category labels (long names)
+        legend: Draw a legend of the series labels
+        label_size: Font size of the value labels above bars (0 values are unlabelled)
+    """
+    width, height = size
+    left, right, top = 80, 30, 56
+    bottom = 70 + (110 if rotate_labels else 0)
+    height += bottom - 70
+    plot_w, plot_h = width - left - right, height - top - bottom
+
+    values = np.array([np.asarray(vals, dtype=float) for _, vals, _ in series])  # (series, category)
+    step = _nice_step(values.max(initial=0) * 1.08)
+    y_top = step * max(1, np.ceil(values.max(initial=0) * 1.08 / step))
+
+    n_groups, n_series = len(categories), len(series)
+    group_w = plot_w / max(n_groups, 1)
+    bar_w = group_w * 0.8 / n_series
+    x0 = left + group_w * 0.1 + np.arange(n_groups)[None, :] * group_w + np.arange(n_series)[:, None] * bar_w
+    bar_h = values / y_top * plot_h
+    y0 = top + plot_h - bar_h
+
+    out = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+        f'viewBox="0 0 {width} {height}" font-family="{_SVG_FONT}">',
+        f'<rect width="{width}" height="{height}" fill="white"/>',
+        f'<rect x="{left}" y="{top}" width="{plot_w}" height="{plot_h}" fill="{_AXES_BG}"/>',
+        f'<text x="{width / 2:.1f}" y="32" font-size="17" font-weight="bold" text-anchor="middle">{escape(title)}</text>',
+    ]
+    for tick in np.arange(0, y_top + step / 2, step):
+        y = top + plot_h - tick / y_top * plot_h
+        out.append(f'<line x1="{left}" y1="{y:.1f}" x2="{left + plot_w}" y2="{y:.1f}" stroke="#dee2e6" stroke-width="0.7"/>')
+        out.append(f'<text x="{left - 8}" y="{y + 4:.1f}" font-size="12" text-anchor="end">{int(tick):,}</text>')
+    out.append(f'<line x1="{left}" y1="{top}" x2="{left}" y2="{top + plot_h}" stroke="black"/>')
+    out.append(f'<line x1="{left}" y1="{top + plot_h}" x2="{left + plot_w}" y2="{top + plot_h}" stroke="black"/>')
+
+    for s, (_, vals, colors) in enumerate(series):
+        for i in range(n_groups):
+            out.append(
+                f'<rect x="{x0[s, i]:.1f}" y="{y0[s, i]:.1f}" width="{bar_w:.1f}" height="{bar_h[s, i]:.1f}" '
+                f'fill="{_solid(colors[i], 0.9)}"/>'
+            )
+            if values[s, i] > 0:
+                out.append(
+                    f'<text x="{x0[s, i] + bar_w / 2:.1f}" y="{y0[s, i] - 4:.1f}" font-size="{label_size}" '
+                    f'text-anchor="middle">{int(values[s, i]):,}</text>'
+                )
+
+    label_y = top + plot_h + 18
+    for i, category in enumerate(categories):
+        cx = left + (i + 0.5) * group_w
+        if rotate_labels:
+            out.append(
+                f'<text x="{cx:.1f}" y="{label_y}" font-size="12" text-anchor="end" '
+                f'transform="rotate(-35 {cx:.1f} {label_y})">{escape(category)}</text>'
+            )
+        else:
+            out.append(f'<text x="{cx:.1f}" y="{label_y}" font-size="13" text-anchor="middle">{escape(category)}</text>')
+
+    if xlabel:
+        out.append(f'<text x="{left + plot_w / 2:.1f}" y="{height - 14}" font-size="14" text-anchor="middle">{escape(xlabel)}</text>')
+    if ylabel:
+        ly = top + plot_h / 2
+        out.append(
+            f'<text x="20" y="{ly:.1f}" font-size="14" text-anchor="middle" '
+            f'transform="rotate(-90 20 {ly:.1f})">{escape(ylabel)}</text>'
+        )
+    if legend:
+        lx, ly = left + plot_w - 170, top + 12
+        out.append(f'<rect x="{lx}" y="{ly}" width="160" height="{22 * n_series + 8}" fill="white" stroke="#cccccc"/>')
+        for s, (label, _, colors) in enumerate(series):
+            y = ly + 10 + 22 * s
+            out.append(f'<rect x="{lx + 10}" y="{y}" width="22" height="12" fill="{colors[0]}"/>')
+            out.append(f'<text x="{lx + 40}" y="{y + 11}" font-size="13">{escape(label)}</text>')
+    out.append("</svg>")
+
+    Path(output_path).write_text("\n".join(out), encoding="utf-8")
+    console.print(f"[green]Chart saved:[/green] {output_path}")
+    return output_path
+
 
 # ─────────────────────────────────────────────
 # CHART: ROLE DEMAND BAR CHART
 # ─────────────────────────────────────────────
+# Each chart is a _draw_* core that draws into a given Axes, and a chart_*
+# wrapper that makes the figure and saves it; generate_dashboard reuses the cores.
+
+def _role_demand_rows(role_stats: List[Dict]):
+    """(categories, us, india, other counts) sorted by total, descending; ties keep input order."""
+    counts = np.array([
+        (s.get("total_count", 0), s.get("us_count", 0), s.get("india_count", 0), s.get("other_count", 0))
+        for s in role_stats
+    ])
+    order = np.argsort(-counts[:, 0], kind="stable")
+    counts = counts[order]
+    categories = [role_stats[i]["category"] for i in order]
+    return categories, counts[:, 1], counts[:, 2], counts[:, 3]
+
+
+def _draw_role_demand(ax, role_stats: List[Dict]) -> None:
+    _, mticker = _setup_matplotlib()
+    categories, us_counts, india_counts, other_counts = _role_demand_rows(role_stats)
+    x = np.arange(len(categories))
+    width = 0.27
+
+    # Limits come straight from the counts (matching autoscale's 5% margins, bars
+    # sitting on 0) instead of an autoscale pass over every bar
+    ax.set_autoscale_on(False)
+    x_lo, x_hi = -1.5 * width, len(categories) - 1 + 1.5 * width
+    x_pad = 0.05 * (x_hi - x_lo)
+    ax.set_xlim(x_lo - x_pad, x_hi + x_pad)
+    ymax = max(us_counts.max(initial=0), india_counts.max(initial=0), other_counts.max(initial=0))
+    ax.set_ylim(0, ymax * 1.05 if ymax > 0 else 1)
+
+    bars1 = ax.bar(x - width, us_counts, width, label="United States", color=_solid(COLORS["us"], 0.9))
+    bars2 = ax.bar(x, india_counts, width, label="India", color=_solid(COLORS["india"], 0.9))
+    bars3 = ax.bar(x + width, other_counts, width, label="Other", color=_solid(COLORS["other"], 0.9))
+
+    ax.set_xlabel("Role Category")
+    ax.set_ylabel("Number of Job Postings")
+    ax.set_title("Tech Role Demand by Category and Region")
+    ax.set_xticks(x)
+    ax.set_xticklabels(categories, rotation=35, ha="right", fontsize=10)
+    ax.legend(framealpha=0.9)
+    ax.yaxis.set_major_formatter(mticker.FuncFormatter(lambda v, _: f"{int(v):,}"))
+
+    # Add value labels on top of bars (empty bars stay unlabelled)
+    for bars, counts in ((bars1, us_counts), (bars2, india_counts), (bars3, other_counts)):
+        ax.bar_label(bars, labels=[f"{int(c):,}" if c > 0 else "" for c in counts], padding=3, fontsize=8)
+
 
 def chart_role_demand(
     role_stats: List[Dict],
     output_dir: str,
     filename: str = "role_demand.png",
+    fig=None,
 ) -> Optional[str]:
     """Bar chart showing total job counts per role category."""
-    plt, mticker = _setup_matplotlib()
-
     if not role_stats:
         console.print("[yellow]No role stats for chart[/yellow]")
         return None
 
-    # Sort by total count descending
-    sorted_stats = sorted(role_stats, key=lambda x: x.get("total_count", 0), reverse=True)
-    categories = [s["category"] for s in sorted_stats]
-    us_counts = [s.get("us_count", 0) for s in sorted_stats]
-    india_counts = [s.get("india_count", 0) for s in sorted_stats]
-    other_counts = [s.get("other_count", 0) for s in sorted_stats]
+    if filename.endswith(".svg"):
+        categories, us_counts, india_counts, other_counts = _role_demand_rows(role_stats)
+        n = len(categories)
+        return _emit_bar_svg(
+            categories,
+            [("United States", us_counts, [COLORS["us"]] * n),
+             ("India", india_counts, [COLORS["india"]] * n),
+             ("Other", other_counts, [COLORS["other"]] * n)],
+            os.path.join(output_dir, filename),
+            title="Tech Role Demand by Category and Region",
+            xlabel="Role Category", ylabel="Number of Job Postings",
+            rotate_labels=True, legend=True, label_size=9,
+        )
 
-    x = range(len(categories))
-    width = 0.27
+    fig, ax = _chart_axes((14, 7), fig)
+    _draw_role_demand(ax, role_stats)
+    return _save_chart(fig, output_dir, filename)
 
-    fig, ax = plt.subplots(figsize=(14, 7))
 
-    bars1 = ax.bar([i - width for i in x], us_counts, width, label="United States", color=COLORS["us"], alpha=0.9)
-    bars2 = ax.bar(x, india_counts, width, label="India", color=COLORS["india"], alpha=0.9)
-    bars3 = ax.bar([i + width for i in x], other_counts, width, label="Other", color=COLORS["other"], alpha=0.9)
+# ─────────────────────────────────────────────
+# CHART: TOP SKILLS
+# ─────────────────────────────────────────────
 
-    ax.set_xlabel("Role Category", fontsize=12)
-    ax.set_ylabel("Number of Job Postings", fontsize=12)
-    ax.set_title("Tech Role Demand by Category and Region", fontsize=14, fontweight="bold")
-    ax.set_xticks(list(x))
-    ax.set_xticklabels(categories, rotation=35, ha="right", fontsize=10)
-    ax.legend(framealpha=0.9)
-    ax.yaxis.set_major_formatter(mticker.FuncFormatter(lambda v, _: f"{int(v):,}"))
+def _draw_top_skills(ax, skills: List[Dict], top_n: int = 20) -> None:
+    _, mticker = _setup_matplotlib()
 
-    # Add value labels on top of bars
-    for bars in [bars1, bars2, bars3]:
-        for bar in bars:
-            height = bar.get_height()
-            if height > 0:
-                ax.annotate(
-                    f"{int(height):,}",
-                    xy=(bar.get_x() + bar.get_width() / 2, height),
-                    xytext=(0, 3),
-                    textcoords="offset points",
-                    ha="center", va="bottom",
-                    fontsize=8,
-                )
+    # Highest counts regardless of input order; ties keep their input order
+    top = nlargest(top_n, skills, key=itemgetter("count"))
+    skill_names = [s["skill"] for s in reversed(top)]
+    counts = [s["count"] for s in reversed(top)]
 
-    fig.tight_layout()
-    output_path = os.path.join(output_dir, filename)
-    fig.savefig(output_path, bbox_inches="tight")
-    plt.close(fig)
-    console.print(f"[green]Chart saved:[/green] {output_path}")
-    return output_path
+    colors = _PALETTE[np.arange(len(skill_names)) % len(_PALETTE)].tolist()
+    bars = ax.barh(skill_names, counts, color=[_solid(c, 0.88) for c in colors])
+
+    ax.set_xlabel("Number of Mentions")
+    ax.set_title(f"Top {top_n} In-Demand Tech Skills")
+    ax.xaxis.set_major_formatter(mticker.FuncFormatter(lambda v, _: f"{int(v):,}"))
 
+    ax.bar_label(bars, labels=[f"{c:,}" for c in counts], padding=3, fontsize=9)
 
-# ─────────────────────────────────────────────
-# CHART: TOP SKILLS
-# ─────────────────────────────────────────────
 
 def chart_top_skills(
     skills: List[Dict],
     output_dir: str,
     top_n: int = 20,
     filename: str = "top_skills.png",
+    fig=None,
 ) -> Optional[str]:
     """Horizontal bar chart for top N skills by frequency."""
-    plt, mticker = _setup_matplotlib()
-
     if not skills:
         return None
 
-    top = skills[:top_n]
-    skill_names = [s["skill"] for s in reversed(top)]
-    counts = [s["count"] for s in reversed(top)]
-
-    fig, ax = plt.subplots(figsize=(12, 9))
-
-    colors = [COLORS["palette"][i % len(COLORS["palette"])] for i in range(len(skill_names))]
-    bars = ax.barh(skill_names, counts, color=colors, alpha=0.88)
-
-    ax.set_xlabel("Number of Mentions", fontsize=12)
-    ax.set_title(f"Top {top_n} In-Demand Tech Skills", fontsize=14, fontweight="bold")
-    ax.xaxis.set_major_formatter(mticker.FuncFormatter(lambda v, _: f"{int(v):,}"))
-
-    for bar, count in zip(bars, counts):
-        ax.text(
-            bar.get_width() + max(counts) * 0.005,
-            bar.get_y() + bar.get_height() / 2,
-            f"{count:,}",
-            va="center", ha="left",
-            fontsize=9,
-        )
-
-    fig.tight_layout()
-    output_path = os.path.join(output_dir, filename)
-    fig.savefig(output_path, bbox_inches="tight")
-    plt.close(fig)
-    console.print(f"[green]Chart saved:[/green] {output_path}")
-    return output_path
+    fig, ax = _chart_axes((12, 9), fig)
+    _draw_top_skills(ax, skills, top_n)
+    return _save_chart(fig, output_dir, filename)
 
 
 # ─────────────────────────────────────────────
 # CHART: EXPERIENCE LEVEL PIE
 # ─────────────────────────────────────────────
 
-def chart_experience_distribution(
-    distribution: Dict[str, int],
-    output_dir: str,
-    filename: str = "experience_distribution.png",
-) -> Optional[str]:
-    """Pie chart for experience level distribution."""
-    plt, _ = _setup_matplotlib()
-
-    if not distribution:
-        return None
-
+def _draw_experience_distribution(ax, distribution: Dict[str, int]) -> None:
     labels = list(distribution.keys())
     sizes = list(distribution.values())
     colors = COLORS["palette"][:len(labels)]
 
-    fig, ax = plt.subplots(figsize=(9, 7))
     wedges, texts, autotexts = ax.pie(
         sizes,
         labels=labels,
@@ -200,30 +402,29 @@ def chart_experience_distribution(
     for text in autotexts:
         text.set_fontsize(10)
 
-    ax.set_title("Experience Level Distribution", fontsize=14, fontweight="bold")
-    fig.tight_layout()
-    output_path = os.path.join(output_dir, filename)
-    fig.savefig(output_path, bbox_inches="tight")
-    plt.close(fig)
-    console.print(f"[green]Chart saved:[/green] {output_path}")
-    return output_path
-
+    ax.set_title("Experience Level Distribution")
 
-# ─────────────────────────────────────────────
-# CHART: WORK TYPE PIE
-# ─────────────────────────────────────────────
 
-def chart_work_type_distribution(
+def chart_experience_distribution(
     distribution: Dict[str, int],
     output_dir: str,
-    filename: str = "work_type_distribution.png",
+    filename: str = "experience_distribution.png",
+    fig=None,
 ) -> Optional[str]:
-    """Donut chart for remote/hybrid/onsite split."""
-    plt, _ = _setup_matplotlib()
-
+    """Pie chart for experience level distribution."""
     if not distribution:
         return None
 
+    fig, ax = _chart_axes((9, 7), fig)
+    _draw_experience_distribution(ax, distribution)
+    return _save_chart(fig, output_dir, filename)
+
+
+# ─────────────────────────────────────────────
+# CHART: WORK TYPE PIE
+# ─────────────────────────────────────────────
+
+def _draw_work_type_distribution(ax, distribution: Dict[str, int]) -> None:
     labels = list(distribution.keys())
     sizes = list(distribution.values())
     work_colors = {
@@ -234,7 +435,6 @@ def chart_work_type_distribution(
     }
     colors = [work_colors.get(l, "#6B7280") for l in labels]
 
-    fig, ax = plt.subplots(figsize=(8, 7))
     wedges, texts, autotexts = ax.pie(
         sizes,
         labels=labels,
@@ -249,123 +449,128 @@ def chart_work_type_distribution(
         text.set_fontsize(11)
         text.set_fontweight("bold")
 
-    ax.set_title("Work Mode Distribution (Remote / Hybrid / Onsite)", fontsize=13, fontweight="bold")
-    fig.tight_layout()
-    output_path = os.path.join(output_dir, filename)
-    fig.savefig(output_path, bbox_inches="tight")
-    plt.close(fig)
-    console.print(f"[green]Chart saved:[/green] {output_path}")
-    return output_path
+    ax.set_title("Work Mode Distribution (Remote / Hybrid / Onsite)", fontsize=13)
+
+
+def chart_work_type_distribution(
+    distribution: Dict[str, int],
+    output_dir: str,
+    filename: str = "work_type_distribution.png",
+    fig=None,
+) -> Optional[str]:
+    """Donut chart for remote/hybrid/onsite split."""
+    if not distribution:
+        return None
+
+    fig, ax = _chart_axes((8, 7), fig)
+    _draw_work_type_distribution(ax, distribution)
+    return _save_chart(fig, output_dir, filename)
 
 
 # ─────────────────────────────────────────────
 # CHART: QUARTERLY TREND LINE
 # ─────────────────────────────────────────────
 
+def _draw_quarterly_trends(ax, trends: List[Dict]) -> None:
+    # Dense category × quarter matrix (categories in first-seen order; a repeated
+    # (category, quarter) pair keeps its last count, missing pairs are 0).
+    # pd.factorize encodes both key columns in its C hash table.
+    cat_codes, category_names = pd.factorize(
+        np.array([t.get("category") or "All" for t in trends], dtype=object)
+    )
+    quarter_codes, sorted_quarters = pd.factorize(
+        np.array([t.get("quarter", "") for t in trends], dtype=object), sort=True
+    )
+    category_names, sorted_quarters = list(category_names), list(sorted_quarters)
+    matrix = place_pairs(
+        cat_codes.astype(np.int64),
+        quarter_codes.astype(np.int64),
+        np.array([t.get("count", 0) for t in trends], dtype=np.float64),
+        len(category_names), len(sorted_quarters),
+    )
+
+    # Limits from the matrix with autoscale's 5% margins; the fills reach down to 0
+    ax.set_autoscale_on(False)
+    y_lo, y_hi = min(matrix.min(), 0.0), matrix.max()
+    y_pad = 0.05 * (y_hi - y_lo) or 0.5
+    x_pad = 0.05 * (len(sorted_quarters) - 1) or 0.5
+
+    colors = _PALETTE[np.arange(len(category_names)) % len(_PALETTE)].tolist()
+    for category, y_vals, color in zip(category_names, matrix, colors):
+        ax.plot(sorted_quarters, y_vals, marker="o", linewidth=2, label=category, color=color)
+        ax.fill_between(sorted_quarters, y_vals, color=_solid(color, 0.08))
+    ax.set_xlim(-x_pad, len(sorted_quarters) - 1 + x_pad)
+    ax.set_ylim(y_lo - y_pad, y_hi + y_pad)
+
+    ax.set_xlabel("Quarter")
+    ax.set_ylabel("Job Postings")
+    ax.set_title("Quarterly Job Posting Trends (Last 24 Months)")
+    ax.tick_params(axis="x", rotation=45)
+    ax.legend(bbox_to_anchor=(1.01, 1), loc="upper left", fontsize=9)
+
+
 def chart_quarterly_trends(
     trends: List[Dict],
     output_dir: str,
     filename: str = "quarterly_trends.png",
+    fig=None,
 ) -> Optional[str]:
     """Line chart for quarterly job posting trends."""
-    plt, _ = _setup_matplotlib()
-
     if not trends:
         return None
 
-    # Group by category
-    from collections import defaultdict
+    fig, ax = _chart_axes((14, 7), fig)
+    _draw_quarterly_trends(ax, trends)
+    return _save_chart(fig, output_dir, filename)
 
-    by_category: Dict[str, Dict[str, int]] = defaultdict(dict)
-    all_quarters: set = set()
 
-    for t in trends:
-        cat = t.get("category") or "All"
-        quarter = t.get("quarter", "")
-        count = t.get("count", 0)
-        by_category[cat][quarter] = count
-        all_quarters.add(quarter)
+# ─────────────────────────────────────────────
+# CHART: REGION SPLIT
+# ─────────────────────────────────────────────
 
-    sorted_quarters = sorted(all_quarters)
-    if not sorted_quarters:
-        return None
+_REGIONS = ["United States", "India", "Other"]
+_REGION_COLORS = [COLORS["us"], COLORS["india"], COLORS["other"]]
 
-    fig, ax = plt.subplots(figsize=(14, 7))
 
-    for i, (category, quarter_data) in enumerate(by_category.items()):
-        y_vals = [quarter_data.get(q, 0) for q in sorted_quarters]
-        color = COLORS["palette"][i % len(COLORS["palette"])]
-        ax.plot(sorted_quarters, y_vals, marker="o", linewidth=2, label=category, color=color)
-        ax.fill_between(sorted_quarters, y_vals, alpha=0.08, color=color)
+def _draw_region_split(ax, us: int, india: int, other: int) -> None:
+    _, mticker = _setup_matplotlib()
+    counts = [us, india, other]
 
-    ax.set_xlabel("Quarter", fontsize=12)
-    ax.set_ylabel("Job Postings", fontsize=12)
-    ax.set_title("Quarterly Job Posting Trends (Last 24 Months)", fontsize=14, fontweight="bold")
-    ax.tick_params(axis="x", rotation=45)
-    ax.legend(bbox_to_anchor=(1.01, 1), loc="upper left", fontsize=9)
-    fig.tight_layout()
-    output_path = os.path.join(output_dir, filename)
-    fig.savefig(output_path, bbox_inches="tight")
-    plt.close(fig)
-    console.print(f"[green]Chart saved:[/green] {output_path}")
-    return output_path
+    bars = ax.bar(_REGIONS, counts, color=[_solid(c, 0.9) for c in _REGION_COLORS], width=0.5)
 
+    ax.set_ylabel("Job Postings")
+    ax.set_title("Job Distribution by Region")
+    ax.yaxis.set_major_formatter(mticker.FuncFormatter(lambda v, _: f"{int(v):,}"))
+
+    ax.bar_label(bars, labels=[f"{c:,}" for c in counts], padding=3, fontsize=12, fontweight="bold")
 
-# ─────────────────────────────────────────────
-# CHART: REGION SPLIT
-# ─────────────────────────────────────────────
 
 def chart_region_split(
     us: int, india: int, other: int,
     output_dir: str,
     filename: str = "region_split.png",
+    fig=None,
 ) -> Optional[str]:
     """Bar chart for US vs India vs Other region split."""
-    plt, mticker = _setup_matplotlib()
-
-    regions = ["United States", "India", "Other"]
-    counts = [us, india, other]
-    colors = [COLORS["us"], COLORS["india"], COLORS["other"]]
-
-    fig, ax = plt.subplots(figsize=(8, 5))
-    bars = ax.bar(regions, counts, color=colors, alpha=0.9, width=0.5)
-
-    ax.set_ylabel("Job Postings", fontsize=12)
-    ax.set_title("Job Distribution by Region", fontsize=14, fontweight="bold")
-    ax.yaxis.set_major_formatter(mticker.FuncFormatter(lambda v, _: f"{int(v):,}"))
-
-    for bar, count in zip(bars, counts):
-        ax.text(
-            bar.get_x() + bar.get_width() / 2,
-            bar.get_height() + max(counts) * 0.01,
-            f"{count:,}",
-            ha="center", va="bottom",
-            fontsize=12, fontweight="bold",
+    if filename.endswith(".svg"):
+        return _emit_bar_svg(
+            _REGIONS, [("Job Postings", [us, india, other], _REGION_COLORS)],
+            os.path.join(output_dir, filename),
+            title="Job Distribution by Region", ylabel="Job Postings",
+            size=(700, 440), label_size=14,
         )
 
-    fig.tight_layout()
-    output_path = os.path.join(output_dir, filename)
-    fig.savefig(output_path, bbox_inches="tight")
-    plt.close(fig)
-    console.print(f"[green]Chart saved:[/green] {output_path}")
-    return output_path
+    fig, ax = _chart_axes((8, 5), fig)
+    _draw_region_split(ax, us, india, other)
+    return _save_chart(fig, output_dir, filename)
 
 
 # ─────────────────────────────────────────────
 # CHART: AI/ML MENTION RATE BY ROLE
 # ─────────────────────────────────────────────
 
-def chart_ai_mention_by_role(
-    ai_mention_by_role: Dict[str, float],
-    output_dir: str,
-    filename: str = "ai_mention_by_role.png",
-) -> Optional[str]:
-    """Horizontal bar chart showing % of jobs mentioning AI/ML keywords per role category."""
-    plt, mticker = _setup_matplotlib()
-
-    if not ai_mention_by_role:
-        console.print("[yellow]No AI mention data for chart[/yellow]")
-        return None
+def _draw_ai_mention_by_role(ax, ai_mention_by_role: Dict[str, float]) -> None:
+    _, mticker = _setup_matplotlib()
 
     # Sort by % descending
     sorted_data = sorted(ai_mention_by_role.items(), key=lambda x: x[1])
@@ -381,120 +586,210 @@ def chart_ai_mention_by_role(
         for p in pcts
     ]
 
-    fig, ax = plt.subplots(figsize=(12, max(6, len(roles) * 0.55)))
-
-    bars = ax.barh(roles, pcts, color=bar_colors, alpha=0.88, height=0.65)
+    bars = ax.barh(roles, pcts, color=[_solid(c, 0.88) for c in bar_colors], height=0.65)
 
-    ax.set_xlabel("% of Job Postings Mentioning AI/ML", fontsize=12)
+    ax.set_xlabel("% of Job Postings Mentioning AI/ML")
     ax.set_title(
         "🤖 AI/ML Knowledge Expected by Role\n"
         "(% of JDs mentioning AI, ML, LLM, GenAI, RAG, Agents, Embeddings, etc.)",
-        fontsize=13, fontweight="bold", pad=14,
+        fontsize=13, pad=14,
     )
     ax.set_xlim(0, min(max_pct * 1.18, 100))
     ax.xaxis.set_major_formatter(mticker.FuncFormatter(lambda v, _: f"{v:.0f}%"))
 
     # Value labels at end of each bar
-    for bar, pct in zip(bars, pcts):
-        ax.text(
-            bar.get_width() + max_pct * 0.012,
-            bar.get_y() + bar.get_height() / 2,
-            f"{pct:.1f}%",
-            va="center", ha="left",
-            fontsize=9, fontweight="bold",
-        )
+    ax.bar_label(bars, labels=[f"{p:.1f}%" for p in pcts], padding=3, fontsize=9, fontweight="bold")
 
     # Reference line at 50%
     if max_pct > 50:
         ax.axvline(50, color="#DC2626", linewidth=0.8, linestyle="--", alpha=0.5, label="50% mark")
         ax.legend(fontsize=9)
 
+
+def chart_ai_mention_by_role(
+    ai_mention_by_role: Dict[str, float],
+    output_dir: str,
+    filename: str = "ai_mention_by_role.png",
+    fig=None,
+) -> Optional[str]:
+    """Horizontal bar chart showing % of jobs mentioning AI/ML keywords per role category."""
+    if not ai_mention_by_role:
+        console.print("[yellow]No AI mention data for chart[/yellow]")
+        return None
+
+    fig, ax = _chart_axes((12, max(6, len(ai_mention_by_role) * 0.55)), fig)
+    _draw_ai_mention_by_role(ax, ai_mention_by_role)
+    return _save_chart(fig, output_dir, filename)
+
+
+# ─────────────────────────────────────────────
+# DASHBOARD (ALL CHARTS IN ONE FIGURE)
+# ─────────────────────────────────────────────
+
+def generate_dashboard(
+    analysis: dict,
+    output_dir: str,
+    filename: str = "dashboard.png",
+) -> Optional[str]:
+    """
+    Draw every chart into one figure, two per row, saved with a single encode.
+
+    Charts with no data leave their panel blank.
+
+    Args:
+        analysis: AnalysisResult as dict
+        output_dir: Directory to save the dashboard
+        filename: Output file; the extension picks the format
+
+    Returns:
+        Path of the dashboard image
+    """
+    panels = [
+        (_draw_role_demand, (analysis.get("role_stats", []),)),
+        (_draw_top_skills, (analysis.get("top_skills", []),)),
+        (_draw_experience_distribution, (analysis.get("experience_distribution", {}),)),
+        (_draw_work_type_distribution, (analysis.get("work_type_distribution", {}),)),
+        (_draw_quarterly_trends, (analysis.get("quarterly_trends", []),)),
+        (_draw_region_split, (analysis.get("us_jobs", 0), analysis.get("india_jobs", 0), analysis.get("other_jobs", 0))),
+    ]
+    ai_data = analysis.get("ai_mention_by_role", {})
+    if ai_data:
+        panels.append((_draw_ai_mention_by_role, (ai_data,)))
+
+    os.makedirs(output_dir, exist_ok=True)
+    rows = (len(panels) + 1) // 2
+    # Pyplot-free figure: run_report draws this on a thread next to generate_all_charts
+    fig = _reusable_figure()
+    fig.set_size_inches(20, 8 * rows)
+    axes = fig.subplots(rows, 2).ravel()
+
+    for ax, (draw, args) in zip(axes, panels):
+        # The region panel always has counts; every other panel needs data
+        if draw is not _draw_region_split and not args[0]:
+            ax.set_axis_off()
+            continue
+        try:
+            draw(ax, *args)
+        except Exception as e:
+            console.print(f"[red]{draw.__name__[len('_draw_'):]} dashboard panel error: {e}[/red]")
+            ax.clear()
+            ax.set_axis_off()
+    for ax in axes[len(panels):]:
+        ax.set_axis_off()
+
+    # Panels share one canvas, so lay them out to keep titles and tick labels apart
     fig.tight_layout()
-    output_path = os.path.join(output_dir, filename)
-    fig.savefig(output_path, bbox_inches="tight")
-    plt.close(fig)
-    console.print(f"[green]Chart saved:[/green] {output_path}")
-    return output_path
+    return _save_chart(fig, output_dir, filename)
 
 
 # ─────────────────────────────────────────────
 # BATCH CHART GENERATOR
 # ─────────────────────────────────────────────
 
-def generate_all_charts(analysis: dict, output_dir: str) -> List[str]:
+# Below this many charts, starting the worker pool (a forkserver that preloads
+# matplotlib and pandas) costs more than drawing them in-process
+_PARALLEL_MIN_CHARTS = 16
+
+
+def generate_all_charts(
+    analysis: dict,
+    output_dir: str,
+    fmt: str = "png",
+    max_workers: Optional[int] = None,
+) -> List[str]:
     """
     Generate all charts for the report.
 
+    Charts are drawn in turn on one reused figure. Starting a worker pool
+    costs more than drawing the standard handful of charts, so a process pool
+    is only used when the caller asks for more than one worker, or when
+    max_workers is omitted and there are at least _PARALLEL_MIN_CHARTS charts.
+
     Args:
         analysis: AnalysisResult as dict
         output_dir: Directory to save charts
+        fmt: Image format, one of CHART_FORMATS ("svg" saves faster than
+             rasterizing and compressing a PNG)
+        max_workers: Chart processes to use; 1 draws in-process (the
+                     default below _PARALLEL_MIN_CHARTS charts)
 
     Returns:
         List of generated chart file paths
     """
+    if fmt not in CHART_FORMATS:
+        raise ValueError(f"Unsupported chart format {fmt!r}; expected one of {CHART_FORMATS}")
     os.makedirs(output_dir, exist_ok=True)
-    generated = []
 
-    try:
-        path = chart_role_demand(analysis.get("role_stats", []), output_dir)
-        if path:
-            generated.append(path)
-    except Exception as e:
-        console.print(f"[red]role_demand chart error: {e}[/red]")
+    specs = _chart_specs(analysis, output_dir, fmt)
+    if max_workers is None:
+        max_workers = (os.cpu_count() or 1) if len(specs) >= _PARALLEL_MIN_CHARTS else 1
+    workers = min(max_workers, len(specs))
+    outcomes = _draw_charts_in_processes(specs, workers) if workers > 1 else None
+    if outcomes is None:
+        # One figure and Agg canvas, cleared and resized for each chart
+        fig = _reusable_figure()
+        outcomes = [_draw_chart(func, args, {**kwargs, "fig": fig}) for _, func, args, kwargs in specs]
 
-    try:
-        path = chart_top_skills(analysis.get("top_skills", []), output_dir)
-        if path:
+    generated = []
+    for (label, _, _, _), (path, error) in zip(specs, outcomes):
+        if error is not None:
+            console.print(f"[red]{label} chart error: {error}[/red]")
+        elif path:
             generated.append(path)
-    except Exception as e:
-        console.print(f"[red]top_skills chart error: {e}[/red]")
+    return generated
 
-    try:
-        path = chart_experience_distribution(
-            analysis.get("experience_distribution", {}), output_dir
-        )
-        if path:
-            generated.append(path)
-    except Exception as e:
-        console.print(f"[red]experience chart error: {e}[/red]")
 
-    try:
-        path = chart_work_type_distribution(
-            analysis.get("work_type_distribution", {}), output_dir
-        )
-        if path:
-            generated.append(path)
-    except Exception as e:
-        console.print(f"[red]work_type chart error: {e}[/red]")
+def _chart_specs(analysis: dict, output_dir: str, fmt: str) -> List[Tuple[str, Callable, tuple, dict]]:
+    """(label, chart function, args, kwargs) for every chart, in report order."""
+    specs = [
+        ("role_demand", chart_role_demand,
+         (analysis.get("role_stats", []), output_dir), {"filename": f"role_demand.{fmt}"}),
+        ("top_skills", chart_top_skills,
+         (analysis.get("top_skills", []), output_dir), {"filename": f"top_skills.{fmt}"}),
+        ("experience", chart_experience_distribution,
+         (analysis.get("experience_distribution", {}), output_dir),
+         {"filename": f"experience_distribution.{fmt}"}),
+        ("work_type", chart_work_type_distribution,
+         (analysis.get("work_type_distribution", {}), output_dir),
+         {"filename": f"work_type_distribution.{fmt}"}),
+        ("quarterly_trends", chart_quarterly_trends,
+         (analysis.get("quarterly_trends", []), output_dir), {"filename": f"quarterly_trends.{fmt}"}),
+        ("region_split", chart_region_split,
+         (analysis.get("us_jobs", 0), analysis.get("india_jobs", 0), analysis.get("other_jobs", 0), output_dir),
+         {"filename": f"region_split.{fmt}"}),
+    ]
+    ai_data = analysis.get("ai_mention_by_role", {})
+    if ai_data:
+        specs.append(("ai_mention_by_role", chart_ai_mention_by_role,
+                      (ai_data, output_dir), {"filename": f"ai_mention_by_role.{fmt}"}))
+    return specs
 
-    try:
-        path = chart_quarterly_trends(
-            analysis.get("quarterly_trends", []), output_dir
-        )
-        if path:
-            generated.append(path)
-    except Exception as e:
-        console.print(f"[red]quarterly_trends chart error: {e}[/red]")
 
+def _draw_chart(func: Callable, args: tuple, kwargs: dict) -> Tuple[Optional[str], Optional[str]]:
+    """Draw one chart, returning (path, error message); also the process-pool entry point."""
     try:
-        path = chart_region_split(
-            analysis.get("us_jobs", 0),
-            analysis.get("india_jobs", 0),
-            analysis.get("other_jobs", 0),
-            output_dir,
-        )
-        if path:
-            generated.append(path)
+        return func(*args, **kwargs), None
     except Exception as e:
-        console.print(f"[red]region_split chart error: {e}[/red]")
+        return None, str(e)
 
-    try:
-        ai_data = analysis.get("ai_mention_by_role", {})
-        if ai_data:
-            path = chart_ai_mention_by_role(ai_data, output_dir)
-            if path:
-                generated.append(path)
-    except Exception as e:
-        console.print(f"[red]ai_mention_by_role chart error: {e}[/red]")
 
-    return generated
+# Chart workers come from a forkserver, never fork: the report stage draws
+# charts while its JSON/CSV threads may hold locks
+_POOL_CONTEXT = pool_context("matplotlib.pyplot", "pandas")
+
+
+def _draw_charts_in_processes(
+    specs: List[Tuple[str, Callable, tuple, dict]], workers: int,
+) -> Optional[List[Tuple[Optional[str], Optional[str]]]]:
+    """
+    Draw charts on a ProcessPoolExecutor, returning outcomes in spec order,
+    or None if the pool cannot be used (the caller then draws in-process).
+    Each worker sets up matplotlib itself on its first chart.
+    """
+    try:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=_POOL_CONTEXT) as pool:
+            futures = [pool.submit(_draw_chart, func, args, kwargs) for _, func, args, kwargs in specs]
+            return [future.result() for future in futures]
+    except (BrokenProcessPool, OSError) as e:
+        console.print(f"  [dim]Process pool unavailable ({e}) — drawing charts in-process[/dim]")
+        return None
@@ -0,0 +1,121 @@
+"""
+Shared console for the CLI and every pipeline stage.
+rich (plus pygments, markdown-it, …) is only imported when output goes to a
+terminal; otherwise markup is stripped and lines are printed as plain text.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import sys
+from typing import Any
+
+# Set by redirect_to_stderr(); read from the environment so chart and parser
+# worker processes started later send their output to stderr as well
+_STDERR_ENV = "LINKEDIN_AGENT_CONSOLE_STDERR"
+
+
+def redirect_to_stderr() -> None:
+    """Send all console output (this process and its future workers) to stderr."""
+    os.environ[_STDERR_ENV] = "1"
+    console._backend = None
+
+
+def _stream():
+    return sys.stderr if os.environ.get(_STDERR_ENV) == "1" else sys.stdout
+
+
+class _PlainConsole:
+    """
+    Stand-in for rich's Console when the output stream is not a terminal.
+    Plain strings are printed with their markup tags stripped; any rich
+    renderable (Panel, Table, …) is handed to a real Console created on first use.
+    """
+
+    _MARKUP_TAG = re.compile(r"\[/?[a-z#@][^\[\]]*\]")
+
+    def __init__(self, file) -> None:
+        self.file = file
+        self._rich = None
+
+    @property
+    def is_terminal(self) -> bool:
+        return False
+
+    def print(self, *objects: Any, sep: str = " ", end: str = "\n", **kwargs: Any) -> None:
+        if all(isinstance(obj, str) for obj in objects):
+            print(*(self._MARKUP_TAG.sub("", obj) for obj in objects), sep=sep, end=end, file=self.file)
+            return
+        if self._rich is None:
+            from rich.console import Console
+            self._rich = Console(file=self.file)
+        self._rich.print(*objects, sep=sep, end=end, **kwargs)
+
+    def rule(self, title: str = "", **kwargs: Any) -> None:
+        title = self._MARKUP_TAG.sub("", title)
+        print(f"── {title} ──" if title else "─" * 40, file=self.file)
+
+
+class _SharedConsole:
+    """
+    Process-wide console proxy. The backend (rich or plain) is picked on first
+    use from the current output stream, so modules can bind it at import time.
+    """
+
+    def __init__(self) -> None:
+        self._backend = None
+
+    def _get(self):
+        if self._backend is None:
+            stream = _stream()
+            forced = os.getenv("RICH_FORCE_TERMINAL") == "1"
+            if forced or stream.isatty():
+                from rich.console import Console
+                self._backend = Console(stderr=stream is sys.stderr, force_terminal=forced or None)
+            else:
+                self._backend = _PlainConsole(stream)
+        return self._backend
+
+    @property
+    def is_terminal(self) -> bool:
+        return self._get().is_terminal
+
+    def print(self, *objects: Any, **kwargs: Any) -> None:
+        self._get().print(*objects, **kwargs)
+
+    def rule(self, title: str = "", **kwargs: Any) -> None:
+        self._get().rule(title, **kwargs)
+
+
+class _NullProgress:
+    """Progress stand-in for non-terminal output: tracks nothing, prints nothing."""
+
+    def __enter__(self) -> "_NullProgress":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        return None
+
+    def add_task(self, description: str, **kwargs: Any) -> int:
+        return 0
+
+    def update(self, task_id: int, **kwargs: Any) -> None:
+        return None
+
+
+def spinner_progress():
+    """Spinner + description + elapsed-time progress on a terminal, else a no-op."""
+    if not console.is_terminal:
+        return _NullProgress()
+    from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
+
+    return Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        TimeElapsedColumn(),
+        console=console._get(),
+    )
+
+
+console = _SharedConsole()
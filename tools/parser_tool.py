@@ -1,18 +1,37 @@
 """
 HTML parsing utilities for extracting structured job data from LinkedIn pages.
-Uses BeautifulSoup with lxml for fast, reliable parsing.
+Uses lxml with XPath expressions compiled once at import.
 """
 
 from __future__ import annotations
 
+import json
 import re
+import sys
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, TypeVar, Union
 from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup, Tag
+import orjson
 from dateutil.parser import parse as parse_date
-from rich.console import Console
+from lxml import etree
+from lxml import html as lxml_html
+
+try:
+    import ahocorasick
+except ImportError:  # optional accelerator; skills are matched by regex instead
+    ahocorasick = None
+
+try:
+    import hyperscan
+except ImportError:  # optional accelerator (x86-64 builds only)
+    hyperscan = None
+
+try:
+    import ciso8601
+except ImportError:  # optional accelerator; the stdlib ISO parser is used instead
+    ciso8601 = None
 
 from models.job_schema import (
     EmploymentType,
@@ -22,8 +41,15 @@ from models.job_schema import (
     RoleCategory,
     WorkType,
 )
+from models.job_schema_fast import JobPostingFast
+from tools.console import console
+
 
-console = Console()
+# Strict ISO-8601 parser for <time datetime> / JSON-LD datePosted values
+_parse_iso = ciso8601.parse_datetime if ciso8601 is not None else datetime.fromisoformat
+
+# deduplicate_jobs works on either model — it only reads job_id/title/company_name
+JobLike = TypeVar("JobLike", JobPosting, JobPostingFast)
 
 # ─────────────────────────────────────────────
 # SKILL TAXONOMY
@@ -64,6 +90,61 @@ SKILL_KEYWORDS = {
 
 SKILL_PATTERNS = {s.lower(): s for s in SKILL_KEYWORDS}
 
+# Compiled once at import: (lowercase skill, word-bounded regex, canonical name)
+_SKILL_MATCHERS = [
+    (skill_lower, re.compile(r"\b" + re.escape(skill_lower) + r"\b"), skill_canonical)
+    for skill_lower, skill_canonical in SKILL_PATTERNS.items()
+]
+
+# Every skill in one alternation, longest first so "react.js" wins over "react".
+# The zero-width lookahead lets a match start at every position, so overlapping
+# skills ("api design" / "design patterns") are all found in a single scan.
+_SKILLS_RE = re.compile(
+    r"(?=\b("
+    + "|".join(sorted(map(re.escape, SKILL_PATTERNS), key=len, reverse=True))
+    + r")\b)"
+)
+
+# Aho-Corasick automaton over every skill, when pyahocorasick is installed: one
+# pass per text reports all (overlapping) skill occurrences, however many skills
+# there are. Values are (skill length, canonical name).
+if ahocorasick is not None:
+    _SKILL_AUTOMATON = ahocorasick.Automaton()
+    for _skill_lower, _skill_canonical in SKILL_PATTERNS.items():
+        _SKILL_AUTOMATON.add_word(_skill_lower, (len(_skill_lower), _skill_canonical))
+    _SKILL_AUTOMATON.make_automaton()
+else:
+    _SKILL_AUTOMATON = None
+
+# Hyperscan database of the word-bounded skill patterns, when hyperscan is
+# installed: a SIMD multi-pattern scan over the UTF-8 text, preferred over the
+# automaton. Pattern ids index _SKILL_NAMES; each skill is reported once.
+_SKILL_NAMES = list(SKILL_PATTERNS.values())
+if hyperscan is not None:
+    _SKILL_HS_DB = hyperscan.Database()
+    _SKILL_HS_DB.compile(
+        expressions=[(r"\b" + re.escape(s) + r"\b").encode() for s in SKILL_PATTERNS],
+        ids=list(range(len(SKILL_PATTERNS))),
+        elements=len(SKILL_PATTERNS),
+        flags=[hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP | hyperscan.HS_FLAG_SINGLEMATCH]
+        * len(SKILL_PATTERNS),
+    )
+else:
+    _SKILL_HS_DB = None
+
+# Shorter skills a longer skill match also contains ("react.js" → "react"),
+# since the alternation reports only the longest skill at each position
+_SKILL_IMPLIES: Dict[str, Tuple[str, ...]] = {
+    skill_lower: tuple(
+        other_canonical
+        for other_lower, pattern, other_canonical in _SKILL_MATCHERS
+        if other_lower != skill_lower and pattern.search(skill_lower)
+    )
+    for skill_lower in SKILL_PATTERNS
+}
+# Titles and other short strings repeat a lot; long descriptions are not cached
+_SKILL_CACHE_MAX_LEN = 256
+
 # ─────────────────────────────────────────────
 # AI/ML MENTION DETECTION
 # ─────────────────────────────────────────────
@@ -226,45 +307,111 @@ EXPERIENCE_KEYWORDS: Dict[ExperienceLevel, List[str]] = {
 # REGION MAPPING
 # ─────────────────────────────────────────────
 
-US_SIGNALS = {"united states", "usa", "u.s.", "u.s.a", "us", "california", "new york",
+US_SIGNALS = frozenset({"united states", "usa", "u.s.", "u.s.a", "us", "california", "new york",
               "texas", "washington", "seattle", "san francisco", "new york city",
-              "chicago", "boston", "austin", "remote us"}
+              "chicago", "boston", "austin", "remote us"})
 
-INDIA_SIGNALS = {"india", "bengaluru", "bangalore", "mumbai", "hyderabad",
+INDIA_SIGNALS = frozenset({"india", "bengaluru", "bangalore", "mumbai", "hyderabad",
                  "chennai", "pune", "delhi", "ncr", "noida", "gurgaon",
-                 "gurugram", "kolkata", "ahmedabad", "remote india"}
+                 "gurugram", "kolkata", "ahmedabad", "remote india"})
 
 
 # ─────────────────────────────────────────────
 # LINKEDIN HTML PARSERS
 # ─────────────────────────────────────────────
 
-def parse_linkedin_job_cards(html: str, query: str, location: str) -> List[JobPosting]:
+def _has_class(name: str) -> str:
+    """XPath predicate body matching a CSS class selector (.name)."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+def _first(path: str) -> etree.XPath:
+    """Compiled XPath for the first descendant matching path, like CSS select_one."""
+    return etree.XPath(f"descendant::{path}[1]")
+
+
+# Pages are UTF-8 (str input is encoded first); builds lxml.html elements.
+# Only elements, attributes and text are read, so comments and processing
+# instructions are dropped while parsing and no id lookup table is built.
+_HTML_PARSER = lxml_html.HTMLParser(
+    encoding="utf-8", remove_comments=True, remove_pis=True, collect_ids=False,
+)
+
+# LinkedIn public jobs list card selectors (may vary over time), tried in turn
+_XP_CARDS = [
+    etree.XPath(f"//li[{_has_class('jobs-search__results-list')}]/*[{_has_class('job-search-card')}]"),  # older
+    etree.XPath(f"//ul[{_has_class('jobs-search__results-list')}]//li"),  # alt
+    etree.XPath(f"//*[{_has_class('base-card')}]"),                       # generic base card
+    etree.XPath("//li[@data-occludable-job-id]"),                         # newer format
+    etree.XPath(f"//*[{_has_class('job-search-card')}]"),
+]
+_XP_JSON_LD = etree.XPath("//script[@type='application/ld+json']")
+
+# Per-card field lookups; each list is a fallback chain tried in order
+_XP_TITLE = [
+    _first(f"h3[{_has_class('base-search-card__title')}]"),
+    _first(f"*[{_has_class('job-search-card__title')}]"),
+    _first("h3"),
+    _first("*[contains(@class, 'title')]"),
+]
+_XP_COMPANY = [
+    _first(f"h4[{_has_class('base-search-card__subtitle')}]"),
+    _first("a[@data-tracking-control-name='public_jobs_jserp-result_job-search-card-subtitle']"),
+    _first(f"*[{_has_class('job-search-card__company-name')}]"),
+    _first("h4"),
+]
+_XP_LOCATION = [
+    _first(f"*[{_has_class('job-search-card__location')}]"),
+    _first(f"span[{_has_class('job-result-card__location')}]"),
+    _first("*[contains(@class, 'location')]"),
+]
+_XP_DATE = [
+    _first("time"),
+    _first("*[contains(@class, 'date')]"),
+    _first("*[contains(@class, 'time')]"),
+]
+_XP_LINK = [
+    _first("a[contains(@href, '/jobs/view/')]"),
+    _first("a[@href]"),
+]
+
+
+def _select_one(card: etree._Element, chain: List[etree.XPath]) -> Optional[etree._Element]:
+    for xpath in chain:
+        found = xpath(card)
+        if found:
+            return found[0]
+    return None
+
+
+def parse_linkedin_job_cards(
+    html: Union[str, bytes],
+    query: str,
+    location: str,
+    now: Optional[datetime] = None,
+) -> List[JobPostingFast]:
     """
-    Parse LinkedIn job search results page HTML into JobPosting objects.
+    Parse LinkedIn job search results page HTML into JobPostingFast objects.
     Handles both the public listing page format.
+    Relative posting dates are resolved against now (default: the current UTC time).
     """
-    soup = BeautifulSoup(html, "lxml")
+    now = now or datetime.utcnow()
+    if isinstance(html, str):
+        html = html.encode("utf-8")
+    root = etree.HTML(html, _HTML_PARSER)
+    if root is None:  # empty document
+        root = _HTML_PARSER.makeelement("html")
     jobs = []
 
-    # LinkedIn public jobs list selectors (may vary over time)
-    card_selectors = [
-        "li.jobs-search__results-list > .job-search-card",      # older
-        "ul.jobs-search__results-list li",                        # alt
-        ".base-card",                                              # generic base card
-        "li[data-occludable-job-id]",                             # newer format
-        ".job-search-card",
-    ]
-
-    cards: List[Tag] = []
-    for selector in card_selectors:
-        cards = soup.select(selector)
+    cards: List[etree._Element] = []
+    for xpath in _XP_CARDS:
+        cards = xpath(root)
         if cards:
             break
 
     if not cards:
         # Fallback: look for JSON-LD structured data
-        jobs_from_schema = _parse_json_ld(soup, query, location)
+        jobs_from_schema = _parse_json_ld(root, query, location)
         if jobs_from_schema:
             return jobs_from_schema
 
@@ -273,7 +420,7 @@ def parse_linkedin_job_cards(html: str, query: str, location: str) -> List[JobPo
 
     for card in cards:
         try:
-            job = _parse_job_card(card, query, location)
+            job = _parse_job_card(card, query, location, now)
             if job:
                 jobs.append(job)
         except Exception as e:
@@ -283,8 +430,13 @@ def parse_linkedin_job_cards(html: str, query: str, location: str) -> List[JobPo
     return jobs
 
 
-def _parse_job_card(card: Tag, query: str, location: str) -> Optional[JobPosting]:
-    """Parse a single job card Tag into a JobPosting."""
+def _parse_job_card(
+    card: etree._Element,
+    query: str,
+    location: str,
+    now: Optional[datetime] = None,
+) -> Optional[JobPostingFast]:
+    """Parse a single job card element into a JobPostingFast."""
 
     # Job ID
     job_id = (
@@ -294,49 +446,31 @@ def _parse_job_card(card: Tag, query: str, location: str) -> Optional[JobPosting
     )
 
     # Title
-    title_tag = (
-        card.select_one("h3.base-search-card__title")
-        or card.select_one(".job-search-card__title")
-        or card.select_one("h3")
-        or card.select_one("[class*='title']")
-    )
-    title = _clean_text(title_tag.get_text() if title_tag else "")
+    title_tag = _select_one(card, _XP_TITLE)
+    title = _clean_text(title_tag.text_content() if title_tag is not None else "")
     if not title:
         return None
 
     # Company
-    company_tag = (
-        card.select_one("h4.base-search-card__subtitle")
-        or card.select_one("a[data-tracking-control-name='public_jobs_jserp-result_job-search-card-subtitle']")
-        or card.select_one(".job-search-card__company-name")
-        or card.select_one("h4")
-    )
-    company = _clean_text(company_tag.get_text() if company_tag else "Unknown Company")
+    company_tag = _select_one(card, _XP_COMPANY)
+    company = _intern(_clean_text(company_tag.text_content() if company_tag is not None else "Unknown Company"))
 
     # Location
-    location_tag = (
-        card.select_one(".job-search-card__location")
-        or card.select_one("span.job-result-card__location")
-        or card.select_one("[class*='location']")
-    )
-    location_raw = _clean_text(location_tag.get_text() if location_tag else location)
+    location_tag = _select_one(card, _XP_LOCATION)
+    location_raw = _intern(_clean_text(location_tag.text_content() if location_tag is not None else location))
 
     # Date
-    date_tag = (
-        card.select_one("time")
-        or card.select_one("[class*='date']")
-        or card.select_one("[class*='time']")
-    )
+    date_tag = _select_one(card, _XP_DATE)
     date_posted_raw = None
     date_posted = None
-    if date_tag:
-        date_posted_raw = date_tag.get("datetime") or _clean_text(date_tag.get_text())
-        date_posted = _parse_relative_date(date_posted_raw)
+    if date_tag is not None:
+        date_posted_raw = _intern(date_tag.get("datetime") or _clean_text(date_tag.text_content()))
+        date_posted = _parse_relative_date(date_posted_raw, now)
 
     # URL
-    link_tag = card.select_one("a[href*='/jobs/view/']") or card.select_one("a[href]")
+    link_tag = _select_one(card, _XP_LINK)
     source_url = ""
-    if link_tag:
+    if link_tag is not None:
         href = link_tag.get("href", "")
         source_url = href if href.startswith("http") else f"https://www.linkedin.com{href}"
 
@@ -348,7 +482,7 @@ def _parse_job_card(card: Tag, query: str, location: str) -> Optional[JobPosting
     category = _classify_role(title)
     employment_type = _detect_employment_type(title)
 
-    return JobPosting(
+    return JobPostingFast(
         job_id=str(job_id) if job_id else None,
         title=title,
         normalized_category=category,
@@ -368,14 +502,20 @@ def _parse_job_card(card: Tag, query: str, location: str) -> Optional[JobPosting
     )
 
 
-def _parse_json_ld(soup: BeautifulSoup, query: str, location: str) -> List[JobPosting]:
+def _parse_json_ld(root: etree._Element, query: str, location: str) -> List[JobPostingFast]:
     """Extract jobs from JSON-LD structured data if available."""
-    import json
-
     jobs = []
-    for script in soup.find_all("script", type="application/ld+json"):
+    for script in _XP_JSON_LD(root):
+        text = script.text or ""
+        # Only a script naming a JobPosting can yield jobs; skip decoding the
+        # WebPage/Organization blobs that make up most JSON-LD
+        if "JobPosting" not in text:
+            continue
         try:
-            data = json.loads(script.string or "")
+            try:
+                data = orjson.loads(text)
+            except orjson.JSONDecodeError:
+                data = json.loads(text)  # NaN, integers past 64 bits, ...
             if isinstance(data, list):
                 for item in data:
                     job = _json_ld_to_job(item, query, location)
@@ -390,8 +530,8 @@ def _parse_json_ld(soup: BeautifulSoup, query: str, location: str) -> List[JobPo
     return jobs
 
 
-def _json_ld_to_job(data: dict, query: str, location: str) -> Optional[JobPosting]:
-    """Convert JSON-LD JobPosting schema to JobPosting model."""
+def _json_ld_to_job(data: dict, query: str, location: str) -> Optional[JobPostingFast]:
+    """Convert JSON-LD JobPosting schema to a JobPostingFast."""
     if data.get("@type") != "JobPosting":
         return None
 
@@ -417,13 +557,10 @@ def _json_ld_to_job(data: dict, query: str, location: str) -> Optional[JobPostin
 
     date_posted = None
     if dp := data.get("datePosted"):
-        try:
-            date_posted = parse_date(dp)
-        except Exception:
-            pass
+        date_posted = _parse_absolute_date(str(dp))
 
-    return JobPosting(
-        title=title,
+    return JobPostingFast(
+        title=str(title),
         company_name=company or "Unknown",
         location_raw=location_raw or location,
         location_country=_infer_country(location_raw or location),
@@ -445,41 +582,148 @@ def extract_skills(text: str) -> List[str]:
     """Extract tech skills from job description text."""
     if not text:
         return []
+    if len(text) <= _SKILL_CACHE_MAX_LEN:
+        return list(_extract_skills_cached(text))
+    return list(_scan_skills(text))
+
+
+@lru_cache(maxsize=4096)
+def _extract_skills_cached(text: str) -> Tuple[str, ...]:
+    return _scan_skills(text)
+
+
+def _scan_skills(text: str) -> Tuple[str, ...]:
+    if _SKILL_HS_DB is not None:
+        return _scan_skills_hyperscan(text.lower())
+    if _SKILL_AUTOMATON is not None:
+        return _scan_skills_automaton(text.lower())
 
-    text_lower = text.lower()
     found = set()
 
-    for skill_lower, skill_canonical in SKILL_PATTERNS.items():
-        # Use word boundaries to avoid false matches
-        pattern = r'\b' + re.escape(skill_lower) + r'\b'
-        if re.search(pattern, text_lower):
+    for skill_lower in set(_SKILLS_RE.findall(text.lower())):
+        found.add(SKILL_PATTERNS[skill_lower])
+        found.update(_SKILL_IMPLIES[skill_lower])
+
+    return tuple(sorted(found))
+
+
+def _scan_skills_hyperscan(text_lower: str) -> Tuple[str, ...]:
+    found: set = set()
+    _SKILL_HS_DB.scan(
+        text_lower.encode("utf-8", "replace"),
+        match_event_handler=_on_skill_match,
+        context=found,
+    )
+    return tuple(sorted(found))
+
+
+def _on_skill_match(pattern_id: int, start: int, end: int, flags: int, found: set) -> None:
+    found.add(_SKILL_NAMES[pattern_id])
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+def _scan_skills_automaton(text_lower: str) -> Tuple[str, ...]:
+    found = set()
+    n = len(text_lower)
+
+    for end, (length, skill_canonical) in _SKILL_AUTOMATON.iter(text_lower):
+        if skill_canonical in found:
+            continue
+        start = end - length + 1
+        # Same word-boundary test as the regex's \b on both ends of the match
+        before = start > 0 and _is_word_char(text_lower[start - 1])
+        after = end + 1 < n and _is_word_char(text_lower[end + 1])
+        if (before != _is_word_char(text_lower[start])
+                and after != _is_word_char(text_lower[end])):
             found.add(skill_canonical)
 
-    return sorted(found)
+    return tuple(sorted(found))
+
+
+def _keyword_automaton(taxonomy: Dict[Any, List[str]]):
+    """
+    Aho-Corasick automaton mapping each keyword to (priority, label), priority
+    being the label's position in taxonomy; None without pyahocorasick.
+    """
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for priority, (label, keywords) in enumerate(taxonomy.items()):
+        for kw in keywords:
+            # A keyword listed under several labels belongs to the first one
+            if kw not in automaton:
+                automaton.add_word(kw, (priority, label))
+    automaton.make_automaton()
+    return automaton
+
+
+def _first_label(automaton, text_lower: str):
+    """Label of the earliest-declared group with a keyword in text_lower, or None."""
+    best = None
+    for _, (priority, label) in automaton.iter(text_lower):
+        if best is None or priority < best[0]:
+            best = (priority, label)
+            if priority == 0:
+                break
+    return best[1] if best else None
+
+
+def _keyword_table(taxonomy: Dict[Any, List[str]]) -> Tuple[Tuple[Any, int, Tuple[str, ...]], ...]:
+    """(label, shortest keyword length, keywords) per label, in taxonomy order."""
+    return tuple(
+        (label, min(map(len, keywords)), tuple(keywords))
+        for label, keywords in taxonomy.items()
+    )
+
+
+# One pass over the text instead of a substring test per keyword
+_ROLE_AC = _keyword_automaton(ROLE_CATEGORY_KEYWORDS)
+_EXP_AC = _keyword_automaton(EXPERIENCE_KEYWORDS)
+# Fallback scan order; labels whose keywords can't fit in the text are skipped
+_ROLE_TABLE = _keyword_table(ROLE_CATEGORY_KEYWORDS)
+_EXP_TABLE = _keyword_table(EXPERIENCE_KEYWORDS)
 
 
 # ─────────────────────────────────────────────
 # CLASSIFICATION HELPERS
 # ─────────────────────────────────────────────
+# Titles, locations and schedule strings repeat across a run, so these pure
+# string → value helpers are memoized (bounded like the skill cache).
 
+@lru_cache(maxsize=4096)
 def _classify_role(title: str) -> RoleCategory:
     title_lower = title.lower()
-    for category, keywords in ROLE_CATEGORY_KEYWORDS.items():
+    if _ROLE_AC is not None:
+        return _first_label(_ROLE_AC, title_lower) or RoleCategory.OTHER
+    n = len(title_lower)
+    for category, min_len, keywords in _ROLE_TABLE:
+        if n < min_len:
+            continue
         for kw in keywords:
             if kw in title_lower:
                 return category
     return RoleCategory.OTHER
 
 
+@lru_cache(maxsize=4096)
 def _detect_experience_level(text: str) -> ExperienceLevel:
     text_lower = text.lower()
-    for level, keywords in EXPERIENCE_KEYWORDS.items():
+    if _EXP_AC is not None:
+        return _first_label(_EXP_AC, text_lower) or ExperienceLevel.NOT_SPECIFIED
+    n = len(text_lower)
+    for level, min_len, keywords in _EXP_TABLE:
+        if n < min_len:
+            continue
         for kw in keywords:
             if kw in text_lower:
                 return level
     return ExperienceLevel.NOT_SPECIFIED
 
 
+@lru_cache(maxsize=4096)
 def _detect_work_type(text: str) -> WorkType:
     text_lower = text.lower()
     if "hybrid" in text_lower:
@@ -491,6 +735,7 @@ def _detect_work_type(text: str) -> WorkType:
     return WorkType.NOT_SPECIFIED
 
 
+@lru_cache(maxsize=4096)
 def _detect_employment_type(text: str) -> EmploymentType:
     text_lower = text.lower()
     if "contract" in text_lower or "contractor" in text_lower:
@@ -502,6 +747,9 @@ def _detect_employment_type(text: str) -> EmploymentType:
     return EmploymentType.FULL_TIME
 
 
+# Jobs share a handful of location strings per search, so region lookups are
+# cached rather than re-scanning every signal for each job
+@lru_cache(maxsize=4096)
 def _detect_region(location_raw: str, search_location: str) -> Region:
     combined = (location_raw + " " + search_location).lower()
     for signal in US_SIGNALS:
@@ -513,6 +761,7 @@ def _detect_region(location_raw: str, search_location: str) -> Region:
     return Region.OTHER
 
 
+@lru_cache(maxsize=4096)
 def _parse_location(location_raw: str) -> Tuple[Optional[str], Optional[str]]:
     """Extract city and country from raw location string."""
     if not location_raw:
@@ -523,6 +772,7 @@ def _parse_location(location_raw: str) -> Tuple[Optional[str], Optional[str]]:
     return city, country
 
 
+@lru_cache(maxsize=4096)
 def _infer_country(location: str) -> Optional[str]:
     loc_lower = location.lower()
     for signal in US_SIGNALS:
@@ -534,89 +784,148 @@ def _infer_country(location: str) -> Optional[str]:
     return None
 
 
-def _parse_relative_date(date_str: Optional[str]) -> Optional[datetime]:
-    """Parse relative or absolute date strings."""
+# (pattern, timedelta keyword, multiplier), tried in this order — the first unit
+# found wins, so "1 day 3 hours ago" still reads as 3 hours
+_REL_DATE_PATTERNS: Tuple[Tuple[re.Pattern, str, int], ...] = (
+    (re.compile(r"(\d+)\s+second"), "seconds", 1),
+    (re.compile(r"(\d+)\s+minute"), "minutes", 1),
+    (re.compile(r"(\d+)\s+hour"), "hours", 1),
+    (re.compile(r"(\d+)\s+day"), "days", 1),
+    (re.compile(r"(\d+)\s+week"), "weeks", 1),
+    (re.compile(r"(\d+)\s+month"), "days", 30),
+    (re.compile(r"(\d+)\s+year"), "days", 365),
+)
+
+
+def _parse_relative_date(date_str: Optional[str], now: Optional[datetime] = None) -> Optional[datetime]:
+    """Parse relative or absolute date strings; relative ones count back from now (default: utcnow)."""
     if not date_str:
         return None
 
-    date_str = date_str.strip().lower()
-    now = datetime.utcnow()
+    parsed = _parse_date_cached(date_str.strip().lower())
+    # Relative dates are cached as offsets and resolved against the reference time
+    if isinstance(parsed, timedelta):
+        return (now or datetime.utcnow()) - parsed
+    return parsed
 
-    # ISO format
-    try:
-        return parse_date(date_str)
-    except Exception:
-        pass
 
-    # Relative: "2 days ago", "1 week ago", etc.
-    patterns = [
-        (r"(\d+)\s+second", lambda m: now - timedelta(seconds=int(m.group(1)))),
-        (r"(\d+)\s+minute", lambda m: now - timedelta(minutes=int(m.group(1)))),
-        (r"(\d+)\s+hour", lambda m: now - timedelta(hours=int(m.group(1)))),
-        (r"(\d+)\s+day", lambda m: now - timedelta(days=int(m.group(1)))),
-        (r"(\d+)\s+week", lambda m: now - timedelta(weeks=int(m.group(1)))),
-        (r"(\d+)\s+month", lambda m: now - timedelta(days=int(m.group(1)) * 30)),
-        (r"(\d+)\s+year", lambda m: now - timedelta(days=int(m.group(1)) * 365)),
-    ]
+@lru_cache(maxsize=4096)
+def _parse_date_cached(date_str: str) -> Union[datetime, timedelta, None]:
+    """Absolute datetime, offset before now for relative dates, or None."""
+    absolute = _parse_absolute_date(date_str)
+    if absolute is not None:
+        return absolute
 
-    for pattern, handler in patterns:
-        m = re.search(pattern, date_str)
+    # Relative: "2 days ago", "1 week ago", etc.
+    now = datetime.utcnow()
+    for pattern, unit, multiplier in _REL_DATE_PATTERNS:
+        m = pattern.search(date_str)
         if m:
             try:
-                return handler(m)
+                offset = timedelta(**{unit: int(m.group(1)) * multiplier})
+                now - offset  # out-of-range offsets fall through to the next unit
+                return offset
             except Exception:
                 pass
 
     if "today" in date_str or "just now" in date_str:
-        return now
+        return timedelta(0)
     if "yesterday" in date_str:
-        return now - timedelta(days=1)
+        return timedelta(days=1)
 
     return None
 
 
+def _parse_absolute_date(date_str: str) -> Optional[datetime]:
+    """ISO-8601 via the fast strict parser; dateutil only for free-form dates."""
+    try:
+        return _parse_iso(date_str)
+    except ValueError:
+        pass
+    try:
+        return parse_date(date_str)
+    except Exception:
+        return None
+
+
+def _intern(text: Optional[str]) -> Optional[str]:
+    """
+    One shared object per distinct value for fields that repeat across jobs
+    (company, location, posted date), instead of a fresh copy per posting.
+    """
+    return sys.intern(text) if type(text) is str else text
+
+
 def _clean_text(text: str) -> str:
     """Strip whitespace and normalize."""
-    return re.sub(r"\s+", " ", text).strip()
+    # str.split() breaks on the same Unicode whitespace as \s (NBSP included)
+    return " ".join(text.split())
 
 
 # ─────────────────────────────────────────────
 # DEDUPLICATION
 # ─────────────────────────────────────────────
 
-def deduplicate_jobs(jobs: List[JobPosting]) -> Tuple[List[JobPosting], int]:
-    """Remove duplicate job postings by job_id, then by title+company."""
-    seen_ids: set = set()
-    seen_title_company: set = set()
-    unique = []
-    dupe_count = 0
-
-    for job in jobs:
-        if job.job_id and job.job_id in seen_ids:
-            dupe_count += 1
-            continue
+class JobDeduplicator:
+    """
+    Running duplicate filter: jobs are checked by job_id, then by title+company,
+    as they are added, so callers can drop duplicates while pages are still
+    being parsed instead of holding every parse until the end.
+    """
+
+    def __init__(self) -> None:
+        # job_ids (str) and title+company keys (tuple) share one set; the two
+        # kinds never compare equal
+        self._seen: set = set()
+        self.unique: list = []
+        self.dupe_count = 0
+
+    def add(self, job: JobLike) -> bool:
+        """Keep job unless it duplicates an earlier one. Returns True if it was kept."""
+        seen = self._seen
+        job_id = job.job_id
+        if job_id and job_id in seen:
+            self.dupe_count += 1
+            return False
 
         key = (job.title.lower().strip(), job.company_name.lower().strip())
-        if key in seen_title_company:
-            dupe_count += 1
-            continue
+        if key in seen:
+            self.dupe_count += 1
+            return False
 
-        if job.job_id:
-            seen_ids.add(job.job_id)
-        seen_title_company.add(key)
-        unique.append(job)
+        if job_id:
+            seen.add(job_id)
+        seen.add(key)
+        self.unique.append(job)
+        return True
 
-    return unique, dupe_count
+    def extend(self, jobs: List[JobLike]) -> None:
+        add = self.add
+        for job in jobs:
+            add(job)
+
+
+def deduplicate_jobs(jobs: List[JobLike]) -> Tuple[List[JobLike], int]:
+    """Remove duplicate job postings by job_id, then by title+company."""
+    dedup = JobDeduplicator()
+    dedup.extend(jobs)
+    return dedup.unique, dedup.dupe_count
 
 
 # ─────────────────────────────────────────────
 # SERPAPI DIRECT JSON PARSER
 # ─────────────────────────────────────────────
 
-def parse_serpapi_json(raw_json: str, query: str, location: str) -> List[JobPosting]:
+def parse_serpapi_json(
+    raw_json: Union[str, bytes],
+    query: str,
+    location: str,
+    now: Optional[datetime] = None,
+) -> List[JobPostingFast]:
     """
-    Parse a SerpAPI google_jobs response JSON array directly into JobPosting objects.
+    Parse a SerpAPI google_jobs response JSON array directly into JobPostingFast objects.
     This bypasses the HTML parser entirely — no LinkedIn card selectors needed.
+    Relative posting dates are resolved against now (default: the current UTC time).
 
     SerpAPI google_jobs result shape:
     [
@@ -637,11 +946,9 @@ def parse_serpapi_json(raw_json: str, query: str, location: str) -> List[JobPost
       ...
     ]
     """
-    import json
-
     try:
-        jobs_data = json.loads(raw_json)
-    except json.JSONDecodeError as e:
+        jobs_data = orjson.loads(raw_json)
+    except orjson.JSONDecodeError as e:
         console.print(f"[red]SerpAPI JSON parse error: {e}[/red]")
         return []
 
@@ -649,11 +956,13 @@ def parse_serpapi_json(raw_json: str, query: str, location: str) -> List[JobPost
         console.print(f"[yellow]SerpAPI data is not a list, got: {type(jobs_data)}[/yellow]")
         return []
 
-    jobs: List[JobPosting] = []
+    jobs: List[JobPostingFast] = []
+    # One reference time for every relative "posted_at" in the response
+    now = now or datetime.utcnow()
 
     for i, item in enumerate(jobs_data):
         try:
-            job = _serpapi_item_to_job(item, query, location, index=i)
+            job = _serpapi_item_to_job(item, query, location, index=i, now=now)
             if job:
                 jobs.append(job)
         except Exception as e:
@@ -668,15 +977,16 @@ def _serpapi_item_to_job(
     query: str,
     location: str,
     index: int = 0,
-) -> Optional[JobPosting]:
-    """Convert a single SerpAPI google_jobs result item to a JobPosting."""
+    now: Optional[datetime] = None,
+) -> Optional[JobPostingFast]:
+    """Convert a single SerpAPI google_jobs result item to a JobPostingFast."""
 
     title = _clean_text(item.get("title", ""))
     if not title:
         return None
 
-    company  = _clean_text(item.get("company_name", "Unknown Company"))
-    loc_raw  = _clean_text(item.get("location", location))
+    company  = _intern(_clean_text(item.get("company_name", "Unknown Company")))
+    loc_raw  = _intern(_clean_text(item.get("location", location)))
     desc     = item.get("description", "")
     job_id   = str(item.get("job_id", f"serpapi_{index}"))
 
@@ -684,7 +994,7 @@ def _serpapi_item_to_job(
     ext           = item.get("detected_extensions", {}) or {}
     schedule_type = ext.get("schedule_type", "")        # e.g. "Full-time"
     work_from_home = ext.get("work_from_home", False)
-    posted_raw    = ext.get("posted_at", "")            # e.g. "3 days ago"
+    posted_raw    = _intern(ext.get("posted_at", ""))   # e.g. "3 days ago"
 
     # ── Source URL ─────────────────────────────────────────────────
     source_url = ""
@@ -694,7 +1004,7 @@ def _serpapi_item_to_job(
             source_url = href
             break
     if not source_url:
-        source_url = item.get("job_apply_link", "")
+        source_url = item.get("job_apply_link") or ""
 
     # ── Derive fields ──────────────────────────────────────────────
     combined_text = f"{title} {loc_raw} {desc} {schedule_type}"
@@ -708,11 +1018,13 @@ def _serpapi_item_to_job(
     category    = _classify_role(title)
     region      = _detect_region(loc_raw, location)
     city, country = _parse_location(loc_raw)
-    date_posted = _parse_relative_date(posted_raw)
-    skills      = extract_skills(desc + " " + title)
-    has_ai, ai_kws = _detect_ai_mentions(title + " " + desc)
+    date_posted = _parse_relative_date(posted_raw, now)
+    # One title+description copy shared by the skill and AI-keyword scans
+    title_desc  = f"{title} {desc}" if desc else title
+    skills      = extract_skills(title_desc)
+    has_ai, ai_kws = _detect_ai_mentions(title_desc)
 
-    return JobPosting(
+    return JobPostingFast(
         job_id=job_id,
         title=title,
         normalized_category=category,